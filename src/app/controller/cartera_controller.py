@@ -0,0 +1,39 @@
+from datetime import date
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from src.config import get_db
+from src.domain.dtos.carteraDto import CarteraAgingPageResponse
+from src.domain.services.cartera_service import CarteraService
+from src.infrastructure.repository.createCarteraRepository import CarteraRepository
+
+router = APIRouter(prefix="/contabilidad/cartera", tags=["contabilidad-cartera"])
+
+
+def get_service(db: Session = Depends(get_db)) -> CarteraService:
+    repo = CarteraRepository(db)
+    return CarteraService(repo)
+
+
+ServiceDep = Annotated[CarteraService, Depends(get_service)]
+
+
+@router.get("/aging", response_model=CarteraAgingPageResponse)
+def get_aging(
+    service: ServiceDep,
+    fecha_corte: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    incluir_movimientos: bool = False,
+) -> CarteraAgingPageResponse:
+    try:
+        return service.get_aging(
+            fecha_corte=fecha_corte,
+            cursor=cursor,
+            limit=limit,
+            incluir_movimientos=incluir_movimientos,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
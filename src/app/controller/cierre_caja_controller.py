@@ -1,12 +1,11 @@
 from datetime import date
 from typing import Annotated, Optional
-from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from src.config import get_db
-from src.domain.dtos.cierreCajaDto import CierreCajaRequest, CierreCajaResponse
+from src.domain.dtos.cierreCajaDto import CalcularCierreCajaRequest, CierreCajaResponse
 from src.domain.dtos.genericResponseDto import CreationResponse
 from src.domain.services.cierre_caja_service import CierreCajaService
 from src.infrastructure.repository.createCierreCajaRepository import CierreCajaRepository
@@ -24,19 +23,20 @@ ServiceDep = Annotated[CierreCajaService, Depends(get_service)]
 
 
 @router.post(
-    "/",
+    "/calcular",
     response_model=CreationResponse[CierreCajaResponse],
     status_code=status.HTTP_201_CREATED,
 )
-def create_cierre(
-    payload: CierreCajaRequest,
+def calcular_cierre(
+    fecha: date,
+    payload: CalcularCierreCajaRequest,
     service: ServiceDep,
 ) -> CreationResponse[CierreCajaResponse]:
     try:
-        created = service.create_cierre(payload)
+        created = service.calcular_cierre(fecha, payload)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    return CreationResponse[CierreCajaResponse](id=created.id, data=created)
+    return CreationResponse[CierreCajaResponse](id=created.cierre_id, data=created)
 
 
 @router.get("/", response_model=list[CierreCajaResponse])
@@ -60,7 +60,7 @@ def get_by_fecha(fecha: date, service: ServiceDep) -> CierreCajaResponse:
 
 
 @router.get("/{cierre_id}", response_model=CierreCajaResponse)
-def get_cierre(cierre_id: UUID, service: ServiceDep) -> CierreCajaResponse:
+def get_cierre(cierre_id: int, service: ServiceDep) -> CierreCajaResponse:
     cierre = service.get_cierre(cierre_id)
     if not cierre:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cierre de caja no encontrado")
@@ -1,13 +1,13 @@
 from datetime import date
 from typing import Annotated, Optional
-from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from src.config import get_db
-from src.domain.dtos.egresoDto import EgresoRequest, EgresoResponse
+from src.domain.dtos.egresoDto import EgresoPageResponse, EgresoRequest, EgresoResponse
 from src.domain.dtos.genericResponseDto import CreationResponse
+from src.domain.dtos.totalContableDto import TotalesContablesResponse
 from src.domain.services.egreso_service import EgresoService
 from src.infrastructure.repository.createEgresoRepository import EgresoRepository
 
@@ -36,22 +36,38 @@ def create_egreso(
         created = service.create_egreso(payload)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    return CreationResponse[EgresoResponse](id=created.id, data=created)
+    return CreationResponse[EgresoResponse](id=created.egreso_id, data=created)
 
 
-@router.get("/", response_model=list[EgresoResponse])
+@router.get("/", response_model=EgresoPageResponse)
 def list_egresos(
     service: ServiceDep,
     desde: Optional[date] = None,
     hasta: Optional[date] = None,
-) -> list[EgresoResponse]:
-    return service.list_egresos(desde=desde, hasta=hasta)
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+) -> EgresoPageResponse:
+    try:
+        return service.list_egresos(desde=desde, hasta=hasta, cursor=cursor, limit=limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get("/totales", response_model=TotalesContablesResponse)
+def get_totales(
+    service: ServiceDep,
+    desde_mes: Optional[date] = None,
+    hasta_mes: Optional[date] = None,
+) -> TotalesContablesResponse:
+    try:
+        return service.get_totales(desde_mes=desde_mes, hasta_mes=hasta_mes)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
 @router.get("/{egreso_id}", response_model=EgresoResponse)
-def get_egreso(egreso_id: UUID, service: ServiceDep) -> EgresoResponse:
+def get_egreso(egreso_id: int, service: ServiceDep) -> EgresoResponse:
     egreso = service.get_egreso(egreso_id)
     if not egreso:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Egreso no encontrado")
     return egreso
-
@@ -0,0 +1,57 @@
+from datetime import date
+from tempfile import SpooledTemporaryFile
+from typing import Annotated, BinaryIO, Iterator
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from src.config import get_db
+from src.domain.services.export_contable_service import ExportContableService
+from src.infrastructure.repository.createExportContableRepository import (
+    ExportContableRepository,
+)
+
+router = APIRouter(prefix="/contabilidad", tags=["contabilidad-export"])
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+# El libro queda en memoria hasta este tamano; por encima pasa a un archivo temporal.
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+CHUNK_BYTES = 64 * 1024
+
+
+def get_service(db: Session = Depends(get_db)) -> ExportContableService:
+    repo = ExportContableRepository(db)
+    return ExportContableService(repo)
+
+
+ServiceDep = Annotated[ExportContableService, Depends(get_service)]
+
+
+def _leer_por_bloques(archivo: BinaryIO) -> Iterator[bytes]:
+    try:
+        while bloque := archivo.read(CHUNK_BYTES):
+            yield bloque
+    finally:
+        archivo.close()
+
+
+@router.get("/export.xlsx")
+def export_xlsx(service: ServiceDep, desde: date, hasta: date) -> StreamingResponse:
+    archivo = SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    try:
+        service.escribir_xlsx(desde, hasta, archivo)
+    except ValueError as exc:
+        archivo.close()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except Exception:
+        archivo.close()
+        raise
+    archivo.seek(0)
+
+    filename = f"contabilidad_{desde.isoformat()}_{hasta.isoformat()}.xlsx"
+    return StreamingResponse(
+        _leer_por_bloques(archivo),
+        media_type=XLSX_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
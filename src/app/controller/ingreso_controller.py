@@ -1,13 +1,13 @@
 from datetime import date
 from typing import Annotated, Optional
-from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from src.config import get_db
+from src.domain.dtos.ingresoDto import IngresoPageResponse, IngresoRequest, IngresoResponse
 from src.domain.dtos.genericResponseDto import CreationResponse
-from src.domain.dtos.ingresoDto import IngresoRequest, IngresoResponse
+from src.domain.dtos.totalContableDto import TotalesContablesResponse
 from src.domain.services.ingreso_service import IngresoService
 from src.infrastructure.repository.createIngresoRepository import IngresoRepository
 
@@ -36,22 +36,38 @@ def create_ingreso(
         created = service.create_ingreso(payload)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    return CreationResponse[IngresoResponse](id=created.id, data=created)
+    return CreationResponse[IngresoResponse](id=created.ingreso_id, data=created)
 
 
-@router.get("/", response_model=list[IngresoResponse])
+@router.get("/", response_model=IngresoPageResponse)
 def list_ingresos(
     service: ServiceDep,
     desde: Optional[date] = None,
     hasta: Optional[date] = None,
-) -> list[IngresoResponse]:
-    return service.list_ingresos(desde=desde, hasta=hasta)
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+) -> IngresoPageResponse:
+    try:
+        return service.list_ingresos(desde=desde, hasta=hasta, cursor=cursor, limit=limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get("/totales", response_model=TotalesContablesResponse)
+def get_totales(
+    service: ServiceDep,
+    desde_mes: Optional[date] = None,
+    hasta_mes: Optional[date] = None,
+) -> TotalesContablesResponse:
+    try:
+        return service.get_totales(desde_mes=desde_mes, hasta_mes=hasta_mes)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
 @router.get("/{ingreso_id}", response_model=IngresoResponse)
-def get_ingreso(ingreso_id: UUID, service: ServiceDep) -> IngresoResponse:
+def get_ingreso(ingreso_id: int, service: ServiceDep) -> IngresoResponse:
     ingreso = service.get_ingreso(ingreso_id)
     if not ingreso:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ingreso no encontrado")
     return ingreso
-
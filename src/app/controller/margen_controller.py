@@ -0,0 +1,34 @@
+from datetime import date
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from src.config import get_db
+from src.domain.dtos.margenDto import MargenAgrupacion, MargenReporteResponse
+from src.domain.services.margen_service import MargenService
+from src.infrastructure.repository.createMargenRepository import MargenRepository
+
+router = APIRouter(prefix="/reportes/margen", tags=["reportes"])
+
+
+def get_service(db: Session = Depends(get_db)) -> MargenService:
+    repo = MargenRepository(db)
+    return MargenService(repo)
+
+
+DbDep = Annotated[Session, Depends(get_db)]
+ServiceDep = Annotated[MargenService, Depends(get_service)]
+
+
+@router.get("/", response_model=MargenReporteResponse)
+def get_reporte_margen(
+    desde: date,
+    hasta: date,
+    service: ServiceDep,
+    agrupar: MargenAgrupacion = MargenAgrupacion.PRODUCTO,
+) -> MargenReporteResponse:
+    try:
+        return service.get_reporte(agrupar, desde, hasta)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
@@ -0,0 +1,99 @@
+from datetime import date
+from io import BytesIO
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from openpyxl import Workbook
+from sqlalchemy.orm import Session
+
+from src.config import get_db
+from src.domain.dtos.reposicionDto import SugerenciasReposicionResponse
+from src.domain.services.reposicion_service import ReposicionService
+from src.infrastructure.repository.createReposicionRepository import (
+    ReposicionRepository,
+)
+
+router = APIRouter(prefix="/reposicion", tags=["reposicion"])
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+XLSX_COLUMNS = [
+    "producto_id",
+    "codigo_barras",
+    "nombre",
+    "cantidad_actual",
+    "cantidad_minima",
+    "venta_promedio_diaria",
+    "venta_promedio_7_dias",
+    "dias_cobertura",
+    "cantidad_sugerida",
+]
+
+
+def get_service(db: Session = Depends(get_db)) -> ReposicionService:
+    repo = ReposicionRepository(db)
+    return ReposicionService(repo)
+
+
+ServiceDep = Annotated[ReposicionService, Depends(get_service)]
+
+
+def _calcular(
+    service: ReposicionService,
+    hasta: Optional[date],
+    dias_historia: int,
+    dias_lead_time: int,
+    dias_cobertura_objetivo: int,
+    solo_con_sugerencia: bool,
+) -> SugerenciasReposicionResponse:
+    return service.calcular_sugerencias(
+        hasta=hasta,
+        dias_historia=dias_historia,
+        dias_lead_time=dias_lead_time,
+        dias_cobertura_objetivo=dias_cobertura_objetivo,
+        solo_con_sugerencia=solo_con_sugerencia,
+    )
+
+
+@router.get("/sugerencias", response_model=SugerenciasReposicionResponse)
+def get_sugerencias(
+    service: ServiceDep,
+    hasta: Optional[date] = None,
+    dias_historia: int = Query(default=28, ge=1, le=365),
+    dias_lead_time: int = Query(default=3, ge=0, le=180),
+    dias_cobertura_objetivo: int = Query(default=14, ge=0, le=365),
+    solo_con_sugerencia: bool = True,
+) -> SugerenciasReposicionResponse:
+    return _calcular(
+        service, hasta, dias_historia, dias_lead_time, dias_cobertura_objetivo, solo_con_sugerencia
+    )
+
+
+@router.get("/sugerencias.xlsx")
+def download_sugerencias(
+    service: ServiceDep,
+    hasta: Optional[date] = None,
+    dias_historia: int = Query(default=28, ge=1, le=365),
+    dias_lead_time: int = Query(default=3, ge=0, le=180),
+    dias_cobertura_objetivo: int = Query(default=14, ge=0, le=365),
+    solo_con_sugerencia: bool = True,
+) -> StreamingResponse:
+    result = _calcular(
+        service, hasta, dias_historia, dias_lead_time, dias_cobertura_objetivo, solo_con_sugerencia
+    )
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sugerencias")
+    sheet.append(XLSX_COLUMNS)
+    for item in result.items:
+        sheet.append([getattr(item, column) for column in XLSX_COLUMNS])
+    buffer = BytesIO()
+    workbook.save(buffer)
+    buffer.seek(0)
+
+    filename = f"reposicion_{result.hasta.isoformat()}.xlsx"
+    return StreamingResponse(
+        buffer,
+        media_type=XLSX_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
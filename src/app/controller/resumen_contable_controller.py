@@ -0,0 +1,53 @@
+from datetime import date
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from src.config import get_db
+from src.domain.dtos.resumenContableDto import (
+    ReconstruirResumenContableRequest,
+    ReconstruirResumenContableResponse,
+    ResumenContableMensualResponse,
+)
+from src.domain.services.resumen_contable_service import ResumenContableService
+from src.infrastructure.repository.createResumenContableRepository import (
+    ResumenContableRepository,
+)
+
+router = APIRouter(
+    prefix="/contabilidad/resumen-mensual",
+    tags=["contabilidad-resumen-mensual"],
+)
+
+
+def get_service(db: Session = Depends(get_db)) -> ResumenContableService:
+    repo = ResumenContableRepository(db)
+    return ResumenContableService(repo)
+
+
+DbDep = Annotated[Session, Depends(get_db)]
+ServiceDep = Annotated[ResumenContableService, Depends(get_service)]
+
+
+@router.get("/", response_model=ResumenContableMensualResponse)
+def get_resultado_mensual(
+    desde: date,
+    hasta: date,
+    service: ServiceDep,
+) -> ResumenContableMensualResponse:
+    try:
+        return service.get_resultado_mensual(desde, hasta)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.post("/reconstruir", response_model=ReconstruirResumenContableResponse)
+def reconstruir(
+    payload: ReconstruirResumenContableRequest,
+    service: ServiceDep,
+) -> ReconstruirResumenContableResponse:
+    try:
+        return service.reconstruir(payload.desde, payload.hasta)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
@@ -1,10 +1,30 @@
-from typing import Annotated
+import csv
+import io
+from datetime import date
+from typing import Annotated, Any, Iterator, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from openpyxl import load_workbook
+from pydantic import ValidationError
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.orm import Session
 
+from src.app.services.stock_alert_service import get_stock_alert_service
 from src.config import get_db
+from src.domain.dtos.conteoStockDto import (
+    ConteoStockImportError,
+    ConteoStockItem,
+    ConteoStockResponse,
+)
 from src.domain.dtos.genericResponseDto import CreationResponse
+from src.domain.dtos.movimientoStockDto import (
+    ConciliacionStockResponse,
+    MovimientoStockPageResponse,
+    MovimientoStockRequest,
+    MovimientoStockResponse,
+    SnapshotStockResponse,
+    StockLedgerResponse,
+)
 from src.domain.dtos.stockDto import StockRequest, StockResponse
 from src.domain.services.stock_service import StockService
 from src.infrastructure.repository.createStockRepository import StockRepository
@@ -14,7 +34,7 @@ router = APIRouter(prefix="/stock", tags=["stock"])
 
 def get_stock_service(db: Session = Depends(get_db)) -> StockService:
     repo = StockRepository(db)
-    return StockService(repo)
+    return StockService(repo, alert_service=get_stock_alert_service())
 
 
 DbDep = Annotated[Session, Depends(get_db)]
@@ -43,6 +63,156 @@ def list_stock(service: ServiceDep) -> list[StockResponse]:
     return service.list_stock()
 
 
+@router.post(
+    "/movimientos",
+    response_model=CreationResponse[MovimientoStockResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+def registrar_movimiento(
+    payload: MovimientoStockRequest,
+    service: ServiceDep,
+) -> CreationResponse[MovimientoStockResponse]:
+    try:
+        created = service.registrar_movimiento(payload)
+    except Exception as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return CreationResponse[MovimientoStockResponse](id=created.movimiento_id, data=created)
+
+
+@router.get("/movimientos", response_model=MovimientoStockPageResponse)
+def list_movimientos(
+    producto_id: int,
+    service: ServiceDep,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    tipo: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+) -> MovimientoStockPageResponse:
+    try:
+        return service.list_movimientos(
+            producto_id,
+            desde=desde,
+            hasta=hasta,
+            tipo_movimiento_id=tipo,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+def _iter_conteo_rows(file: UploadFile) -> Iterator[tuple[int, list[Any]]]:
+    """Recorre las filas del archivo sin cargarlo completo en memoria."""
+    filename = (file.filename or "").lower()
+    if filename.endswith(".xlsx"):
+        workbook = load_workbook(file.file, read_only=True, data_only=True)
+        try:
+            for row_index, row in enumerate(
+                workbook.active.iter_rows(values_only=True), start=1
+            ):
+                yield row_index, list(row)
+        finally:
+            workbook.close()
+        return
+
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    sample = text.read(2048)
+    text.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    for row_index, row in enumerate(csv.reader(text, dialect), start=1):
+        yield row_index, row
+
+
+def _iter_conteo_items(
+    rows: Iterator[tuple[int, list[Any]]],
+    errors: list[ConteoStockImportError],
+) -> Iterator[ConteoStockItem]:
+    _, header_row = next(rows, (1, []))
+    headers = [str(h).strip().lower() if h is not None else "" for h in header_row]
+    field_names = list(ConteoStockItem.model_fields.keys())
+    missing = [name for name in field_names if name not in headers]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Faltan columnas requeridas: {', '.join(missing)}",
+        )
+    positions = {name: headers.index(name) for name in field_names}
+
+    for row_index, row in rows:
+        payload = {}
+        for name, idx in positions.items():
+            value = row[idx] if idx < len(row) else None
+            if isinstance(value, str):
+                value = value.strip() or None
+            payload[name] = value
+        if all(value is None for value in payload.values()):
+            continue
+        if isinstance(payload["codigo_barras"], (int, float)):
+            payload["codigo_barras"] = str(payload["codigo_barras"]).removesuffix(".0")
+        try:
+            yield ConteoStockItem(**payload)
+        except ValidationError as exc:
+            errors.append(ConteoStockImportError(row=row_index, message=str(exc.errors())))
+
+
+@router.post("/conteo/import", response_model=ConteoStockResponse)
+def importar_conteo(
+    service: ServiceDep,
+    tipo_entrada_id: int,
+    tipo_salida_id: int,
+    ref_movimiento_id: int,
+    referencia_doc: Optional[str] = None,
+    realizado_por_id: Optional[int] = None,
+    file: UploadFile = File(...),
+) -> ConteoStockResponse:
+    filename = (file.filename or "").lower()
+    if not filename.endswith((".xlsx", ".csv")):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El archivo debe ser un .xlsx o .csv",
+        )
+
+    errors: list[ConteoStockImportError] = []
+    try:
+        items = _iter_conteo_items(_iter_conteo_rows(file), errors)
+        report = service.importar_conteo(
+            items,
+            tipo_entrada_id=tipo_entrada_id,
+            tipo_salida_id=tipo_salida_id,
+            ref_movimiento_id=ref_movimiento_id,
+            referencia_doc=referencia_doc,
+            realizado_por_id=realizado_por_id,
+        )
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    report.invalid = len(errors)
+    report.errors = errors
+    return report
+
+
+@router.get("/conciliacion", response_model=ConciliacionStockResponse)
+def conciliar_stock(service: ServiceDep) -> ConciliacionStockResponse:
+    return service.conciliar_stock()
+
+
+@router.post("/snapshots", response_model=SnapshotStockResponse)
+def crear_snapshots(service: ServiceDep) -> SnapshotStockResponse:
+    return service.crear_snapshots()
+
+
+@router.get("/bajo-minimo", response_model=list[StockResponse])
+def list_low_stock(service: ServiceDep) -> list[StockResponse]:
+    return service.list_low_stock()
+
+
 @router.get("/buscar", response_model=list[StockResponse])
 def search_stock(q: str, service: ServiceDep) -> list[StockResponse]:
     if not q.strip():
@@ -62,3 +232,14 @@ def get_stock(stock_id: int, service: ServiceDep) -> StockResponse:
             detail="Stock no encontrado",
         )
     return stock
+
+
+@router.get("/{stock_id}/ledger", response_model=StockLedgerResponse)
+def get_stock_ledger(stock_id: int, service: ServiceDep) -> StockLedgerResponse:
+    ledger = service.get_stock_ledger(stock_id)
+    if not ledger:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Stock no encontrado",
+        )
+    return ledger
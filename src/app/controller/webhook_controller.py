@@ -1,33 +1,31 @@
 import os
+from functools import partial
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, Request
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
+from src.app.services.conversation_state import build_conversation_state_store
+from src.app.services.unit_of_work import LazyUnitOfWork, UnitOfWorkMetrics
 from src.app.services.webhook_service import (
-    WebhookConversationState,
     WebhookService,
     build_whatsapp_client,
+    get_whatsapp_outbox,
     setup_webhook_logger,
 )
-from src.config import get_db
+from src.app.services.webhook_dedup import webhook_dedup
+from src.app.services.webhook_worker_pool import webhook_pool
+from src.config import SessionLocal
 from domain.services.ClienteService import ClienteService
 from src.infrastructure.repository.ClienteRepository import ClienteRepository
 
 router = APIRouter(tags=["webhook"])
 
 
-def get_cliente_service(db: Session = Depends(get_db)) -> ClienteService:
-    repo = ClienteRepository(db)
-    return ClienteService(repo)
-
-
-ClienteDep = Annotated[ClienteService, Depends(get_cliente_service)]
-
 WHATSAPP_VERIFY_TOKEN = os.getenv("WHATSAPP_VERIFY_TOKEN", "")
-_webhook_state = WebhookConversationState()
+_webhook_state = build_conversation_state_store()
 _webhook_logger = setup_webhook_logger()
 _whatsapp_client = build_whatsapp_client()
+_uow_metrics = UnitOfWorkMetrics()
 _webhook_service = WebhookService(
     verify_token=WHATSAPP_VERIFY_TOKEN,
     state=_webhook_state,
@@ -45,10 +43,10 @@ WebhookServiceDep = Annotated[WebhookService, Depends(get_webhook_service)]
 
 @router.get("/webhook")
 def whatsapp_verify(
+    webhook_service: WebhookServiceDep,
     hub_mode: str | None = Query(default=None, alias="hub.mode"),
     hub_verify_token: str | None = Query(default=None, alias="hub.verify_token"),
     hub_challenge: int | None = Query(default=None, alias="hub.challenge"),
-    webhook_service: WebhookService = Depends(get_webhook_service),
 ):
     return webhook_service.verify_subscription(
         hub_mode=hub_mode,
@@ -57,14 +55,69 @@ def whatsapp_verify(
     )
 
 
+def _procesar_mensajes(webhook_service: WebhookService, mensajes: list[tuple[dict, dict]]) -> None:
+    """
+    Corre en un hilo del pool. La sesion se abre recien si un paso la usa (el
+    dedup compartido, el estado de conversacion en base o el alta de cliente) y
+    todos esos pasos comparten la misma; con el estado en memoria los mensajes
+    que se ignoran no toman conexion del pool.
+    """
+    with LazyUnitOfWork(SessionLocal, _uow_metrics) as uow:
+        if webhook_dedup.compartido:
+            mensajes = webhook_dedup.reclamar(uow.session, mensajes)
+            if not mensajes:
+                return
+        servicio = webhook_service.con_estado(
+            webhook_service.state.con_sesion(lambda: uow.session)
+        )
+        cliente_service = uow.lazy(lambda db: ClienteService(ClienteRepository(db)))
+        servicio.handle_sender_messages(mensajes, cliente_service=cliente_service)
+
+
 @router.post("/webhook")
 async def whatsapp_webhook(
     request: Request,
-    cliente_service: ClienteDep,
-    webhook_service: WebhookService = Depends(get_webhook_service),
+    webhook_service: WebhookServiceDep,
 ):
-    body = await request.json()
-    return webhook_service.handle_webhook(
-        body=body,
-        cliente_service=cliente_service,
-    )
+    try:
+        body = await request.json()
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="JSON invalido") from exc
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Payload invalido")
+
+    grupos = webhook_service.messages_by_sender(body)
+    if not grupos:
+        # Solo estados de entrega/lectura: nada que encolar.
+        return {"status": "ignored"}
+    grupos = webhook_dedup.filtrar_nuevos(grupos)
+    if not grupos:
+        # Reentrega de Meta de mensajes ya aceptados.
+        return {"status": "duplicate"}
+
+    # Un trabajo por remitente: sus mensajes van en orden, los remitentes en paralelo.
+    # Se responde 200 apenas se encola; Meta reintenta si tarda o falla.
+    trabajos = [
+        (sender, partial(_procesar_mensajes, webhook_service, mensajes))
+        for sender, mensajes in grupos.items()
+    ]
+    if not webhook_pool.submit_all(trabajos):
+        webhook_dedup.olvidar(grupos.values())
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Webhook saturado, reintente",
+        )
+    return {"status": "queued"}
+
+
+@router.get("/webhook/metrics")
+def whatsapp_webhook_metrics() -> dict:
+    metrics = {
+        **webhook_pool.metrics.as_dict(),
+        "duplicados": webhook_dedup.duplicados,
+        "sesiones": _uow_metrics.as_dict(),
+    }
+    outbox = get_whatsapp_outbox()
+    if outbox is not None:
+        metrics["salientes"] = outbox.metrics()
+    return metrics
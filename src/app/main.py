@@ -1,9 +1,12 @@
 ﻿from pathlib import Path
+import asyncio
 import os
 import sys
 import threading
 import time
 import webbrowser
+from contextlib import asynccontextmanager
+from functools import partial
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
@@ -16,8 +19,17 @@ for path in (PROJECT_ROOT, SRC_DIR):
     if str(path) not in sys.path:
         sys.path.append(str(path))
 
+from src.app.controller.cartera_controller import router as cartera_router
 from src.app.controller.category_controller import router as category_router
+from src.app.controller.cierre_caja_controller import router as cierre_caja_router
+from src.app.controller.egreso_controller import router as egreso_router
+from src.app.controller.export_contable_controller import router as export_contable_router
+from src.app.controller.ingreso_controller import router as ingreso_router
+from src.app.controller.margen_controller import router as margen_router
 from src.app.controller.product_controller import router as product_router
+from src.app.controller.reposicion_controller import router as reposicion_router
+from src.app.controller.resumen_contable_controller import router as resumen_contable_router
+from src.app.controller.resumen_venta_diaria_controller import router as resumen_venta_diaria_router
 from src.app.controller.stock_controller import router as stock_router
 from src.app.controller.user_controller import router as user_router
 from src.app.controller.venta_controller import router as venta_router
@@ -37,10 +49,54 @@ def load_environment() -> None:
     load_dotenv(env_path)
 
 
+def load_reference_data() -> None:
+    from src.config import SessionLocal
+    from src.infrastructure.repository.referenceData import reference_data
+
+    db = SessionLocal()
+    try:
+        reference_data.load(db)
+    except Exception as e:
+        # Sin la carga inicial el registro se llena en la primera consulta.
+        print(f"Error cargando datos de referencia: {e}")
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from src.app.services.purga_periodica import webhook_purgas
+    from src.app.services.stock_alert_service import get_stock_alert_service
+    from src.app.services.webhook_dedup import webhook_dedup
+    from src.app.services.webhook_service import get_whatsapp_outbox
+    from src.app.services.webhook_worker_pool import webhook_pool
+    from src.config import SessionLocal
+
+    load_reference_data()
+    webhook_pool.start()
+    if webhook_dedup.compartido:
+        webhook_purgas.registrar("dedup", partial(webhook_dedup.purgar_vencidos, SessionLocal))
+    webhook_purgas.start()
+    yield
+    await webhook_purgas.stop()
+    # Termina los mensajes ya aceptados antes de apagar el proceso.
+    await webhook_pool.drain()
+    if get_stock_alert_service.cache_info().currsize:
+        stock_alerts = get_stock_alert_service()
+        if stock_alerts is not None:
+            # El resumen pendiente se encola antes de cerrar la cola de salida.
+            await asyncio.to_thread(stock_alerts.close)
+    if get_whatsapp_outbox.cache_info().currsize:
+        outbox = get_whatsapp_outbox()
+        if outbox is not None:
+            await asyncio.to_thread(outbox.close)
+
+
 def create_app() -> FastAPI:
     load_environment()
 
     app = FastAPI(
+        lifespan=lifespan,
         title="POS API",
         version="1.0.0",
         description="API para la gestion de pedidos",
@@ -57,8 +113,17 @@ def create_app() -> FastAPI:
     allow_headers=["*"],
 )
 
+    app.include_router(cartera_router)
     app.include_router(category_router)
+    app.include_router(cierre_caja_router)
+    app.include_router(egreso_router)
+    app.include_router(export_contable_router)
+    app.include_router(ingreso_router)
+    app.include_router(margen_router)
     app.include_router(product_router)
+    app.include_router(reposicion_router)
+    app.include_router(resumen_contable_router)
+    app.include_router(resumen_venta_diaria_router)
     app.include_router(stock_router)
     app.include_router(user_router)
     app.include_router(venta_router)
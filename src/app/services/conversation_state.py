@@ -0,0 +1,105 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from src.app.services.purga_periodica import PurgaPeriodica, webhook_purgas
+
+from src.domain.interfaces.conversation_state_store_interface import (
+    ConversationState,
+    ConversationStateStoreInterface,
+)
+
+DEFAULT_TTL_SECONDS = 30 * 60.0
+DEFAULT_MAX_SIZE = 10_000
+
+
+class InMemoryConversationStateStore(ConversationStateStoreInterface):
+    """
+    Estado de conversacion en memoria del proceso, con TTL y tamano maximo.
+    Cada `set` mueve al remitente al final, asi el orden del dict es el de
+    vencimiento y el primero es el que sale si se supera `max_size`.
+    Solo sirve con un unico worker; para varios usar la tabla compartida.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_size: int = DEFAULT_MAX_SIZE,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._clock = clock
+        self._estados: "OrderedDict[str, ConversationState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _ahora(self) -> datetime:
+        return datetime.fromtimestamp(self._clock(), tz=timezone.utc)
+
+    def _purgar(self, ahora: datetime) -> None:
+        while self._estados:
+            sender, estado = next(iter(self._estados.items()))
+            if estado.expira_en > ahora:
+                break
+            del self._estados[sender]
+
+    def get(self, sender: str) -> Optional[ConversationState]:
+        with self._lock:
+            self._purgar(self._ahora())
+            return self._estados.get(sender)
+
+    def set(
+        self, sender: str, estado: str, datos: Optional[Dict[str, Any]] = None
+    ) -> ConversationState:
+        with self._lock:
+            ahora = self._ahora()
+            self._purgar(ahora)
+            nuevo = ConversationState(
+                estado=estado,
+                expira_en=ahora + timedelta(seconds=self.ttl_seconds),
+                datos=dict(datos or {}),
+            )
+            self._estados[sender] = nuevo
+            self._estados.move_to_end(sender)
+            if len(self._estados) > self.max_size:
+                self._estados.popitem(last=False)
+            return nuevo
+
+    def clear(self, sender: str) -> None:
+        with self._lock:
+            self._estados.pop(sender, None)
+
+    def __len__(self) -> int:
+        return len(self._estados)
+
+
+def build_conversation_state_store(
+    session_factory: Optional[Callable[[], Session]] = None,
+    purgas: PurgaPeriodica = webhook_purgas,
+) -> ConversationStateStoreInterface:
+    """
+    `WEBHOOK_STATE_BACKEND=db` comparte el estado entre workers y nodos; en ese
+    caso los estados vencidos se borran en la purga periodica del webhook.
+    """
+    ttl_seconds = float(os.getenv("WEBHOOK_STATE_TTL_SECONDS", DEFAULT_TTL_SECONDS))
+    if os.getenv("WEBHOOK_STATE_BACKEND", "memory").lower() == "db":
+        from src.infrastructure.repository.createConversationStateRepository import (
+            DbConversationStateStore,
+        )
+
+        if session_factory is None:
+            from src.config import SessionLocal
+
+            session_factory = SessionLocal
+        store = DbConversationStateStore(session_factory, ttl_seconds=ttl_seconds)
+        purgas.registrar("conversacion", store.purgar_vencidos)
+        return store
+    return InMemoryConversationStateStore(
+        ttl_seconds=ttl_seconds,
+        max_size=int(os.getenv("WEBHOOK_STATE_MAX", DEFAULT_MAX_SIZE)),
+    )
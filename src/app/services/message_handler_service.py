@@ -2,7 +2,19 @@ from typing import Optional
 
 from src.domain.dtos.clienteDto import ClienteRequest
 from src.domain.interfaces.IwhatsappClientRepository import IwhatsappClientRepository
-from src.domain.services.cliente_service import ClienteService
+from src.domain.services.ClienteService import ClienteService
+from src.domain.services.command_router import Command, CommandMatch, CommandRouter
+
+GREETINGS = ("hola", "hello", "hi", "buenas tardes")
+
+# Se compila al importar: agregar comandos no agrega costo por mensaje.
+MESSAGE_COMMANDS = CommandRouter(
+    [
+        Command(nombre="shortcut", alias=("+", "-")),
+        Command(nombre="menu", alias=("A",)),
+        Command(nombre="greeting", alias=GREETINGS),
+    ]
+)
 
 
 class MessageHandlerService:
@@ -17,6 +29,11 @@ class MessageHandlerService:
     ):
         self.whatsapp_client = whatsapp_client
         self.cliente_service = cliente_service
+        self._acciones = {
+            "shortcut": self._handle_shortcut,
+            "menu": self._handle_menu,
+            "greeting": self._handle_greeting,
+        }
 
     def set_cliente_service(self, cliente_service: ClienteService) -> None:
         self.cliente_service = cliente_service
@@ -48,11 +65,8 @@ class MessageHandlerService:
         """
         Devuelve True si el texto coincide exactamente con un saludo conocido.
         """
-        if not message:
-            return False
-        normalized = message.strip().lower()
-        greetings = {"hola", "hello", "hi", "buenas tardes"}
-        return normalized in greetings
+        coincidencia = MESSAGE_COMMANDS.route(message)
+        return coincidencia is not None and coincidencia.comando.nombre == "greeting"
 
     def create_cliente_from_text(self, message: str) -> dict:
         """
@@ -80,35 +94,13 @@ class MessageHandlerService:
         if not message:
             return {"status": "ignored", "reason": "empty_message"}
 
-        normalized_text = message.strip()
         sender_id = sender_info.get("id") if sender_info else None
         sender_name = sender_info.get("name") if sender_info else None
 
-        # Atajos simples
-        if normalized_text in {"+", "-"}:
-            return {
-                "status": "handled",
-                "type": "shortcut",
-                "shortcut": normalized_text,
-                "recipient": sender_id,
-            }
-
-        if normalized_text.upper() == "A":
-            if self.whatsapp_client and sender_id:
-                await self.send_menu(sender_id)
-            return {
-                "status": "handled",
-                "type": "shortcut",
-                "shortcut": "A",
-                "recipient": sender_id,
-            }
-
-        # Saludo
-        if self.is_greeting(normalized_text):
-            reply = f"Hola {sender_name}".strip() if sender_name else "Hola"
-            if self.whatsapp_client and sender_id:
-                self.send_text(sender_id, reply)
-            return {"status": "handled", "type": "greeting", "recipient": sender_id}
+        coincidencia = MESSAGE_COMMANDS.route(message, sender_id)
+        if coincidencia is not None:
+            accion = self._acciones[coincidencia.comando.nombre]
+            return await accion(coincidencia, sender_id, sender_name)
 
         # Intento de creacion de cliente via texto multilinea
         if "\n" in message and self.cliente_service:
@@ -127,6 +119,36 @@ class MessageHandlerService:
 
         return {"status": "ignored", "type": "unknown", "recipient": sender_id}
 
+    async def _handle_shortcut(
+        self, coincidencia: CommandMatch, sender_id: Optional[str], sender_name: Optional[str]
+    ) -> dict:
+        return {
+            "status": "handled",
+            "type": "shortcut",
+            "shortcut": coincidencia.texto,
+            "recipient": sender_id,
+        }
+
+    async def _handle_menu(
+        self, coincidencia: CommandMatch, sender_id: Optional[str], sender_name: Optional[str]
+    ) -> dict:
+        if self.whatsapp_client and sender_id:
+            await self.send_menu(sender_id)
+        return {
+            "status": "handled",
+            "type": "shortcut",
+            "shortcut": "A",
+            "recipient": sender_id,
+        }
+
+    async def _handle_greeting(
+        self, coincidencia: CommandMatch, sender_id: Optional[str], sender_name: Optional[str]
+    ) -> dict:
+        reply = f"Hola {sender_name}".strip() if sender_name else "Hola"
+        if self.whatsapp_client and sender_id:
+            self.send_text(sender_id, reply)
+        return {"status": "handled", "type": "greeting", "recipient": sender_id}
+
     async def handleIncomingMessage(self, message: str, senderInfo: dict) -> dict:
         """
         Alias en estilo camelCase que delega en handle_incoming_message.
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import os
+from typing import Callable, Optional
+
+DEFAULT_INTERVALO_SECONDS = 3600.0
+
+TareaPurga = Callable[[], int]
+
+
+class PurgaPeriodica:
+    """
+    Corre cada `intervalo_seconds` las purgas registradas (tablas que crecen con
+    cada entrega del webhook y cuyos registros vencen). Las purgas son
+    bloqueantes y van en un hilo; un error se registra y no frena las demas. La
+    primera pasada corre al arrancar, para limpiar lo que quedo del proceso
+    anterior.
+    """
+
+    def __init__(
+        self,
+        intervalo_seconds: float = DEFAULT_INTERVALO_SECONDS,
+        *,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.intervalo_seconds = intervalo_seconds
+        self.logger = logger or logging.getLogger("webhook")
+        self.tareas: dict[str, TareaPurga] = {}
+        self.borrados: dict[str, int] = {}
+        self.pasadas = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls) -> "PurgaPeriodica":
+        return cls(float(os.getenv("WEBHOOK_PURGE_INTERVAL_SECONDS", DEFAULT_INTERVALO_SECONDS)))
+
+    def registrar(self, nombre: str, tarea: TareaPurga) -> None:
+        self.tareas[nombre] = tarea
+
+    async def ejecutar(self) -> dict[str, int]:
+        """Una pasada de todas las purgas; devuelve las filas borradas por cada una."""
+        resultado = {}
+        for nombre, tarea in list(self.tareas.items()):
+            try:
+                borrados = await asyncio.to_thread(tarea)
+            except Exception:
+                self.logger.exception("Error en la purga %s", nombre)
+                continue
+            resultado[nombre] = borrados
+            self.borrados[nombre] = self.borrados.get(nombre, 0) + borrados
+        self.pasadas += 1
+        return resultado
+
+    async def _loop(self) -> None:
+        while True:
+            await self.ejecutar()
+            await asyncio.sleep(self.intervalo_seconds)
+
+    def start(self) -> None:
+        """Arranca el ciclo en el event loop actual (idempotente)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="webhook-purga")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+
+webhook_purgas = PurgaPeriodica.from_env()
@@ -0,0 +1,162 @@
+import logging
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from src.domain.entities.stockEntity import StockEntity
+from src.domain.interfaces.IStockAlertService import IStockAlertService
+from src.domain.interfaces.IwhatsappClientRepository import IwhatsappClientRepository
+from src.infrastructure.repository.createStockRepository import StockRepository
+
+# WhatsApp corta los mensajes de texto en 4096 caracteres.
+MAX_DIGEST_LENGTH = 4000
+
+
+class StockAlertService(IStockAlertService):
+    """
+    Worker de alertas de stock bajo.
+
+    Acumula los productos tocados por transacciones de stock durante una ventana
+    de `debounce_seconds`, consulta cuales quedaron bajo el minimo usando el indice
+    parcial y envia un unico resumen por WhatsApp a cada destinatario. Un producto
+    no se vuelve a alertar hasta que pase `cooldown_seconds` o se recupere.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Session],
+        whatsapp_client: IwhatsappClientRepository,
+        recipients: Iterable[str],
+        debounce_seconds: float = 30.0,
+        cooldown_seconds: float = 3600.0,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.session_factory = session_factory
+        self.whatsapp_client = whatsapp_client
+        self.recipients = [r for r in recipients if r]
+        self.debounce_seconds = debounce_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.logger = logger or logging.getLogger("stock_alerts")
+
+        self._lock = threading.Lock()
+        self._pending: set[int] = set()
+        self._last_alerted: dict[int, float] = {}
+        self._timer: Optional[threading.Timer] = None
+
+    def notify_stock_change(self, producto_ids: Iterable[int]) -> None:
+        ids = {int(pid) for pid in producto_ids if pid}
+        if not ids:
+            return
+        with self._lock:
+            self._pending.update(ids)
+            if self._timer is None:
+                self._timer = threading.Timer(self.debounce_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> list[int]:
+        """
+        Procesa los productos pendientes y devuelve los IDs incluidos en el resumen.
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = set()
+            self._timer = None
+        if not pending:
+            return []
+
+        db = self.session_factory()
+        try:
+            low_stock = StockRepository(db).list_low_stock(producto_ids=pending)
+        except Exception as exc:
+            self.logger.error("Error consultando stock bajo: %s", exc)
+            return []
+        finally:
+            db.close()
+
+        now = time.monotonic()
+        low_ids = {stock.producto_id for stock in low_stock}
+        with self._lock:
+            # Los productos que se recuperaron pueden volver a alertar de inmediato.
+            for producto_id in pending - low_ids:
+                self._last_alerted.pop(producto_id, None)
+            to_alert = [
+                stock
+                for stock in low_stock
+                if now - self._last_alerted.get(stock.producto_id, float("-inf"))
+                >= self.cooldown_seconds
+            ]
+            for stock in to_alert:
+                self._last_alerted[stock.producto_id] = now
+
+        if to_alert:
+            self._send_digest(to_alert)
+        return [stock.producto_id for stock in to_alert]
+
+    def close(self) -> list[int]:
+        """Cancela la ventana en curso y envia ya lo pendiente (al apagar el proceso)."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        return self.flush()
+
+    def _send_digest(self, stocks: list[StockEntity]) -> None:
+        message = build_low_stock_digest(stocks)
+        for recipient in self.recipients:
+            try:
+                self.whatsapp_client.send_message(recipient, message)
+            except Exception as exc:
+                self.logger.error("Error enviando alerta de stock a %s: %s", recipient, exc)
+
+
+def build_low_stock_digest(stocks: list[StockEntity]) -> str:
+    header = f"*Alerta de stock bajo* ({len(stocks)} productos)"
+    lines = [header]
+    length = len(header)
+    for index, stock in enumerate(stocks):
+        nombre = stock.producto_nombre or f"Producto {stock.producto_id}"
+        line = f"- {nombre}: {stock.cantidad_actual} (minimo {stock.cantidad_minima})"
+        if length + len(line) + 1 > MAX_DIGEST_LENGTH:
+            lines.append(f"... y {len(stocks) - index} productos mas")
+            break
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+def build_stock_alert_service() -> Optional[StockAlertService]:
+    recipients = [
+        r.strip() for r in os.getenv("STOCK_ALERT_RECIPIENTS", "").split(",") if r.strip()
+    ]
+    if not recipients:
+        return None
+
+    # Import diferido: solo se necesita el cliente de WhatsApp si hay destinatarios.
+    from src.app.services.webhook_service import build_whatsapp_client
+    from src.app.services.whatsapp_outbox import PRIORIDAD_NOTIFICACION
+    from src.config import SessionLocal
+
+    # El resumen va detras de las respuestas de chat en la cola de salida.
+    whatsapp_client = build_whatsapp_client(PRIORIDAD_NOTIFICACION)
+    if whatsapp_client is None:
+        return None
+
+    return StockAlertService(
+        session_factory=SessionLocal,
+        whatsapp_client=whatsapp_client,
+        recipients=recipients,
+        debounce_seconds=float(os.getenv("STOCK_ALERT_DEBOUNCE_SECONDS", "30")),
+        cooldown_seconds=float(os.getenv("STOCK_ALERT_COOLDOWN_SECONDS", "3600")),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_stock_alert_service() -> Optional[StockAlertService]:
+    """Se arma en el primer uso, no al importar el controller."""
+    return build_stock_alert_service()
@@ -0,0 +1,108 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+
+@dataclass
+class UnitOfWorkMetrics:
+    creadas: int = 0
+    sesiones_abiertas: int = 0
+    # Los trabajos del webhook corren en hilos distintos.
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def registrar_unidad(self) -> None:
+        with self._lock:
+            self.creadas += 1
+
+    def registrar_sesion(self) -> None:
+        with self._lock:
+            self.sesiones_abiertas += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "unidades": self.creadas,
+            "sesiones_abiertas": self.sesiones_abiertas,
+            "sesiones_evitadas": self.creadas - self.sesiones_abiertas,
+        }
+
+
+class LazyService(Generic[T]):
+    """
+    Se construye con la sesion de la unidad de trabajo recien en el primer uso de
+    un atributo; hasta entonces no se toma conexion del pool.
+    """
+
+    def __init__(self, unit_of_work: "LazyUnitOfWork", factory: Callable[[Session], T]):
+        self._unit_of_work = unit_of_work
+        self._factory = factory
+        self._instancia: Optional[T] = None
+
+    @property
+    def resuelto(self) -> bool:
+        return self._instancia is not None
+
+    def resolve(self) -> T:
+        if self._instancia is None:
+            self._instancia = self._factory(self._unit_of_work.session)
+        return self._instancia
+
+    def __getattr__(self, nombre: str):
+        return getattr(self.resolve(), nombre)
+
+
+class LazyUnitOfWork:
+    """
+    Sesion de base de datos que se abre solo si algun paso la pide. Pensada para
+    los trabajos del webhook: la mayoria de las entregas (estados, mensajes sin
+    flujo activo) no tocan la base y no deberian ocupar una conexion. Al salir
+    del `with` confirma lo pendiente, o lo descarta si hubo una excepcion.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        metrics: Optional[UnitOfWorkMetrics] = None,
+    ):
+        self._session_factory = session_factory
+        self._session: Optional[Session] = None
+        self._metrics = metrics
+        if metrics is not None:
+            metrics.registrar_unidad()
+
+    @property
+    def abierta(self) -> bool:
+        return self._session is not None
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = self._session_factory()
+            if self._metrics is not None:
+                self._metrics.registrar_sesion()
+        return self._session
+
+    def lazy(self, factory: Callable[[Session], T]) -> LazyService[T]:
+        return LazyService(self, factory)
+
+    def commit(self) -> None:
+        if self._session is not None:
+            self._session.commit()
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> "LazyUnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+        finally:
+            self.close()
@@ -0,0 +1,143 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from src.infrastructure.repository.createWebhookDedupRepository import WebhookDedupRepository
+
+DEFAULT_TTL_SECONDS = 24 * 3600.0
+DEFAULT_MAX_SIZE = 100_000
+
+Mensajes = list[tuple[dict, dict]]
+
+
+class TtlIdCache:
+    """
+    Conjunto de ids con vencimiento y tamano maximo. Como todos los ids viven
+    lo mismo, el orden de insercion es el orden de vencimiento: alta, consulta y
+    limpieza son O(1) amortizado y la memoria queda acotada por `max_size`.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._vence: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _purgar(self, ahora: float) -> None:
+        while self._vence:
+            clave, vence = next(iter(self._vence.items()))
+            if vence > ahora:
+                break
+            del self._vence[clave]
+
+    def add_if_absent(self, clave: str) -> bool:
+        """Agrega `clave` y devuelve True si no estaba (o ya habia vencido)."""
+        with self._lock:
+            ahora = self._clock()
+            self._purgar(ahora)
+            if clave in self._vence:
+                return False
+            self._vence[clave] = ahora + self.ttl_seconds
+            if len(self._vence) > self.max_size:
+                self._vence.popitem(last=False)
+            return True
+
+    def discard(self, clave: str) -> None:
+        with self._lock:
+            self._vence.pop(clave, None)
+
+    def __contains__(self, clave: str) -> bool:
+        with self._lock:
+            self._purgar(self._clock())
+            return clave in self._vence
+
+    def __len__(self) -> int:
+        return len(self._vence)
+
+
+class WebhookDeduplicator:
+    """
+    Descarta mensajes de WhatsApp ya vistos, por `message.id`. El filtro en
+    memoria corre en el endpoint antes de encolar; con `compartido=True` el
+    worker ademas reclama cada id en la tabla `webhook_mensaje_procesado` para
+    que otros procesos no lo repitan. Los mensajes sin id se procesan siempre.
+    """
+
+    def __init__(self, local: Optional[TtlIdCache] = None, compartido: bool = False):
+        self.local = local if local is not None else TtlIdCache()
+        self.compartido = compartido
+        self.duplicados = 0
+
+    @classmethod
+    def from_env(cls) -> "WebhookDeduplicator":
+        return cls(
+            TtlIdCache(
+                max_size=int(os.getenv("WEBHOOK_DEDUP_MAX", DEFAULT_MAX_SIZE)),
+                ttl_seconds=float(os.getenv("WEBHOOK_DEDUP_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+            ),
+            compartido=os.getenv("WEBHOOK_DEDUP_BACKEND", "memory").lower() == "db",
+        )
+
+    def filtrar_nuevos(self, grupos: dict[str, Mensajes]) -> dict[str, Mensajes]:
+        """Deja solo los mensajes no vistos y los marca como vistos."""
+        nuevos: dict[str, Mensajes] = {}
+        for sender, mensajes in grupos.items():
+            pendientes = []
+            for value, message in mensajes:
+                message_id = message.get("id")
+                if message_id and not self.local.add_if_absent(message_id):
+                    self.duplicados += 1
+                    continue
+                pendientes.append((value, message))
+            if pendientes:
+                nuevos[sender] = pendientes
+        return nuevos
+
+    def olvidar(self, grupos: Iterable[Mensajes]) -> None:
+        """Desmarca mensajes que no se pudieron encolar, para aceptar el reintento."""
+        for mensajes in grupos:
+            for _, message in mensajes:
+                if message.get("id"):
+                    self.local.discard(message["id"])
+
+    def reclamar(self, db: Session, mensajes: Mensajes) -> Mensajes:
+        """En el worker: deja solo los mensajes que ningun otro proceso reclamo."""
+        if not self.compartido:
+            return mensajes
+        repo = WebhookDedupRepository(db)
+        reclamados = []
+        for value, message in mensajes:
+            message_id = message.get("id")
+            if message_id and not repo.reclamar(message_id):
+                self.duplicados += 1
+                continue
+            reclamados.append((value, message))
+        return reclamados
+
+    def purgar_vencidos(
+        self,
+        session_factory: Callable[[], Session],
+        ahora: Optional[datetime] = None,
+    ) -> int:
+        """Borra de la tabla compartida los ids mas viejos que el TTL del filtro local."""
+        if not self.compartido:
+            return 0
+        ahora = ahora or datetime.now(timezone.utc)
+        with session_factory() as db:
+            return WebhookDedupRepository(db).purgar(
+                ahora - timedelta(seconds=self.local.ttl_seconds)
+            )
+
+
+webhook_dedup = WebhookDeduplicator.from_env()
@@ -0,0 +1,146 @@
+import atexit
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import shutil
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+DEFAULT_LOG_PATH = "logs/webhook_payloads.ndjson"
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUPS = 7
+DEFAULT_QUEUE_SIZE = 10_000
+
+
+class NdjsonFormatter(logging.Formatter):
+    """Una linea JSON compacta por registro; el payload va como objeto, no como repr."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "msg": record.getMessage(),
+        }
+        payload = getattr(record, "payload", None)
+        if payload is not None:
+            data["payload"] = payload
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class PayloadSampler(logging.Filter):
+    """
+    Deja pasar solo una fraccion `rate` de los registros con `payload`; el resto
+    de mensajes (errores, avisos) pasa siempre.
+    """
+
+    def __init__(self, rate: float, rand: Callable[[], float] = random.random):
+        super().__init__()
+        self.rate = rate
+        self._rand = rand
+        self.descartados = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "payload", None) is None or self.rate >= 1:
+            return True
+        if self.rate > 0 and self._rand() < self.rate:
+            return True
+        self.descartados += 1
+        return False
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Encola el registro tal cual: el formateo (json.dumps del payload) y la
+    escritura ocurren en el hilo del `QueueListener`. Si la cola esta llena el
+    registro se descarta en vez de bloquear el request.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.descartados = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.descartados += 1
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as origen, gzip.open(dest, "wb") as destino:
+        shutil.copyfileobj(origen, destino)
+    os.remove(source)
+
+
+def build_file_handler(
+    log_path: str,
+    *,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    rotate_when: Optional[str] = None,
+    backups: int = DEFAULT_BACKUPS,
+) -> logging.Handler:
+    """Rota por tamano o, si se indica `rotate_when` (p. ej. "midnight"), por tiempo."""
+    if rotate_when:
+        handler: logging.handlers.BaseRotatingHandler = logging.handlers.TimedRotatingFileHandler(
+            log_path, when=rotate_when, backupCount=backups, encoding="utf-8", utc=True
+        )
+    else:
+        handler = logging.handlers.RotatingFileHandler(
+            log_path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+        )
+    handler.namer = lambda name: f"{name}.gz"
+    handler.rotator = _gzip_rotator
+    handler.setFormatter(NdjsonFormatter())
+    return handler
+
+
+def setup_webhook_logger(
+    log_path: Optional[str] = None,
+    *,
+    name: str = "webhook",
+) -> logging.Logger:
+    log_path = log_path or os.getenv("WEBHOOK_LOG_PATH", DEFAULT_LOG_PATH)
+    log_dir = os.path.dirname(log_path)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    if logger.handlers:
+        return logger
+
+    file_handler = build_file_handler(
+        log_path,
+        max_bytes=int(os.getenv("WEBHOOK_LOG_MAX_BYTES", DEFAULT_MAX_BYTES)),
+        rotate_when=os.getenv("WEBHOOK_LOG_ROTATE_WHEN") or None,
+        backups=int(os.getenv("WEBHOOK_LOG_BACKUPS", DEFAULT_BACKUPS)),
+    )
+    log_queue: queue.Queue = queue.Queue(
+        maxsize=int(os.getenv("WEBHOOK_LOG_QUEUE_SIZE", DEFAULT_QUEUE_SIZE))
+    )
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(PayloadSampler(float(os.getenv("WEBHOOK_LOG_SAMPLE_RATE", "1.0"))))
+
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+
+    def _cerrar() -> None:
+        # Vacia la cola y recien entonces cierra el archivo.
+        listener.stop()
+        file_handler.close()
+
+    atexit.register(_cerrar)
+
+    logger.addHandler(queue_handler)
+    logger.propagate = False
+    return logger
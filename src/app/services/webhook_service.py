@@ -1,56 +1,102 @@
 import logging
 import os
-from dataclasses import dataclass, field
-from typing import Optional, Set
+from functools import lru_cache
+from typing import Optional
 
-import requests
 from fastapi import HTTPException, status
 
+from src.app.services.webhook_logging import setup_webhook_logger  # noqa: F401
+from src.app.services.whatsapp_outbox import (
+    PRIORIDAD_RESPUESTA,
+    ScheduledWhatsAppClient,
+    WhatsAppOutbox,
+    build_outbox,
+)
 from src.domain.dtos.clienteDto import ClienteRequest
 from src.domain.services.ClienteService import ClienteService
-from src.infrastructure.repository.whatsappClientRepository import WhatsAppClient
+from src.domain.interfaces.conversation_state_store_interface import (
+    ConversationStateStoreInterface,
+)
+from src.domain.interfaces.IwhatsappClientRepository import IwhatsappClientRepository
+from src.domain.services.command_router import PREFIJO, Command, CommandRouter
+from src.infrastructure.repository.whatsappAsyncClientRepository import (
+    RETRY_STATUS,
+    PooledWhatsAppClient,
+    WhatsAppApiError,
+)
 
 
-@dataclass
-class WebhookConversationState:
-    pending_cliente_creacion: Set[str] = field(default_factory=set)
+# Estados del flujo por remitente (ver ConversationStateStoreInterface).
+ESTADO_CREANDO_CLIENTE = "creando_cliente"
 
+COMANDO_CREAR_CLIENTE = "crear_cliente"
 
-def setup_webhook_logger() -> logging.Logger:
-    log_path = os.getenv("WEBHOOK_LOG_PATH", "logs/webhook_payloads.txt")
-    log_dir = os.path.dirname(log_path)
-    if log_dir:
-        os.makedirs(log_dir, exist_ok=True)
-    logger = logging.getLogger("webhook")
-    logger.setLevel(logging.INFO)
-    if not logger.handlers:
-        file_handler = logging.FileHandler(log_path, encoding="utf-8")
-        file_handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
-        logger.addHandler(file_handler)
-    return logger
+# Se compila al importar; cada mensaje cuesta un lookup sin importar cuantos
+# comandos haya. Cualquier texto que empiece por "A" abre el alta de cliente.
+WEBHOOK_COMMANDS = CommandRouter(
+    [Command(nombre=COMANDO_CREAR_CLIENTE, alias=("A",), modo=PREFIJO)]
+)
 
 
-def build_whatsapp_client() -> Optional[WhatsAppClient]:
+@lru_cache(maxsize=1)
+def get_whatsapp_outbox() -> Optional[WhatsAppOutbox]:
+    """Un solo programador por proceso: respuestas y alertas comparten el limite por numero."""
     api_url = os.getenv("WHATSAPP_API_URL")
     token = os.getenv("WHATSAPP_TOKEN")
     if api_url and token:
-        return WhatsAppClient(api_url=api_url, token=token)
+        return build_outbox(
+            PooledWhatsAppClient(
+                api_url=api_url,
+                token=token,
+                max_retries=int(os.getenv("WHATSAPP_MAX_RETRIES", "3")),
+                # Los 429 los maneja el programador: pausa el numero y reencola.
+                retry_status=RETRY_STATUS - {429},
+            )
+        )
     return None
 
 
+def build_whatsapp_client(
+    prioridad: int = PRIORIDAD_RESPUESTA,
+) -> Optional[IwhatsappClientRepository]:
+    """
+    Las respuestas de chat esperan su envio; los envios de menor prioridad
+    (resumenes, alertas) se encolan y vuelven enseguida.
+    """
+    outbox = get_whatsapp_outbox()
+    if outbox is None:
+        return None
+    return ScheduledWhatsAppClient(
+        outbox, prioridad=prioridad, esperar=prioridad == PRIORIDAD_RESPUESTA
+    )
+
+
 class WebhookService:
     def __init__(
         self,
         *,
         verify_token: str,
-        state: WebhookConversationState,
+        state: ConversationStateStoreInterface,
         logger: logging.Logger,
-        whatsapp_client: Optional[WhatsAppClient],
+        whatsapp_client: Optional[IwhatsappClientRepository],
+        commands: CommandRouter = WEBHOOK_COMMANDS,
     ):
         self.verify_token = verify_token
         self.state = state
         self.logger = logger
         self.whatsapp_client = whatsapp_client
+        self.commands = commands
+        self._acciones = {COMANDO_CREAR_CLIENTE: self._start_cliente_flow}
+
+    def con_estado(self, state: ConversationStateStoreInterface) -> "WebhookService":
+        """Mismo servicio con otro store de estado (p. ej. ligado a la sesion de un trabajo)."""
+        return WebhookService(
+            verify_token=self.verify_token,
+            state=state,
+            logger=self.logger,
+            whatsapp_client=self.whatsapp_client,
+            commands=self.commands,
+        )
 
     def verify_subscription(
         self,
@@ -74,25 +120,77 @@ class WebhookService:
         *,
         cliente_service: ClienteService,
     ):
+        """Procesa en orden todos los mensajes del payload."""
+        grupos = self.messages_by_sender(body)
+        if not grupos:
+            return {"status": "ignored"}
+        for mensajes in grupos.values():
+            self.handle_sender_messages(mensajes, cliente_service=cliente_service)
+        return {"status": "ok", "mensajes": sum(len(m) for m in grupos.values())}
+
+    def messages_by_sender(self, body: dict) -> dict[str, list[tuple[dict, dict]]]:
+        """
+        Junta los `(value, message)` de todas las `entry[*].changes[*]`, agrupados
+        por remitente y en el orden del payload. Los cambios que solo traen
+        `statuses` (entregado/leido) se descartan aqui, sin tocar la base.
+        """
+        # Se serializa en el hilo del QueueListener, no en el request.
+        self.logger.info("POST /payload", extra={"payload": body})
+        grupos: dict[str, list[tuple[dict, dict]]] = {}
+        for value in self._iter_values(body):
+            messages = value.get("messages")
+            if not messages:
+                continue
+            for message in messages:
+                sender = message.get("from") if isinstance(message, dict) else None
+                if sender:
+                    grupos.setdefault(sender, []).append((value, message))
+        if not grupos:
+            self.logger.info("No se encontraron mensajes en el payload")
+        return grupos
+
+    def handle_sender_messages(
+        self,
+        mensajes: list[tuple[dict, dict]],
+        *,
+        cliente_service: ClienteService,
+    ) -> list[dict]:
+        """
+        Procesa los mensajes de un mismo remitente, uno detras de otro. Un error en
+        un mensaje se registra y no impide procesar los siguientes.
+        """
+        resultados = []
+        for value, message in mensajes:
+            try:
+                resultados.append(
+                    self.handle_message(value, message, cliente_service=cliente_service)
+                )
+            except HTTPException as exc:
+                self.logger.error("Mensaje %s no procesado: %s", message.get("id"), exc.detail)
+                resultados.append({"status": "error", "detail": exc.detail})
+            except Exception as exc:
+                # Timeouts del envio, errores de la base del estado, etc.
+                self.logger.exception("Mensaje %s no procesado", message.get("id"))
+                resultados.append({"status": "error", "detail": str(exc)})
+        return resultados
+
+    def handle_message(
+        self,
+        value: dict,
+        message: dict,
+        *,
+        cliente_service: ClienteService,
+    ) -> dict:
         if self.whatsapp_client is None:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="WhatsApp client no configurado",
             )
 
-        self.logger.info("POST /payload: %s", body)
-
-        value, messages = self._extract_messages(body)
-        if not messages:
-            self.logger.info("No se encontraron mensajes en el payload")
-            return {"status": "ignored"}
-
-        message = messages[0]
-        self.logger.info("Mensaje detectado: %s", message)
+        self.logger.info("Mensaje detectado", extra={"payload": message})
 
         text = message.get("text", {}).get("body", "").strip()
         sender = message.get("from")
-        contact_name = self._get_contact_name(value)
 
         if not text or not sender:
             self.logger.info("Payload sin texto o sin remitente")
@@ -100,32 +198,31 @@ class WebhookService:
 
         normalized_text = text.strip()
 
-        if normalized_text.upper().startswith("A"):
-            return self._start_cliente_flow(sender)
+        coincidencia = self.commands.route(normalized_text, sender)
+        accion = self._acciones.get(coincidencia.comando.nombre) if coincidencia else None
+        if accion is not None:
+            return accion(sender)
 
-        if sender in self.state.pending_cliente_creacion:
+        conversacion = self.state.get(sender)
+        if conversacion and conversacion.estado == ESTADO_CREANDO_CLIENTE:
             return self._handle_cliente_creacion(sender, normalized_text, cliente_service)
 
         self.logger.info("Mensaje sin flujo de cliente activo, ignorado")
         return {"status": "ignored"}
 
-    def _extract_messages(self, body: dict) -> tuple[Optional[dict], list]:
-        value = None
-        messages: list = []
-
-        try:
-            entry = body.get("entry", [])[0]
-            change = entry.get("changes", [])[0]
-            value = change.get("value", {})
-            messages = value.get("messages", [])
-        except Exception:
-            pass
-
-        if not messages:
-            value = body.get("value", {})
-            messages = value.get("messages", [])
-
-        return value, messages
+    def _iter_values(self, body: dict):
+        entries = body.get("entry")
+        if isinstance(entries, list):
+            for entry in entries:
+                changes = entry.get("changes") if isinstance(entry, dict) else None
+                for change in changes if isinstance(changes, list) else []:
+                    value = change.get("value") if isinstance(change, dict) else None
+                    if isinstance(value, dict):
+                        yield value
+            return
+        value = body.get("value")
+        if isinstance(value, dict):
+            yield value
 
     def _get_contact_name(self, value: Optional[dict]) -> Optional[str]:
         try:
@@ -137,7 +234,7 @@ class WebhookService:
         return None
 
     def _start_cliente_flow(self, sender: str) -> dict:
-        self.state.pending_cliente_creacion.add(sender)
+        self.state.set(sender, ESTADO_CREANDO_CLIENTE)
         instrucciones = (
             "**Nuevo cliente**\n"
             "Envia hasta 3 lineas:\n"
@@ -174,7 +271,7 @@ class WebhookService:
             self.logger.error("Error creando cliente: %s", exc)
             self._send_message(sender, f"No se pudo crear el cliente: {exc}")
 
-        self.state.pending_cliente_creacion.discard(sender)
+        self.state.clear(sender)
         return {"status": "ok"}
 
     def _send_message(self, recipient: str, message: str) -> None:
@@ -185,9 +282,9 @@ class WebhookService:
             )
         try:
             self.whatsapp_client.send_message(recipient, message)
-        except requests.HTTPError as exc:
-            resp = exc.response
-            detail = f"WhatsApp API error {resp.status_code if resp else ''}: {resp.text if resp else exc}"
+        except WhatsAppApiError as exc:
+            # Ya se reintento en el cliente; aqui solo se registra y se reporta.
+            detail = str(exc)
             self.logger.error(detail)
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
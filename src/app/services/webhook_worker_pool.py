@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Hashable, Iterable, Optional
+
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_DRAIN_SECONDS = 25.0
+
+WebhookJob = Callable[[], object]
+
+
+@dataclass
+class WebhookPoolMetrics:
+    recibidos: int = 0
+    procesados: int = 0
+    fallidos: int = 0
+    rechazados: int = 0
+    descartados_al_cerrar: int = 0
+    en_cola: int = 0
+    max_en_cola: int = 0
+    en_proceso: int = 0
+    capacidad: int = 0
+    workers: int = 0
+    espera_total_ms: float = 0.0
+    proceso_total_ms: float = 0.0
+
+    def as_dict(self) -> dict:
+        terminados = self.procesados + self.fallidos
+        return {
+            "recibidos": self.recibidos,
+            "procesados": self.procesados,
+            "fallidos": self.fallidos,
+            "rechazados": self.rechazados,
+            "descartados_al_cerrar": self.descartados_al_cerrar,
+            "en_cola": self.en_cola,
+            "max_en_cola": self.max_en_cola,
+            "en_proceso": self.en_proceso,
+            "capacidad": self.capacidad,
+            "workers": self.workers,
+            "espera_promedio_ms": round(self.espera_total_ms / terminados, 2) if terminados else 0.0,
+            "proceso_promedio_ms": round(self.proceso_total_ms / terminados, 2) if terminados else 0.0,
+        }
+
+
+class WebhookWorkerPool:
+    """
+    Cola acotada de trabajos del webhook atendida por un numero fijo de workers
+    asyncio. El endpoint solo encola y responde; cada trabajo (bloqueante: base de
+    datos, API de WhatsApp) corre en un hilo con `asyncio.to_thread` para no frenar
+    el event loop. Si la cola esta llena el trabajo se rechaza y el endpoint
+    responde 503 para que Meta reintente mas tarde.
+
+    Los trabajos con la misma `key` (el remitente) corren de a uno y en el orden
+    en que llegaron; los de claves distintas corren en paralelo.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        drain_seconds: float = DEFAULT_DRAIN_SECONDS,
+        logger: Optional[logging.Logger] = None,
+    ):
+        if workers < 1 or queue_size < 1:
+            raise ValueError("workers y queue_size deben ser mayores que cero")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.drain_seconds = drain_seconds
+        self.logger = logger or logging.getLogger("webhook")
+        self.metrics = WebhookPoolMetrics(capacidad=queue_size, workers=workers)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list[asyncio.Task] = []
+        self._closing = False
+        # Trabajos aceptados y aun no iniciados (en la cola o esperando su clave).
+        self._pendientes = 0
+        # Claves con un trabajo en cola o en proceso, y los que esperan detras.
+        self._en_curso: dict[Hashable, deque] = {}
+
+    @classmethod
+    def from_env(cls) -> "WebhookWorkerPool":
+        return cls(
+            workers=int(os.getenv("WEBHOOK_WORKERS", DEFAULT_WORKERS)),
+            queue_size=int(os.getenv("WEBHOOK_QUEUE_SIZE", DEFAULT_QUEUE_SIZE)),
+            drain_seconds=float(os.getenv("WEBHOOK_DRAIN_SECONDS", DEFAULT_DRAIN_SECONDS)),
+        )
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Arranca los workers en el event loop actual (idempotente)."""
+        if self._tasks:
+            return
+        self._closing = False
+        self._queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"webhook-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    def submit(self, job: WebhookJob, key: Optional[Hashable] = None) -> bool:
+        """Encola `job` sin esperar. Devuelve False si la cola esta llena o cerrando."""
+        return self.submit_all([(key, job)])
+
+    def submit_all(self, jobs: Iterable[tuple[Optional[Hashable], WebhookJob]]) -> bool:
+        """
+        Encola todos los `(key, job)` o ninguno: un payload se acepta completo para
+        que el reintento de Meta no deje la mitad procesada dos veces.
+        """
+        jobs = list(jobs)
+        if self._closing or self._pendientes + len(jobs) > self.queue_size:
+            self.metrics.rechazados += len(jobs)
+            if not self._closing:
+                self.logger.warning(
+                    "Cola del webhook llena (%s), %s trabajos rechazados", self.queue_size, len(jobs)
+                )
+            return False
+        self.start()
+        ahora = time.monotonic()
+        for key, job in jobs:
+            item = (key, ahora, job)
+            if key is not None and key in self._en_curso:
+                self._en_curso[key].append(item)
+            else:
+                if key is not None:
+                    self._en_curso[key] = deque()
+                self._queue.put_nowait(item)
+        self._pendientes += len(jobs)
+        self.metrics.recibidos += len(jobs)
+        self.metrics.en_cola = self._pendientes
+        self.metrics.max_en_cola = max(self.metrics.max_en_cola, self._pendientes)
+        return True
+
+    def _liberar_clave(self, key: Optional[Hashable]) -> None:
+        if key is None:
+            return
+        siguientes = self._en_curso.get(key)
+        if siguientes:
+            self._queue.put_nowait(siguientes.popleft())
+        else:
+            self._en_curso.pop(key, None)
+
+    async def _worker(self) -> None:
+        while True:
+            key, encolado_en, job = await self._queue.get()
+            inicio = time.monotonic()
+            self._pendientes -= 1
+            self.metrics.en_cola = self._pendientes
+            self.metrics.en_proceso += 1
+            try:
+                await asyncio.to_thread(job)
+                self.metrics.procesados += 1
+            except Exception:
+                self.metrics.fallidos += 1
+                self.logger.exception("Error procesando trabajo del webhook")
+            finally:
+                fin = time.monotonic()
+                self.metrics.en_proceso -= 1
+                self.metrics.espera_total_ms += (inicio - encolado_en) * 1000
+                self.metrics.proceso_total_ms += (fin - inicio) * 1000
+                # Antes de task_done: `drain` no debe ver la cola vacia entre medio.
+                self._liberar_clave(key)
+                self._queue.task_done()
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """
+        Deja de aceptar trabajos, espera a que la cola se vacie (hasta `timeout`,
+        por defecto `drain_seconds`) y detiene los workers. Lo que quede sin
+        procesar se descarta y se cuenta en las metricas.
+        """
+        if not self._tasks:
+            return
+        self._closing = True
+        timeout = self.drain_seconds if timeout is None else timeout
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pendientes = self._pendientes
+            self.metrics.descartados_al_cerrar += pendientes
+            self.logger.warning(
+                "Cierre del webhook: %s trabajos sin procesar tras %ss", pendientes, timeout
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._pendientes = 0
+        self._en_curso.clear()
+        self.metrics.en_cola = 0
+
+
+webhook_pool = WebhookWorkerPool.from_env()
@@ -0,0 +1,308 @@
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from src.domain.interfaces.IwhatsappClientRepository import IwhatsappClientRepository
+from src.infrastructure.repository.whatsappAsyncClientRepository import WhatsAppApiError
+
+# Menor numero, mayor prioridad: las respuestas de chat pasan antes que los envios masivos.
+PRIORIDAD_RESPUESTA = 0
+PRIORIDAD_NOTIFICACION = 10
+
+DEFAULT_PHONE_NUMBER_ID = "default"
+DEFAULT_RATE_PER_SECOND = 20.0
+DEFAULT_BURST = 20
+DEFAULT_SENDERS = 4
+# Tras un 429 el numero queda en pausa este tiempo aunque el bucket tenga fichas.
+PAUSA_TRAS_429_SECONDS = 5.0
+# Veces que un envio vuelve a la cola por 429 antes de darse por fallido.
+DEFAULT_REINTENTOS_429 = 5
+
+
+class TokenBucket:
+    """Limitador de `rate` envios por segundo con rafagas de hasta `burst`."""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._actualizado = clock()
+        self._pausa_hasta = 0.0
+
+    def _recargar(self, ahora: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (ahora - self._actualizado) * self.rate)
+        self._actualizado = ahora
+
+    def espera(self) -> float:
+        """Segundos hasta que haya una ficha (0 si ya hay)."""
+        ahora = self._clock()
+        self._recargar(ahora)
+        if ahora < self._pausa_hasta:
+            return self._pausa_hasta - ahora
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def tomar(self) -> None:
+        self._tokens -= 1
+
+    def pausar(self, segundos: float) -> None:
+        self._pausa_hasta = max(self._pausa_hasta, self._clock() + segundos)
+        self._tokens = 0.0
+
+
+@dataclass(order=True)
+class _Envio:
+    prioridad: int
+    secuencia: int
+    encolado_en: float = field(compare=False)
+    metodo: str = field(compare=False)
+    args: tuple = field(compare=False)
+    future: Future = field(compare=False)
+    reintentos_429: int = field(default=0, compare=False)
+
+
+@dataclass
+class _Latencias:
+    enviados: int = 0
+    fallidos: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def registrar(self, ms: float, ok: bool) -> None:
+        if ok:
+            self.enviados += 1
+        else:
+            self.fallidos += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def as_dict(self) -> dict:
+        terminados = self.enviados + self.fallidos
+        return {
+            "enviados": self.enviados,
+            "fallidos": self.fallidos,
+            "latencia_promedio_ms": round(self.total_ms / terminados, 2) if terminados else 0.0,
+            "latencia_max_ms": round(self.max_ms, 2),
+        }
+
+
+class _Numero:
+    def __init__(self, client: IwhatsappClientRepository, bucket: TokenBucket):
+        self.client = client
+        self.bucket = bucket
+        self.cola: List[_Envio] = []
+
+
+class WhatsAppOutbox:
+    """
+    Programador de mensajes salientes. Cada numero de WhatsApp (phone number id)
+    tiene su cola de prioridad y su token bucket; un grupo fijo de hilos toma el
+    envio de mayor prioridad de algun numero con fichas disponibles y lo manda
+    con el cliente de ese numero. Un 429 pausa el numero y devuelve el envio a
+    su lugar en la cola (misma prioridad y orden); el cliente que esta detras no
+    debe reintentar los 429 por su cuenta.
+    """
+
+    def __init__(
+        self,
+        clients: Dict[str, IwhatsappClientRepository],
+        *,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        senders: int = DEFAULT_SENDERS,
+        max_reintentos_429: int = DEFAULT_REINTENTOS_429,
+        clock: Callable[[], float] = time.monotonic,
+        logger: Optional[logging.Logger] = None,
+    ):
+        if not clients:
+            raise ValueError("Se requiere al menos un cliente de WhatsApp")
+        self.default_phone_number_id = next(iter(clients))
+        self.max_reintentos_429 = max_reintentos_429
+        self._clock = clock
+        self._numeros = {
+            phone_id: _Numero(client, TokenBucket(rate_per_second, burst, clock))
+            for phone_id, client in clients.items()
+        }
+        self.logger = logger or logging.getLogger("whatsapp")
+        self._secuencia = itertools.count()
+        self._cond = threading.Condition()
+        self._cerrado = False
+        self._espera_minima: Optional[float] = None
+        self._latencias: Dict[int, _Latencias] = {}
+        self._hilos = [
+            threading.Thread(target=self._despachar, name=f"whatsapp-outbox-{i}", daemon=True)
+            for i in range(senders)
+        ]
+        for hilo in self._hilos:
+            hilo.start()
+
+    def submit(
+        self,
+        metodo: str,
+        *args: Any,
+        prioridad: int = PRIORIDAD_RESPUESTA,
+        phone_number_id: Optional[str] = None,
+    ) -> Future:
+        numero = self._numeros.get(phone_number_id or self.default_phone_number_id)
+        if numero is None:
+            raise ValueError(f"Numero de WhatsApp desconocido: {phone_number_id}")
+        future: Future = Future()
+        with self._cond:
+            if self._cerrado:
+                raise RuntimeError("El programador de WhatsApp esta cerrado")
+            heapq.heappush(
+                numero.cola,
+                _Envio(prioridad, next(self._secuencia), self._clock(), metodo, args, future),
+            )
+            self._cond.notify()
+        return future
+
+    def _siguiente(self) -> Optional[tuple[_Numero, _Envio]]:
+        """Con el lock tomado: el envio listo de mayor prioridad, o None si hay que esperar."""
+        candidato = None
+        espera_minima = None
+        for numero in self._numeros.values():
+            if not numero.cola:
+                continue
+            espera = numero.bucket.espera()
+            if espera > 0:
+                espera_minima = espera if espera_minima is None else min(espera_minima, espera)
+                continue
+            if candidato is None or numero.cola[0] < candidato.cola[0]:
+                candidato = numero
+        if candidato is not None:
+            candidato.bucket.tomar()
+            return candidato, heapq.heappop(candidato.cola)
+        self._espera_minima = espera_minima
+        return None
+
+    def _despachar(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._cerrado and not any(n.cola for n in self._numeros.values()):
+                        return
+                    listo = self._siguiente()
+                    if listo is not None:
+                        break
+                    self._cond.wait(timeout=self._espera_minima)
+            numero, envio = listo
+            self._enviar(numero, envio)
+
+    def _enviar(self, numero: _Numero, envio: _Envio) -> None:
+        # Un envio devuelto a la cola por 429 ya tiene su future en curso.
+        if envio.reintentos_429 == 0 and not envio.future.set_running_or_notify_cancel():
+            return
+        try:
+            resultado = getattr(numero.client, envio.metodo)(*envio.args)
+        except Exception as exc:
+            if getattr(exc, "status_code", None) == 429:
+                with self._cond:
+                    numero.bucket.pausar(PAUSA_TRAS_429_SECONDS)
+                    if envio.reintentos_429 < self.max_reintentos_429:
+                        envio.reintentos_429 += 1
+                        heapq.heappush(numero.cola, envio)
+                        self._cond.notify()
+                        self.logger.warning(
+                            "WhatsApp 429; envio reencolado (%s/%s)",
+                            envio.reintentos_429,
+                            self.max_reintentos_429,
+                        )
+                        return
+            self.logger.error("Envio de WhatsApp fallido: %s", exc)
+            self._registrar(envio, ok=False)
+            envio.future.set_exception(exc)
+            return
+        self._registrar(envio, ok=True)
+        envio.future.set_result(resultado)
+
+    def _registrar(self, envio: _Envio, ok: bool) -> None:
+        ms = (self._clock() - envio.encolado_en) * 1000
+        with self._cond:
+            self._latencias.setdefault(envio.prioridad, _Latencias()).registrar(ms, ok)
+
+    def metrics(self) -> dict:
+        with self._cond:
+            return {
+                "en_cola": {
+                    phone_id: len(numero.cola) for phone_id, numero in self._numeros.items()
+                },
+                "por_prioridad": {
+                    str(prioridad): latencias.as_dict()
+                    for prioridad, latencias in sorted(self._latencias.items())
+                },
+            }
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Deja de aceptar envios, termina los encolados y detiene los hilos."""
+        with self._cond:
+            self._cerrado = True
+            self._cond.notify_all()
+        for hilo in self._hilos:
+            hilo.join(timeout)
+
+
+class ScheduledWhatsAppClient(IwhatsappClientRepository):
+    """
+    `IwhatsappClientRepository` que pasa por el programador con una prioridad
+    fija. Las respuestas esperan el resultado del envio; los envios masivos
+    (`esperar=False`) vuelven apenas quedan en cola.
+    """
+
+    def __init__(
+        self,
+        outbox: WhatsAppOutbox,
+        *,
+        prioridad: int = PRIORIDAD_RESPUESTA,
+        phone_number_id: Optional[str] = None,
+        esperar: bool = True,
+        timeout: float = 120.0,
+    ):
+        self.outbox = outbox
+        self.prioridad = prioridad
+        self.phone_number_id = phone_number_id
+        self.esperar = esperar
+        self.timeout = timeout
+
+    def _enviar(self, metodo: str, *args: Any) -> Dict[str, Any]:
+        future = self.outbox.submit(
+            metodo, *args, prioridad=self.prioridad, phone_number_id=self.phone_number_id
+        )
+        if not self.esperar:
+            return {"status": "queued"}
+        try:
+            return future.result(self.timeout)
+        except FutureTimeoutError as exc:
+            # Si todavia no salio de la cola, ya no se envia.
+            future.cancel()
+            raise WhatsAppApiError(
+                f"WhatsApp API sin respuesta en {self.timeout}s (envio en cola)"
+            ) from exc
+
+    def send_message(self, recipient_id: str, message: str) -> Dict[str, Any]:
+        return self._enviar("send_message", recipient_id, message)
+
+    def send_buttons(
+        self,
+        recipient_id: str,
+        body_text: str,
+        buttons: List[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        return self._enviar("send_buttons", recipient_id, body_text, buttons)
+
+
+def build_outbox(client: IwhatsappClientRepository) -> WhatsAppOutbox:
+    return WhatsAppOutbox(
+        {os.getenv("WHATSAPP_PHONE_NUMBER_ID", DEFAULT_PHONE_NUMBER_ID): client},
+        rate_per_second=float(os.getenv("WHATSAPP_RATE_PER_SECOND", DEFAULT_RATE_PER_SECOND)),
+        burst=int(os.getenv("WHATSAPP_BURST", DEFAULT_BURST)),
+        senders=int(os.getenv("WHATSAPP_SENDERS", DEFAULT_SENDERS)),
+    )
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class CarteraMovimientoResponse(BaseModel):
+    cartera_id: int
+    fecha: datetime
+    monto: Decimal
+    dias: int
+    saldo_acumulado: Decimal
+    notas: Optional[str] = None
+
+
+class CarteraAgingClienteResponse(BaseModel):
+    cliente: Optional[str] = None
+    total_0_30: Decimal = Decimal("0.00")
+    total_31_60: Decimal = Decimal("0.00")
+    total_61_90: Decimal = Decimal("0.00")
+    total_90_mas: Decimal = Decimal("0.00")
+    total: Decimal = Decimal("0.00")
+    documentos: int = 0
+    fecha_mas_antigua: Optional[datetime] = None
+    movimientos: list[CarteraMovimientoResponse] = Field(default_factory=list)
+
+
+class CarteraAgingPageResponse(BaseModel):
+    fecha_corte: date
+    items: list[CarteraAgingClienteResponse] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ConteoStockItem(BaseModel):
+    """
+    Fila de un conteo fisico: codigo de barras escaneado y cantidad contada.
+    """
+
+    codigo_barras: str = Field(..., min_length=1, max_length=64)
+    cantidad: int = Field(..., ge=0)
+
+
+class ConteoStockImportError(BaseModel):
+    row: int
+    message: str
+
+
+class ConteoStockVariacion(BaseModel):
+    producto_id: int
+    codigo_barras: str
+    nombre: Optional[str]
+    cantidad_sistema: int
+    cantidad_contada: int
+    diferencia: int
+    valor_diferencia: Decimal
+
+    model_config = {"from_attributes": True}
+
+
+class ConteoStockResponse(BaseModel):
+    filas: int = 0
+    productos: int = 0
+    ajustados: int = 0
+    sin_diferencia: int = 0
+    invalid: int = 0
+    valor_diferencia_total: Decimal = Decimal("0.00")
+    no_encontrados: list[str] = Field(default_factory=list)
+    errors: list[ConteoStockImportError] = Field(default_factory=list)
+    variaciones: list[ConteoStockVariacion] = Field(default_factory=list)
@@ -1,36 +1,33 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import datetime
 from decimal import Decimal
-from typing import Optional
-from uuid import UUID
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
-from domain.enums.contabilidadEnums import MedioPago
-
 
 class EgresoRequest(BaseModel):
-    fecha: date
     monto: Decimal = Field(..., ge=Decimal("0.00"))
-    medio_pago: MedioPago
-    descripcion: Optional[str] = None
-    categoria_id: UUID
-    whatsapp_user_id: str = Field(..., min_length=1, max_length=255)
-    phone_number: str = Field(..., min_length=1, max_length=50)
-    proveedor: Optional[str] = Field(default=None, max_length=255)
+    tipo_egreso: Literal["efectivo", "transferencia"]
+    fecha: Optional[datetime] = None
+    categoria_id: Optional[int] = None
+    notas: Optional[str] = Field(default=None, max_length=255)
+    cliente: Optional[str] = Field(default=None, max_length=150)
 
 
 class EgresoResponse(BaseModel):
-    id: UUID
-    fecha: date
+    egreso_id: int
     monto: Decimal
-    medio_pago: MedioPago
-    descripcion: Optional[str]
-    categoria_id: UUID
-    whatsapp_user_id: str
-    phone_number: str
-    proveedor: Optional[str] = None
-    created_at: Optional[datetime] = None
+    fecha: datetime
+    tipo_egreso: str
+    categoria_id: Optional[int] = None
+    notas: Optional[str] = None
+    cliente: Optional[str] = None
 
     model_config = {"from_attributes": True}
+
+
+class EgresoPageResponse(BaseModel):
+    items: list[EgresoResponse] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class MargenAgrupacion(str, Enum):
+    PRODUCTO = "producto"
+    CATEGORIA = "categoria"
+    DIA = "dia"
+
+
+class MargenItemResponse(BaseModel):
+    clave: str
+    nombre: Optional[str] = None
+    unidades: int
+    ingresos: Decimal
+    costo: Decimal
+    margen: Decimal
+    margen_pct: Optional[float] = None
+    participacion_acumulada: float
+    pareto: bool
+    lineas_sin_costo: int = 0
+
+
+class MargenPercentilesResponse(BaseModel):
+    p10: Optional[float] = None
+    p50: Optional[float] = None
+    p90: Optional[float] = None
+
+
+class MargenReporteResponse(BaseModel):
+    agrupar: MargenAgrupacion
+    desde: date
+    hasta: date
+    ingresos: Decimal = Decimal("0.00")
+    costo: Decimal = Decimal("0.00")
+    margen: Decimal = Decimal("0.00")
+    margen_pct: Optional[float] = None
+    percentiles_margen_pct: MargenPercentilesResponse = Field(
+        default_factory=MargenPercentilesResponse
+    )
+    grupos_pareto: int = 0
+    items: list[MargenItemResponse] = Field(default_factory=list)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class MovimientoStockRequest(BaseModel):
+    """
+    DTO para registrar un movimiento de stock (entrada o salida segun el tipo).
+    """
+
+    producto_id: int = Field(..., ge=1)
+    tipo_movimiento_id: int = Field(..., ge=1)
+    ref_movimiento_id: int = Field(..., ge=1)
+    cantidad: int = Field(..., gt=0)
+    referencia_doc: Optional[str] = Field(default=None, max_length=64)
+    nota: Optional[str] = Field(default=None, max_length=255)
+    realizado_por_id: Optional[int] = None
+
+
+class MovimientoStockResponse(BaseModel):
+    movimiento_id: int
+    stock_id: int
+    producto_id: int
+    tipo_movimiento_id: int
+    ref_movimiento_id: int
+    cantidad: int
+    fecha_creacion: datetime
+    referencia_doc: Optional[str]
+    nota: Optional[str]
+    realizado_por_id: Optional[int]
+    tipo_movimiento_nombre: Optional[str] = None
+    ref_movimiento_nombre: Optional[str] = None
+
+    model_config = {"from_attributes": True}
+
+
+class MovimientoStockPageResponse(BaseModel):
+    items: list[MovimientoStockResponse] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class StockLedgerResponse(BaseModel):
+    stock_id: int
+    producto_id: int
+    cantidad_actual: int
+    cantidad_ledger: int
+    diferencia: int
+
+    model_config = {"from_attributes": True}
+
+
+class ConciliacionStockResponse(BaseModel):
+    revisados: int
+    con_diferencia: int
+    items: list[StockLedgerResponse] = Field(default_factory=list)
+
+
+class SnapshotStockResponse(BaseModel):
+    creados: int
+    movimiento_id: int
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class SugerenciaReposicionResponse(BaseModel):
+    """
+    DTO con la sugerencia de compra de un producto segun su velocidad de venta.
+    """
+
+    producto_id: int
+    codigo_barras: str
+    nombre: str
+    cantidad_actual: int
+    cantidad_minima: int
+    venta_promedio_diaria: float
+    venta_promedio_7_dias: float
+    dias_cobertura: Optional[float] = None
+    cantidad_sugerida: int
+
+
+class SugerenciasReposicionResponse(BaseModel):
+    desde: date
+    hasta: date
+    productos_evaluados: int
+    items: list[SugerenciaReposicionResponse] = Field(default_factory=list)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+
+class ResultadoMensualResponse(BaseModel):
+    mes: date
+    ventas: Decimal
+    ingresos: Decimal
+    egresos: Decimal
+    resultado: Decimal
+
+    model_config = {"from_attributes": True}
+
+
+class ResumenContableMensualResponse(BaseModel):
+    desde: date
+    hasta: date
+    items: list[ResultadoMensualResponse] = Field(default_factory=list)
+
+
+class ReconstruirResumenContableRequest(BaseModel):
+    desde: date
+    hasta: date
+
+
+class ReconstruirResumenContableResponse(BaseModel):
+    desde: date
+    hasta: date
+    filas: int = Field(..., ge=0)
@@ -31,5 +31,6 @@ class StockResponse(BaseModel):
     ultima_actualizacion: Optional[datetime]
     actualizado_por_id: Optional[int]
     creado_por_id: Optional[int]
+    producto_nombre: Optional[str] = None
 
     model_config = {"from_attributes": True}
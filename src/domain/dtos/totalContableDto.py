@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class TotalContableResponse(BaseModel):
+    mes: date
+    categoria_id: Optional[int] = None
+    categoria_nombre: Optional[str] = None
+    medio_pago: str
+    total: Decimal
+    cantidad: int
+
+    model_config = {"from_attributes": True}
+
+
+class TotalesContablesResponse(BaseModel):
+    # Meses completos: primer dia del primer y del ultimo mes incluidos.
+    desde_mes: Optional[date] = None
+    hasta_mes: Optional[date] = None
+    total: Decimal = Decimal("0.00")
+    items: list[TotalContableResponse] = Field(default_factory=list)
@@ -31,6 +31,7 @@ class VentaDetalleResponse(BaseModel):
     cantidad: int
     precio_unitario: Decimal
     subtotal: Decimal
+    costo_unitario: Optional[Decimal] = None
 
     model_config = {"from_attributes": True}
 
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class CarteraAgingFilaEntity(BaseModel):
+    """
+    Un documento de cartera con su saldo acumulado dentro del cliente y los
+    totales por tramo de antiguedad del cliente (iguales en todas sus filas).
+    """
+
+    cartera_id: int
+    # Clave de paginacion del cliente (distingue sin cliente de cliente "").
+    clave_cliente: str
+    cliente: Optional[str] = None
+    fecha: datetime
+    # Dia del documento segun la base, el mismo que decide su tramo.
+    dia: date
+    monto: Decimal
+    notas: Optional[str] = None
+    saldo_acumulado: Decimal
+    total_0_30: Decimal
+    total_31_60: Decimal
+    total_61_90: Decimal
+    total_90_mas: Decimal
+    total_cliente: Decimal
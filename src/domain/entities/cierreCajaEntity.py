@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class CierreCajaEntity(BaseModel):
+    """
+    Entidad de dominio Pydantic v2 para la tabla `cierre_caja`.
+    """
+
+    cierre_id: Optional[int] = None
+    fecha: date
+    saldo_inicial: Decimal = Decimal("0.00")
+    total_ventas_efectivo: Decimal = Decimal("0.00")
+    total_ingresos: Decimal = Decimal("0.00")
+    total_egresos: Decimal = Decimal("0.00")
+    saldo_teorico: Decimal = Decimal("0.00")
+    saldo_real: Decimal = Decimal("0.00")
+    diferencia: Decimal = Decimal("0.00")
+    fecha_creacion: Optional[datetime] = None
+    observaciones: Optional[str] = Field(default=None, max_length=255)
+    cerrado_por_whatsapp_user_id: Optional[str] = Field(default=None, max_length=255)
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_model(cls, obj: Any) -> "CierreCajaEntity":
+        return cls.model_validate(obj)
+
+
+class MovimientosCajaEntity(BaseModel):
+    """Totales en efectivo del dia y saldo real del cierre anterior."""
+
+    total_ventas_efectivo: Decimal = Decimal("0.00")
+    total_ingresos: Decimal = Decimal("0.00")
+    total_egresos: Decimal = Decimal("0.00")
+    saldo_anterior: Optional[Decimal] = None
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ClienteEntity(BaseModel):
+    """
+    Entidad de dominio Pydantic v2 para los clientes creados desde WhatsApp.
+    """
+
+    id: Optional[UUID] = None
+    nombre: str = Field(..., min_length=1, max_length=255)
+    telefono: Optional[str] = Field(default=None, max_length=100)
+    email: Optional[str] = Field(default=None, max_length=255)
+    created_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_model(cls, obj: Any) -> "ClienteEntity":
+        return cls.model_validate(obj)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from domain.enums.contabilidadEnums import CategoriaTipo
+
+
+class ContabilidadCategoriaEntity(BaseModel):
+    """
+    Entidad de dominio Pydantic v2 para las categorias contables del flujo de WhatsApp.
+    """
+
+    id: Optional[UUID] = None
+    nombre: str = Field(..., min_length=1, max_length=150)
+    tipo: CategoriaTipo
+    descripcion: Optional[str] = None
+    activa: bool = True
+    creada_por_whatsapp_user_id: str = Field(..., min_length=1, max_length=255)
+    created_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_model(cls, obj: Any) -> "ContabilidadCategoriaEntity":
+        return cls.model_validate(obj)
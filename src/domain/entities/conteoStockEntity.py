@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ConteoStockVariacionEntity(BaseModel):
+    """
+    Diferencia entre la cantidad contada en un inventario fisico y `stock.cantidad_actual`.
+    """
+
+    stock_id: int
+    producto_id: int
+    codigo_barras: str
+    nombre: Optional[str] = None
+    cantidad_sistema: int
+    cantidad_contada: int
+    costo: Decimal = Decimal("0.00")
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @property
+    def diferencia(self) -> int:
+        return self.cantidad_contada - self.cantidad_sistema
+
+    @property
+    def valor_diferencia(self) -> Decimal:
+        return Decimal(self.diferencia) * self.costo
+
+    @classmethod
+    def from_model(cls, obj: Any) -> "ConteoStockVariacionEntity":
+        return cls.model_validate(obj)
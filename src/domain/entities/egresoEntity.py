@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class EgresoEntity(BaseModel):
+    """
+    Entidad de dominio Pydantic v2 para la tabla `egreso`.
+    """
+
+    egreso_id: Optional[int] = None
+    monto: Decimal = Field(..., ge=Decimal("0.00"))
+    fecha: Optional[datetime] = None
+    tipo_egreso: str = Field(..., min_length=1)
+    categoria_id: Optional[int] = None
+    notas: Optional[str] = Field(default=None, max_length=255)
+    cliente: Optional[str] = Field(default=None, max_length=150)
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_model(cls, obj: Any) -> "EgresoEntity":
+        return cls.model_validate(obj)
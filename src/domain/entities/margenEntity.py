@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class MargenGrupoEntity(BaseModel):
+    """Ingresos y costo de venta agregados para un producto, categoria o dia."""
+
+    clave: str
+    nombre: Optional[str] = None
+    unidades: int
+    ingresos: Decimal
+    costo: Decimal
+    lineas_sin_costo: int = 0
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class MovimientoStockEntity(BaseModel):
+    """
+    Entidad de dominio Pydantic v2 para la tabla `movimientos_stock`.
+    """
+
+    movimiento_id: Optional[int] = None
+    stock_id: Optional[int] = None
+    producto_id: int = Field(..., ge=1)
+    tipo_movimiento_id: int = Field(..., ge=1)
+    ref_movimiento_id: int = Field(..., ge=1)
+    cantidad: int = Field(..., gt=0)
+    fecha_creacion: Optional[datetime] = None
+    referencia_doc: Optional[str] = None
+    nota: Optional[str] = None
+    realizado_por_id: Optional[int] = None
+    tipo_movimiento_nombre: Optional[str] = None
+    ref_movimiento_nombre: Optional[str] = None
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        validate_assignment=True,
+    )
+
+    @classmethod
+    def from_model(cls, obj: Any) -> "MovimientoStockEntity":
+        return cls.model_validate(obj)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class ResultadoMensualEntity(BaseModel):
+    """Totales de un mes leidos de `resumen_contable_mensual`."""
+
+    mes: date
+    ventas: Decimal = Decimal("0.00")
+    ingresos: Decimal = Decimal("0.00")
+    egresos: Decimal = Decimal("0.00")
+
+    @property
+    def resultado(self) -> Decimal:
+        return self.ventas + self.ingresos - self.egresos
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ResumenVentaDiariaEntity(BaseModel):
+    """
+    Entidad de dominio Pydantic v2 para la tabla `resumen_venta_diaria`.
+    """
+
+    fecha: date
+    total_ventas: Decimal = Field(default=Decimal("0.00"), ge=Decimal("0.00"))
+    total_efectivo: Decimal = Field(default=Decimal("0.00"), ge=Decimal("0.00"))
+    total_tarjeta: Decimal = Field(default=Decimal("0.00"), ge=Decimal("0.00"))
+    total_transferencia: Decimal = Field(default=Decimal("0.00"), ge=Decimal("0.00"))
+    cantidad_transacciones: int = Field(default=0, ge=0)
+    fecha_actualizacion: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_model(cls, obj: Any) -> "ResumenVentaDiariaEntity":
+        return cls.model_validate(obj)
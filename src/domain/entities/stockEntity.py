@@ -18,6 +18,7 @@ class StockEntity(BaseModel):
     ultima_actualizacion: Optional[datetime] = None
     actualizado_por_id: Optional[int] = None
     creado_por_id: Optional[int] = None
+    producto_nombre: Optional[str] = None
 
     model_config = ConfigDict(
         from_attributes=True,
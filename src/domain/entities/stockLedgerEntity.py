@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class StockLedgerEntity(BaseModel):
+    """
+    Cantidad de un stock calculada desde el ledger (snapshot + movimientos)
+    junto a la cantidad_actual almacenada en la tabla `stock`.
+    """
+
+    stock_id: int
+    producto_id: int
+    cantidad_actual: int
+    cantidad_ledger: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @property
+    def diferencia(self) -> int:
+        return self.cantidad_actual - self.cantidad_ledger
+
+    @classmethod
+    def from_model(cls, obj: Any) -> "StockLedgerEntity":
+        return cls.model_validate(obj)
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class TotalContableEntity(BaseModel):
+    """Total de ingresos o egresos para un (mes, categoria, medio de pago)."""
+
+    mes: date
+    categoria_id: Optional[int] = None
+    categoria_nombre: Optional[str] = None
+    medio_pago: str
+    total: Decimal
+    cantidad: int
@@ -17,6 +17,7 @@ class VentaDetalleEntity(BaseModel):
     cantidad: int = Field(..., ge=1)
     precio_unitario: Decimal = Field(..., ge=Decimal("0.00"))
     subtotal: Decimal = Field(..., ge=Decimal("0.00"))
+    costo_unitario: Optional[Decimal] = Field(default=None, ge=Decimal("0.00"))
 
     model_config = ConfigDict(
         from_attributes=True,
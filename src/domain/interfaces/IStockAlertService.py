@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+
+class IStockAlertService(ABC):
+    @abstractmethod
+    def notify_stock_change(self, producto_ids: Iterable[int]) -> None:
+        """
+        Informa que el stock de estos productos cambio en una transaccion confirmada.
+        """
+        ...
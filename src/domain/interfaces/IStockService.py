@@ -1,8 +1,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date
+from typing import Iterable, List, Optional
 
+from domain.dtos.conteoStockDto import ConteoStockItem, ConteoStockResponse
+from domain.dtos.movimientoStockDto import (
+    ConciliacionStockResponse,
+    MovimientoStockPageResponse,
+    MovimientoStockRequest,
+    MovimientoStockResponse,
+    SnapshotStockResponse,
+    StockLedgerResponse,
+)
 from domain.dtos.stockDto import StockRequest, StockResponse
 
 
@@ -22,3 +32,49 @@ class IStockService(ABC):
     @abstractmethod
     def search_stock(self, term: str) -> List[StockResponse]:
         ...
+
+    @abstractmethod
+    def list_low_stock(self) -> List[StockResponse]:
+        ...
+
+    @abstractmethod
+    def registrar_movimiento(self, data: MovimientoStockRequest) -> MovimientoStockResponse:
+        ...
+
+    @abstractmethod
+    def get_stock_ledger(self, stock_id: int) -> Optional[StockLedgerResponse]:
+        ...
+
+    @abstractmethod
+    def conciliar_stock(self) -> ConciliacionStockResponse:
+        ...
+
+    @abstractmethod
+    def crear_snapshots(self) -> SnapshotStockResponse:
+        ...
+
+    @abstractmethod
+    def importar_conteo(
+        self,
+        items: Iterable[ConteoStockItem],
+        *,
+        tipo_entrada_id: int,
+        tipo_salida_id: int,
+        ref_movimiento_id: int,
+        referencia_doc: Optional[str] = None,
+        realizado_por_id: Optional[int] = None,
+    ) -> ConteoStockResponse:
+        ...
+
+    @abstractmethod
+    def list_movimientos(
+        self,
+        producto_id: int,
+        *,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        tipo_movimiento_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> MovimientoStockPageResponse:
+        ...
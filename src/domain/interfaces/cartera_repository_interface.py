@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+
+from domain.entities.carteraEntity import CarteraAgingFilaEntity
+
+
+class CarteraRepositoryInterface(ABC):
+    @abstractmethod
+    def get_aging(
+        self,
+        fecha_corte: date,
+        *,
+        despues_de: Optional[str] = None,
+        limit_clientes: int = 50,
+    ) -> List[CarteraAgingFilaEntity]:
+        """
+        Documentos hasta `fecha_corte` de los primeros `limit_clientes` clientes
+        (ordenados por `clave_cliente`, despues de `despues_de`), ordenados por
+        cliente, fecha e id. Los documentos sin cliente van primero, aparte de
+        los de cliente "".
+        """
+        raise NotImplementedError
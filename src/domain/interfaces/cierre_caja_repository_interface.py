@@ -3,9 +3,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from datetime import date
 from typing import List, Optional
-from uuid import UUID
 
-from domain.entities.cierreCajaEntity import CierreCajaEntity
+from domain.entities.cierreCajaEntity import CierreCajaEntity, MovimientosCajaEntity
 
 
 class CierreCajaRepositoryInterface(ABC):
@@ -14,7 +13,12 @@ class CierreCajaRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_cierre(self, cierre_id: UUID) -> Optional[CierreCajaEntity]:
+    def get_movimientos_caja(self, fecha: date) -> MovimientosCajaEntity:
+        """Totales en efectivo del dia y saldo del cierre previo, en una consulta."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_cierre(self, cierre_id: int) -> Optional[CierreCajaEntity]:
         raise NotImplementedError
 
     @abstractmethod
@@ -26,4 +30,3 @@ class CierreCajaRepositoryInterface(ABC):
         self, *, desde: Optional[date] = None, hasta: Optional[date] = None
     ) -> List[CierreCajaEntity]:
         raise NotImplementedError
-
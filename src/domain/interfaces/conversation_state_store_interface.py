@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass(frozen=True)
+class ConversationState:
+    """Paso del flujo en que esta un remitente, con sus datos parciales."""
+
+    estado: str
+    expira_en: datetime
+    datos: Dict[str, Any] = field(default_factory=dict)
+
+
+class ConversationStateStoreInterface(ABC):
+    """
+    Estado de conversacion por remitente con vencimiento. Un estado vencido se
+    comporta como inexistente: el usuario que abandona un flujo vuelve a empezar.
+    """
+
+    @abstractmethod
+    def get(self, sender: str) -> Optional[ConversationState]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(
+        self, sender: str, estado: str, datos: Optional[Dict[str, Any]] = None
+    ) -> ConversationState:
+        """Crea o reemplaza el estado del remitente y renueva su vencimiento."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self, sender: str) -> None:
+        raise NotImplementedError
+
+    def con_sesion(self, sesion: Callable[[], Any]) -> "ConversationStateStoreInterface":
+        """
+        Vista del store que usa la sesion que entrega `sesion` (sin cerrarla) en
+        vez de abrir una propia. Los stores que no usan base de datos se devuelven
+        tal cual.
+        """
+        return self
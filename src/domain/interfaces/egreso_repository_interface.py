@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from datetime import date
+from datetime import date, datetime
 from typing import List, Optional
-from uuid import UUID
 
 from domain.entities.egresoEntity import EgresoEntity
+from domain.entities.totalContableEntity import TotalContableEntity
 
 
 class EgresoRepositoryInterface(ABC):
@@ -14,12 +14,24 @@ class EgresoRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_egreso(self, egreso_id: UUID) -> Optional[EgresoEntity]:
+    def get_egreso(self, egreso_id: int) -> Optional[EgresoEntity]:
         raise NotImplementedError
 
     @abstractmethod
     def list_egresos(
-        self, *, desde: Optional[date] = None, hasta: Optional[date] = None
+        self,
+        *,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+        despues_de: Optional[tuple[datetime, int]] = None,
+        limit: int = 50,
     ) -> List[EgresoEntity]:
+        """Pagina por (fecha, id) descendente; `despues_de` es el ultimo visto."""
         raise NotImplementedError
 
+    @abstractmethod
+    def get_totales(
+        self, *, desde_mes: Optional[date] = None, hasta_mes: Optional[date] = None
+    ) -> List[TotalContableEntity]:
+        """Totales por mes, categoria y medio de pago, leidos del resumen mensual."""
+        raise NotImplementedError
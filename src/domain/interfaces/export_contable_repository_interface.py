@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Iterator
+
+
+class ExportContableRepositoryInterface(ABC):
+    """
+    Filas crudas para la exportacion contable. Cada metodo devuelve un iterador
+    que lee la base por bloques (cursor del lado del servidor), en el orden de
+    las columnas que documenta.
+    """
+
+    @abstractmethod
+    def iter_ingresos(self, desde: date, hasta: date) -> Iterator[tuple]:
+        """(ingreso_id, fecha, monto, tipo_ingreso, categoria, cliente, notas)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_egresos(self, desde: date, hasta: date) -> Iterator[tuple]:
+        """(egreso_id, fecha, monto, tipo_egreso, categoria, cliente, notas)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_ventas(self, desde: date, hasta: date) -> Iterator[tuple]:
+        """(venta_id, fecha, tipo_pago, subtotal, impuesto, descuento, total, estado)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_cierres(self, desde: date, hasta: date) -> Iterator[tuple]:
+        """
+        (cierre_id, fecha, saldo_inicial, total_ventas_efectivo, total_ingresos,
+        total_egresos, saldo_teorico, saldo_real, diferencia, observaciones)
+        """
+        raise NotImplementedError
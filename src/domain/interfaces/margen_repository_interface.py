@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List
+
+from domain.entities.margenEntity import MargenGrupoEntity
+
+
+class MargenRepositoryInterface(ABC):
+    @abstractmethod
+    def get_margen(self, agrupar: str, desde: date, hasta: date) -> List[MargenGrupoEntity]:
+        """Ingresos y costo de las lineas vendidas, agrupados por producto, categoria o dia."""
+        raise NotImplementedError
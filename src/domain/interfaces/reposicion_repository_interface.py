@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List
+
+
+class ReposicionRepositoryInterface(ABC):
+    """Contrato para las consultas agregadas del motor de reposicion."""
+
+    @abstractmethod
+    def get_catalogo_stock(self) -> List[tuple[int, str, str, int, int]]:
+        """
+        Devuelve una fila por producto activo con stock:
+        (producto_id, codigo_barras, nombre, cantidad_actual, cantidad_minima),
+        ordenadas por producto_id.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_unidades_vendidas_por_dia(
+        self, desde: date, hasta: date
+    ) -> List[tuple[int, date, int]]:
+        """
+        Devuelve (producto_id, dia, unidades) de las ventas activas entre `desde` y
+        `hasta` (inclusive), agregadas en una sola consulta.
+        """
+        raise NotImplementedError
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+
+from domain.entities.resumenContableEntity import ResultadoMensualEntity
+from domain.entities.totalContableEntity import TotalContableEntity
+
+
+class ResumenContableRepositoryInterface(ABC):
+    @abstractmethod
+    def acumular(self, serie: str, registro_id: int) -> None:
+        """Suma el registro a su mes dentro de la transaccion en curso (sin commit)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def reconstruir(self, desde_mes: date, hasta_mes: date) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_totales(
+        self, serie: str, *, desde_mes: Optional[date] = None, hasta_mes: Optional[date] = None
+    ) -> List[TotalContableEntity]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_resultado_mensual(
+        self, desde_mes: date, hasta_mes: date
+    ) -> List[ResultadoMensualEntity]:
+        raise NotImplementedError
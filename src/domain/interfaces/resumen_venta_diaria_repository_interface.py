@@ -3,20 +3,18 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from datetime import date
 from typing import List, Optional
-from uuid import UUID
 
 from domain.entities.resumenVentaDiariaEntity import ResumenVentaDiariaEntity
 
 
 class ResumenVentaDiariaRepositoryInterface(ABC):
     @abstractmethod
-    def create_resumen(
-        self, entity: ResumenVentaDiariaEntity
-    ) -> ResumenVentaDiariaEntity:
+    def acumular_venta(self, venta_id: int) -> None:
+        """Suma la venta a su dia dentro de la transaccion en curso (sin commit)."""
         raise NotImplementedError
 
     @abstractmethod
-    def get_resumen(self, resumen_id: UUID) -> Optional[ResumenVentaDiariaEntity]:
+    def reconstruir(self, desde: date, hasta: date) -> int:
         raise NotImplementedError
 
     @abstractmethod
@@ -28,4 +26,3 @@ class ResumenVentaDiariaRepositoryInterface(ABC):
         self, *, desde: Optional[date] = None, hasta: Optional[date] = None
     ) -> List[ResumenVentaDiariaEntity]:
         raise NotImplementedError
-
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
 
+from domain.entities.conteoStockEntity import ConteoStockVariacionEntity
+from domain.entities.movimientoStockEntity import MovimientoStockEntity
 from domain.entities.stockEntity import StockEntity
+from domain.entities.stockLedgerEntity import StockLedgerEntity
 
 
 class StockRepositoryInterface(ABC):
@@ -28,3 +32,76 @@ class StockRepositoryInterface(ABC):
     def search_stock(self, term: str) -> List[StockEntity]:
         """Busca stock por producto_id, cantidades o estado de texto."""
         raise NotImplementedError
+
+    @abstractmethod
+    def list_low_stock(
+        self, producto_ids: Optional[Iterable[int]] = None
+    ) -> List[StockEntity]:
+        """Devuelve el stock con cantidad_actual <= cantidad_minima, opcionalmente filtrado por productos."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def registrar_movimiento(
+        self, movimiento: MovimientoStockEntity
+    ) -> MovimientoStockEntity:
+        """Persiste un movimiento y actualiza cantidad_actual en la misma transaccion."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_stock_ledger(self, stock_id: int) -> Optional[StockLedgerEntity]:
+        """Calcula la cantidad de un stock como snapshot + movimientos posteriores."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_stock_ledger(self) -> List[StockLedgerEntity]:
+        """Calcula la cantidad del ledger para todo el catalogo en una sola consulta."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def crear_snapshots(self) -> tuple[int, int]:
+        """Crea snapshots para los stocks con movimientos nuevos; devuelve (creados, movimiento_id)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def aplicar_conteo(
+        self,
+        conteos: Dict[str, int],
+        *,
+        tipo_entrada_id: int,
+        tipo_salida_id: int,
+        ref_movimiento_id: int,
+        referencia_doc: Optional[str] = None,
+        realizado_por_id: Optional[int] = None,
+    ) -> tuple[List[ConteoStockVariacionEntity], List[str]]:
+        """
+        Ajusta el stock de un lote de conteos (codigo_barras -> cantidad) en una transaccion.
+        Devuelve las variaciones encontradas y los codigos sin stock registrado.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_movimientos(
+        self,
+        producto_id: int,
+        *,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+        tipo_movimiento_id: Optional[int] = None,
+        despues_de: Optional[tuple[datetime, int]] = None,
+        limit: int = 50,
+    ) -> List[MovimientoStockEntity]:
+        """
+        Lista movimientos de un producto del mas reciente al mas antiguo, paginando
+        por (fecha_creacion, movimiento_id) a partir de `despues_de`.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_nombres_tipo_movimiento(self) -> Dict[int, str]:
+        """Devuelve {tipo_movimiento_id: nombre}."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_nombres_ref_movimiento(self) -> Dict[int, str]:
+        """Devuelve {ref_movimiento_id: nombre}."""
+        raise NotImplementedError
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from itertools import groupby
+from typing import Optional
+
+from domain.dtos.carteraDto import (
+    CarteraAgingClienteResponse,
+    CarteraAgingPageResponse,
+    CarteraMovimientoResponse,
+)
+from domain.interfaces.cartera_repository_interface import CarteraRepositoryInterface
+from domain.services.paginacion import decode_clave, encode_clave
+
+
+class CarteraService:
+    """Antiguedad de cartera por cliente, paginada por nombre de cliente."""
+
+    def __init__(self, repository: CarteraRepositoryInterface):
+        self.repository = repository
+
+    def get_aging(
+        self,
+        *,
+        fecha_corte: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        incluir_movimientos: bool = False,
+    ) -> CarteraAgingPageResponse:
+        fecha_corte = fecha_corte or datetime.now(timezone.utc).date()
+        filas = self.repository.get_aging(
+            fecha_corte,
+            despues_de=decode_clave(cursor) if cursor else None,
+            limit_clientes=limit + 1,
+        )
+
+        clientes = [
+            (clave, list(documentos))
+            for clave, documentos in groupby(filas, key=lambda fila: fila.clave_cliente)
+        ]
+        has_more = len(clientes) > limit
+        clientes = clientes[:limit]
+
+        items = []
+        for _, documentos in clientes:
+            primero = documentos[0]
+            items.append(
+                CarteraAgingClienteResponse(
+                    cliente=primero.cliente,
+                    total_0_30=primero.total_0_30,
+                    total_31_60=primero.total_31_60,
+                    total_61_90=primero.total_61_90,
+                    total_90_mas=primero.total_90_mas,
+                    total=primero.total_cliente,
+                    documentos=len(documentos),
+                    fecha_mas_antigua=primero.fecha,
+                    movimientos=[
+                        CarteraMovimientoResponse(
+                            cartera_id=doc.cartera_id,
+                            fecha=doc.fecha,
+                            monto=doc.monto,
+                            dias=(fecha_corte - doc.dia).days,
+                            saldo_acumulado=doc.saldo_acumulado,
+                            notas=doc.notas,
+                        )
+                        for doc in documentos
+                    ]
+                    if incluir_movimientos
+                    else [],
+                )
+            )
+
+        next_cursor = encode_clave(clientes[-1][0]) if has_more and clientes else None
+        return CarteraAgingPageResponse(
+            fecha_corte=fecha_corte,
+            items=items,
+            next_cursor=next_cursor,
+        )
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from datetime import date
+from decimal import Decimal
 from typing import List, Optional
-from uuid import UUID
 
-from domain.dtos.cierreCajaDto import CierreCajaRequest, CierreCajaResponse
+from domain.dtos.cierreCajaDto import CalcularCierreCajaRequest, CierreCajaResponse
 from domain.entities.cierreCajaEntity import CierreCajaEntity
 from domain.interfaces.cierre_caja_repository_interface import (
     CierreCajaRepositoryInterface,
@@ -15,22 +15,41 @@ class CierreCajaService:
     def __init__(self, repository: CierreCajaRepositoryInterface):
         self.repository = repository
 
-    def create_cierre(self, data: CierreCajaRequest) -> CierreCajaResponse:
+    def calcular_cierre(
+        self, fecha: date, data: CalcularCierreCajaRequest
+    ) -> CierreCajaResponse:
+        """
+        Cierra la caja del dia con los totales en efectivo calculados desde ventas,
+        ingresos y egresos. El saldo inicial es el saldo real del cierre anterior;
+        solo el saldo real contado lo aporta el usuario.
+        """
+        if self.repository.get_by_fecha(fecha):
+            raise ValueError("Ya existe un cierre de caja para la fecha")
+
+        movimientos = self.repository.get_movimientos_caja(fecha)
+        saldo_inicial = movimientos.saldo_anterior or Decimal("0.00")
+        saldo_teorico = (
+            saldo_inicial
+            + movimientos.total_ventas_efectivo
+            + movimientos.total_ingresos
+            - movimientos.total_egresos
+        )
         entity = CierreCajaEntity(
-            fecha=data.fecha,
-            saldo_inicial=data.saldo_inicial,
-            total_ingresos=data.total_ingresos,
-            total_egresos=data.total_egresos,
-            saldo_teorico=data.saldo_teorico,
+            fecha=fecha,
+            saldo_inicial=saldo_inicial,
+            total_ventas_efectivo=movimientos.total_ventas_efectivo,
+            total_ingresos=movimientos.total_ingresos,
+            total_egresos=movimientos.total_egresos,
+            saldo_teorico=saldo_teorico,
             saldo_real=data.saldo_real,
-            diferencia=data.diferencia,
+            diferencia=data.saldo_real - saldo_teorico,
             observaciones=data.observaciones,
             cerrado_por_whatsapp_user_id=data.cerrado_por_whatsapp_user_id,
         )
         created = self.repository.create_cierre(entity)
         return CierreCajaResponse.model_validate(created)
 
-    def get_cierre(self, cierre_id: UUID) -> Optional[CierreCajaResponse]:
+    def get_cierre(self, cierre_id: int) -> Optional[CierreCajaResponse]:
         cierre = self.repository.get_cierre(cierre_id)
         if not cierre:
             return None
@@ -47,4 +66,3 @@ class CierreCajaService:
     ) -> List[CierreCajaResponse]:
         cierres = self.repository.list_cierres(desde=desde, hasta=hasta)
         return [CierreCajaResponse.model_validate(c) for c in cierres]
-
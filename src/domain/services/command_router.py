@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+EXACTO = "exacto"
+PREFIJO = "prefijo"
+
+
+def solo_digitos(sender: Optional[str]) -> str:
+    return "".join(ch for ch in sender or "" if ch.isdigit())
+
+
+class SenderAllowlist:
+    """
+    Remitentes permitidos comparando los ultimos digitos, para tolerar prefijos
+    de pais ("57", "+57"). Se agrupan por largo: cada consulta hace un lookup por
+    largo distinto en vez de recorrer toda la lista.
+    """
+
+    def __init__(self, numeros: Iterable[str]):
+        self._por_largo: dict[int, frozenset[str]] = {}
+        for numero in numeros:
+            digitos = solo_digitos(numero)
+            if digitos:
+                actuales = self._por_largo.get(len(digitos), frozenset())
+                self._por_largo[len(digitos)] = actuales | {digitos}
+
+    def __bool__(self) -> bool:
+        return bool(self._por_largo)
+
+    def is_allowed(self, sender: Optional[str]) -> bool:
+        digitos = solo_digitos(sender)
+        if not digitos:
+            return False
+        return any(
+            len(digitos) >= largo and digitos[-largo:] in numeros
+            for largo, numeros in self._por_largo.items()
+        )
+
+
+@dataclass(frozen=True)
+class Command:
+    """
+    Comando de chat. `modo` EXACTO exige que el texto completo sea un alias;
+    PREFIJO acepta cualquier texto que empiece por un alias. Si `remitentes`
+    no esta vacio, solo esos numeros pueden usarlo.
+    """
+
+    nombre: str
+    alias: tuple[str, ...]
+    modo: str = EXACTO
+    ignorar_mayusculas: bool = True
+    remitentes: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class CommandMatch:
+    comando: Command
+    texto: str
+    # Lo que sigue al alias en los comandos PREFIJO ("" en los EXACTO).
+    argumento: str = ""
+
+
+class _Nodo:
+    __slots__ = ("hijos", "comando")
+
+    def __init__(self):
+        self.hijos: dict[str, _Nodo] = {}
+        self.comando: Optional[Command] = None
+
+
+class CommandRouter:
+    """
+    Compila los comandos una sola vez: los EXACTO van a tablas hash (una con los
+    alias tal cual y otra normalizada con `casefold`) y los PREFIJO a un trie.
+    `route` cuesta O(len(texto)) sin importar cuantos comandos haya: dos lookups
+    y un recorrido del trie que se queda con el prefijo mas largo. Un alias
+    EXACTO gana sobre un PREFIJO.
+    """
+
+    def __init__(self, comandos: Iterable[Command]):
+        self.comandos = tuple(comandos)
+        self._exactos: dict[str, Command] = {}
+        self._exactos_plegados: dict[str, Command] = {}
+        self._trie = _Nodo()
+        self._trie_plegado = _Nodo()
+        self._permisos: dict[str, SenderAllowlist] = {}
+
+        for comando in self.comandos:
+            if comando.modo not in (EXACTO, PREFIJO):
+                raise ValueError(f"Modo de comando desconocido: {comando.modo}")
+            if comando.remitentes:
+                self._permisos[comando.nombre] = SenderAllowlist(comando.remitentes)
+            for alias in comando.alias:
+                alias = alias.strip()
+                if not alias:
+                    raise ValueError(f"Alias vacio en el comando {comando.nombre}")
+                if comando.ignorar_mayusculas:
+                    alias = alias.casefold()
+                if comando.modo == EXACTO:
+                    tabla = self._exactos_plegados if comando.ignorar_mayusculas else self._exactos
+                    self._registrar(tabla, alias, comando)
+                else:
+                    raiz = self._trie_plegado if comando.ignorar_mayusculas else self._trie
+                    self._insertar(raiz, alias, comando)
+
+    @staticmethod
+    def _registrar(tabla: dict[str, Command], alias: str, comando: Command) -> None:
+        previo = tabla.get(alias)
+        if previo is not None and previo.nombre != comando.nombre:
+            raise ValueError(f"Alias '{alias}' repetido en {previo.nombre} y {comando.nombre}")
+        tabla[alias] = comando
+
+    @staticmethod
+    def _insertar(raiz: _Nodo, alias: str, comando: Command) -> None:
+        nodo = raiz
+        for ch in alias:
+            nodo = nodo.hijos.setdefault(ch, _Nodo())
+        if nodo.comando is not None and nodo.comando.nombre != comando.nombre:
+            raise ValueError(f"Alias '{alias}' repetido en {nodo.comando.nombre} y {comando.nombre}")
+        nodo.comando = comando
+
+    @staticmethod
+    def _prefijo(raiz: _Nodo, texto: str) -> tuple[Optional[Command], int]:
+        nodo, encontrado, largo = raiz, None, 0
+        for i, ch in enumerate(texto):
+            nodo = nodo.hijos.get(ch)
+            if nodo is None:
+                break
+            if nodo.comando is not None:
+                encontrado, largo = nodo.comando, i + 1
+        return encontrado, largo
+
+    def permitido(self, comando: Command, sender: Optional[str]) -> bool:
+        permisos = self._permisos.get(comando.nombre)
+        return permisos is None or permisos.is_allowed(sender)
+
+    def route(self, text: Optional[str], sender: Optional[str] = None) -> Optional[CommandMatch]:
+        """
+        Devuelve el comando que corresponde al texto, o None si no hay ninguno o
+        el remitente no tiene permiso para usarlo.
+        """
+        if not text:
+            return None
+        texto = text.strip()
+        if not texto:
+            return None
+        plegado = texto.casefold()
+
+        comando = self._exactos.get(texto) or self._exactos_plegados.get(plegado)
+        argumento = ""
+        if comando is None:
+            comando, largo = self._prefijo(self._trie, texto)
+            comando_plegado, largo_plegado = self._prefijo(self._trie_plegado, plegado)
+            origen = texto
+            if comando_plegado is not None and largo_plegado > largo:
+                comando, largo = comando_plegado, largo_plegado
+                # casefold puede cambiar el largo ("ß" -> "ss"); entonces se corta el plegado.
+                if len(plegado) != len(texto):
+                    origen = plegado
+            if comando is None:
+                return None
+            argumento = origen[largo:].strip()
+
+        if not self.permitido(comando, sender):
+            return None
+        return CommandMatch(comando=comando, texto=texto, argumento=argumento)
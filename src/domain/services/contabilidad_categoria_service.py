@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from types import MappingProxyType
+from typing import List, Mapping, Optional
 from uuid import UUID
 
 from domain.dtos.contabilidadCategoriaDto import (
@@ -12,11 +13,63 @@ from domain.enums.contabilidadEnums import CategoriaTipo
 from domain.interfaces.contabilidad_categoria_repository_interface import (
     ContabilidadCategoriaRepositoryInterface,
 )
+from domain.services.snapshot_cache import SnapshotCache, normalizar_nombre
+
+
+class CategoriasSnapshot:
+    """Foto inmutable de las categorias, indexada por id, nombre y (tipo, activa)."""
+
+    def __init__(self, categorias: List[ContabilidadCategoriaResponse], cargado_en: float):
+        self.cargado_en = cargado_en
+        self.todas = tuple(categorias)
+        self.por_id: Mapping[UUID, ContabilidadCategoriaResponse] = MappingProxyType(
+            {c.id: c for c in categorias}
+        )
+        self.por_nombre: Mapping[str, ContabilidadCategoriaResponse] = MappingProxyType(
+            {normalizar_nombre(c.nombre): c for c in categorias}
+        )
+        por_filtro: dict[tuple, tuple[ContabilidadCategoriaResponse, ...]] = {}
+        for tipo in (*CategoriaTipo, None):
+            for activa in (True, False, None):
+                por_filtro[(tipo, activa)] = tuple(
+                    c
+                    for c in categorias
+                    if (tipo is None or c.tipo == tipo) and (activa is None or c.activa == activa)
+                )
+        self.por_filtro: Mapping[tuple, tuple[ContabilidadCategoriaResponse, ...]] = (
+            MappingProxyType(por_filtro)
+        )
+
+
+class CategoriasContablesCache(
+    SnapshotCache[ContabilidadCategoriaRepositoryInterface, CategoriasSnapshot]
+):
+    """
+    Cache en proceso de las categorias contables. Se carga completa con una sola
+    consulta y se descarta cuando vence el TTL o cuando el servicio escribe una
+    categoria.
+    """
+
+    def _leer(
+        self, repository: ContabilidadCategoriaRepositoryInterface, cargado_en: float
+    ) -> CategoriasSnapshot:
+        categorias = [
+            ContabilidadCategoriaResponse.model_validate(c) for c in repository.list_categorias()
+        ]
+        return CategoriasSnapshot(categorias, cargado_en)
+
+
+categorias_cache = CategoriasContablesCache()
 
 
 class ContabilidadCategoriaService:
-    def __init__(self, repository: ContabilidadCategoriaRepositoryInterface):
+    def __init__(
+        self,
+        repository: ContabilidadCategoriaRepositoryInterface,
+        cache: Optional[CategoriasContablesCache] = None,
+    ):
         self.repository = repository
+        self.cache = cache or categorias_cache
 
     def create_categoria(
         self, data: ContabilidadCategoriaRequest
@@ -28,24 +81,26 @@ class ContabilidadCategoriaService:
             activa=data.activa,
             creada_por_whatsapp_user_id=data.creada_por_whatsapp_user_id,
         )
-        created = self.repository.create_categoria(entity)
+        try:
+            created = self.repository.create_categoria(entity)
+        finally:
+            # Tambien si falla: la escritura pudo confirmarse antes del error.
+            self.cache.invalidate()
         return ContabilidadCategoriaResponse.model_validate(created)
 
     def list_categorias(
         self, *, tipo: Optional[CategoriaTipo] = None, activa: Optional[bool] = None
     ) -> List[ContabilidadCategoriaResponse]:
-        categorias = self.repository.list_categorias(tipo=tipo, activa=activa)
-        return [ContabilidadCategoriaResponse.model_validate(c) for c in categorias]
+        return list(self.cache.get(self.repository).por_filtro[(tipo, activa)])
 
     def get_categoria(self, categoria_id: UUID) -> Optional[ContabilidadCategoriaResponse]:
-        categoria = self.repository.get_categoria(categoria_id)
-        if not categoria:
-            return None
-        return ContabilidadCategoriaResponse.model_validate(categoria)
+        categoria = self.cache.get(self.repository).por_id.get(categoria_id)
+        if categoria is None:
+            # Puede haberse creado en otro proceso: una recarga (limitada) antes de rechazarlo.
+            categoria = self.cache.recargar(self.repository).por_id.get(categoria_id)
+        return categoria
 
     def get_by_nombre(self, nombre: str) -> Optional[ContabilidadCategoriaResponse]:
-        categoria = self.repository.get_by_nombre(nombre)
-        if not categoria:
-            return None
-        return ContabilidadCategoriaResponse.model_validate(categoria)
-
+        # Sin recarga al fallar: los nombres vienen de texto libre del chat y un
+        # nombre desconocido es habitual; las altas de otros procesos llegan con el TTL.
+        return self.cache.get(self.repository).por_nombre.get(normalizar_nombre(nombre))
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from datetime import date
-from typing import List, Optional
-from uuid import UUID
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Optional
 
-from domain.dtos.egresoDto import EgresoRequest, EgresoResponse
+from domain.dtos.egresoDto import EgresoPageResponse, EgresoRequest, EgresoResponse
+from domain.dtos.totalContableDto import TotalContableResponse, TotalesContablesResponse
 from domain.entities.egresoEntity import EgresoEntity
 from domain.interfaces.egreso_repository_interface import EgresoRepositoryInterface
+from domain.services.paginacion import decode_cursor, encode_cursor, inicio_dia
 
 
 class EgresoService:
@@ -15,26 +17,64 @@ class EgresoService:
 
     def create_egreso(self, data: EgresoRequest) -> EgresoResponse:
         entity = EgresoEntity(
-            fecha=data.fecha,
             monto=data.monto,
-            medio_pago=data.medio_pago,
-            descripcion=data.descripcion,
+            fecha=data.fecha,
+            tipo_egreso=data.tipo_egreso,
             categoria_id=data.categoria_id,
-            whatsapp_user_id=data.whatsapp_user_id,
-            phone_number=data.phone_number,
-            proveedor=data.proveedor,
+            notas=data.notas,
+            cliente=data.cliente,
         )
         created = self.repository.create_egreso(entity)
         return EgresoResponse.model_validate(created)
 
-    def get_egreso(self, egreso_id: UUID) -> Optional[EgresoResponse]:
+    def get_egreso(self, egreso_id: int) -> Optional[EgresoResponse]:
         egreso = self.repository.get_egreso(egreso_id)
         if not egreso:
             return None
         return EgresoResponse.model_validate(egreso)
 
     def list_egresos(
-        self, *, desde: Optional[date] = None, hasta: Optional[date] = None
-    ) -> List[EgresoResponse]:
-        egresos = self.repository.list_egresos(desde=desde, hasta=hasta)
-        return [EgresoResponse.model_validate(e) for e in egresos]
+        self,
+        *,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> EgresoPageResponse:
+        egresos = self.repository.list_egresos(
+            desde=inicio_dia(desde) if desde else None,
+            hasta=inicio_dia(hasta + timedelta(days=1)) if hasta else None,
+            despues_de=decode_cursor(cursor) if cursor else None,
+            limit=limit + 1,
+        )
+        has_more = len(egresos) > limit
+        egresos = egresos[:limit]
+
+        next_cursor = None
+        if has_more and egresos:
+            last = egresos[-1]
+            next_cursor = encode_cursor(last.fecha, last.egreso_id)
+        return EgresoPageResponse(
+            items=[EgresoResponse.model_validate(item) for item in egresos],
+            next_cursor=next_cursor,
+        )
+
+    def get_totales(
+        self, *, desde_mes: Optional[date] = None, hasta_mes: Optional[date] = None
+    ) -> TotalesContablesResponse:
+        """
+        Totales por meses completos, de `desde_mes` a `hasta_mes` inclusive. Ambos
+        deben ser el primer dia de su mes: el resumen no sabe cortar a mitad de mes.
+        """
+        for nombre, mes in (("desde_mes", desde_mes), ("hasta_mes", hasta_mes)):
+            if mes is not None and mes.day != 1:
+                raise ValueError(f"{nombre} debe ser el primer dia de un mes")
+        if desde_mes and hasta_mes and desde_mes > hasta_mes:
+            raise ValueError("La fecha desde no puede ser mayor que hasta")
+        totales = self.repository.get_totales(desde_mes=desde_mes, hasta_mes=hasta_mes)
+        return TotalesContablesResponse(
+            desde_mes=desde_mes,
+            hasta_mes=hasta_mes,
+            total=sum((t.total for t in totales), Decimal("0.00")),
+            items=[TotalContableResponse.model_validate(t) for t in totales],
+        )
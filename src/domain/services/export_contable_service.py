@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import BinaryIO
+
+from openpyxl import Workbook
+
+from domain.interfaces.export_contable_repository_interface import (
+    ExportContableRepositoryInterface,
+)
+
+# (hoja, metodo del repositorio, encabezados en el orden de sus filas)
+HOJAS = (
+    (
+        "Ingresos",
+        "iter_ingresos",
+        ["ingreso_id", "fecha", "monto", "tipo_ingreso", "categoria", "cliente", "notas"],
+    ),
+    (
+        "Egresos",
+        "iter_egresos",
+        ["egreso_id", "fecha", "monto", "tipo_egreso", "categoria", "cliente", "notas"],
+    ),
+    (
+        "Ventas",
+        "iter_ventas",
+        ["venta_id", "fecha", "tipo_pago", "subtotal", "impuesto", "descuento", "total", "estado"],
+    ),
+    (
+        "Cierres",
+        "iter_cierres",
+        [
+            "cierre_id",
+            "fecha",
+            "saldo_inicial",
+            "total_ventas_efectivo",
+            "total_ingresos",
+            "total_egresos",
+            "saldo_teorico",
+            "saldo_real",
+            "diferencia",
+            "observaciones",
+        ],
+    ),
+)
+
+
+def _celda(valor):
+    # Excel no guarda zona horaria: las fechas se exportan en UTC.
+    if isinstance(valor, datetime) and valor.tzinfo is not None:
+        return valor.astimezone(timezone.utc).replace(tzinfo=None)
+    return valor
+
+
+class ExportContableService:
+    """Exporta ingresos, egresos, ventas y cierres de un periodo a un libro XLSX."""
+
+    def __init__(self, repository: ExportContableRepositoryInterface):
+        self.repository = repository
+
+    def escribir_xlsx(self, desde: date, hasta: date, destino: BinaryIO) -> None:
+        """
+        Escribe el libro en `destino` fila a fila: el modo `write_only` de openpyxl
+        vuelca cada hoja a disco y las filas llegan por bloques desde la base, asi
+        que la memoria no crece con el largo del periodo.
+        """
+        if desde > hasta:
+            raise ValueError("La fecha desde no puede ser mayor que hasta")
+
+        workbook = Workbook(write_only=True)
+        for titulo, metodo, columnas in HOJAS:
+            sheet = workbook.create_sheet(titulo)
+            sheet.append(columnas)
+            for fila in getattr(self.repository, metodo)(desde, hasta):
+                sheet.append([_celda(valor) for valor in fila])
+        workbook.save(destino)
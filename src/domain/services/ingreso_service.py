@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from datetime import date
-from typing import List, Optional
-from uuid import UUID
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Optional
 
-from domain.dtos.ingresoDto import IngresoRequest, IngresoResponse
+from domain.dtos.ingresoDto import IngresoPageResponse, IngresoRequest, IngresoResponse
+from domain.dtos.totalContableDto import TotalContableResponse, TotalesContablesResponse
 from domain.entities.ingresoEntity import IngresoEntity
 from domain.interfaces.ingreso_repository_interface import IngresoRepositoryInterface
+from domain.services.paginacion import decode_cursor, encode_cursor, inicio_dia
 
 
 class IngresoService:
@@ -15,26 +17,64 @@ class IngresoService:
 
     def create_ingreso(self, data: IngresoRequest) -> IngresoResponse:
         entity = IngresoEntity(
-            fecha=data.fecha,
             monto=data.monto,
-            medio_pago=data.medio_pago,
-            descripcion=data.descripcion,
-            categoria_id=data.categoria_id,
-            whatsapp_user_id=data.whatsapp_user_id,
-            phone_number=data.phone_number,
+            fecha=data.fecha,
+            tipo_ingreso=data.tipo_ingreso,
+            categoria_contabilidad_id=data.categoria_contabilidad_id,
+            notas=data.notas,
             cliente=data.cliente,
         )
         created = self.repository.create_ingreso(entity)
         return IngresoResponse.model_validate(created)
 
-    def get_ingreso(self, ingreso_id: UUID) -> Optional[IngresoResponse]:
+    def get_ingreso(self, ingreso_id: int) -> Optional[IngresoResponse]:
         ingreso = self.repository.get_ingreso(ingreso_id)
         if not ingreso:
             return None
         return IngresoResponse.model_validate(ingreso)
 
     def list_ingresos(
-        self, *, desde: Optional[date] = None, hasta: Optional[date] = None
-    ) -> List[IngresoResponse]:
-        ingresos = self.repository.list_ingresos(desde=desde, hasta=hasta)
-        return [IngresoResponse.model_validate(i) for i in ingresos]
+        self,
+        *,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> IngresoPageResponse:
+        ingresos = self.repository.list_ingresos(
+            desde=inicio_dia(desde) if desde else None,
+            hasta=inicio_dia(hasta + timedelta(days=1)) if hasta else None,
+            despues_de=decode_cursor(cursor) if cursor else None,
+            limit=limit + 1,
+        )
+        has_more = len(ingresos) > limit
+        ingresos = ingresos[:limit]
+
+        next_cursor = None
+        if has_more and ingresos:
+            last = ingresos[-1]
+            next_cursor = encode_cursor(last.fecha, last.ingreso_id)
+        return IngresoPageResponse(
+            items=[IngresoResponse.model_validate(item) for item in ingresos],
+            next_cursor=next_cursor,
+        )
+
+    def get_totales(
+        self, *, desde_mes: Optional[date] = None, hasta_mes: Optional[date] = None
+    ) -> TotalesContablesResponse:
+        """
+        Totales por meses completos, de `desde_mes` a `hasta_mes` inclusive. Ambos
+        deben ser el primer dia de su mes: el resumen no sabe cortar a mitad de mes.
+        """
+        for nombre, mes in (("desde_mes", desde_mes), ("hasta_mes", hasta_mes)):
+            if mes is not None and mes.day != 1:
+                raise ValueError(f"{nombre} debe ser el primer dia de un mes")
+        if desde_mes and hasta_mes and desde_mes > hasta_mes:
+            raise ValueError("La fecha desde no puede ser mayor que hasta")
+        totales = self.repository.get_totales(desde_mes=desde_mes, hasta_mes=hasta_mes)
+        return TotalesContablesResponse(
+            desde_mes=desde_mes,
+            hasta_mes=hasta_mes,
+            total=sum((t.total for t in totales), Decimal("0.00")),
+            items=[TotalContableResponse.model_validate(t) for t in totales],
+        )
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+
+from domain.dtos.margenDto import (
+    MargenAgrupacion,
+    MargenItemResponse,
+    MargenPercentilesResponse,
+    MargenReporteResponse,
+)
+from domain.interfaces.margen_repository_interface import MargenRepositoryInterface
+
+PARETO_UMBRAL = 0.8
+
+
+def analizar_margen(ingresos: np.ndarray, costo: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Margen porcentual, percentiles y curva de Pareto del margen en una pasada
+    vectorizada. Un grupo es Pareto si hace falta para llegar al 80% del margen
+    positivo acumulado (ordenando de mayor a menor margen).
+    """
+    margen = ingresos - costo
+    margen_pct = np.full(len(ingresos), np.nan)
+    np.divide(margen * 100, ingresos, out=margen_pct, where=ingresos > 0)
+
+    orden = np.argsort(-margen, kind="stable")
+    positivo = np.clip(margen[orden], 0, None)
+    total_positivo = positivo.sum()
+    acumulada = np.zeros(len(ingresos))
+    pareto = np.zeros(len(ingresos), dtype=bool)
+    if total_positivo > 0:
+        acumulada_ordenada = np.cumsum(positivo) / total_positivo
+        acumulada[orden] = acumulada_ordenada
+        pareto[orden] = (acumulada_ordenada - positivo / total_positivo < PARETO_UMBRAL) & (
+            positivo > 0
+        )
+
+    finitos = margen_pct[np.isfinite(margen_pct)]
+    percentiles = (
+        np.percentile(finitos, [10, 50, 90]) if finitos.size else np.full(3, np.nan)
+    )
+    return {
+        "margen_pct": margen_pct,
+        "orden": orden,
+        "acumulada": acumulada,
+        "pareto": pareto,
+        "percentiles": percentiles,
+    }
+
+
+def _opcional(valor: float) -> float | None:
+    return None if np.isnan(valor) else round(float(valor), 2)
+
+
+class MargenService:
+    """Reporte de margen bruto por producto, categoria o dia."""
+
+    def __init__(self, repository: MargenRepositoryInterface):
+        self.repository = repository
+
+    def get_reporte(
+        self, agrupar: MargenAgrupacion, desde: date, hasta: date
+    ) -> MargenReporteResponse:
+        if desde > hasta:
+            raise ValueError("La fecha desde no puede ser mayor que hasta")
+
+        grupos = self.repository.get_margen(agrupar.value, desde, hasta)
+        n = len(grupos)
+        ingresos = np.fromiter((float(g.ingresos) for g in grupos), dtype=np.float64, count=n)
+        costo = np.fromiter((float(g.costo) for g in grupos), dtype=np.float64, count=n)
+        analisis = analizar_margen(ingresos, costo)
+
+        if agrupar == MargenAgrupacion.DIA:
+            orden = sorted(range(n), key=lambda i: grupos[i].clave)
+        else:
+            orden = analisis["orden"].tolist()
+
+        items = [
+            MargenItemResponse(
+                clave=grupos[i].clave,
+                nombre=grupos[i].nombre,
+                unidades=grupos[i].unidades,
+                ingresos=grupos[i].ingresos,
+                costo=grupos[i].costo,
+                margen=grupos[i].ingresos - grupos[i].costo,
+                margen_pct=_opcional(analisis["margen_pct"][i]),
+                participacion_acumulada=round(float(analisis["acumulada"][i]), 4),
+                pareto=bool(analisis["pareto"][i]),
+                lineas_sin_costo=grupos[i].lineas_sin_costo,
+            )
+            for i in orden
+        ]
+
+        total_ingresos = sum((g.ingresos for g in grupos), Decimal("0.00"))
+        total_costo = sum((g.costo for g in grupos), Decimal("0.00"))
+        total_margen = total_ingresos - total_costo
+        p10, p50, p90 = analisis["percentiles"]
+        return MargenReporteResponse(
+            agrupar=agrupar,
+            desde=desde,
+            hasta=hasta,
+            ingresos=total_ingresos,
+            costo=total_costo,
+            margen=total_margen,
+            margen_pct=(
+                round(float(total_margen * 100 / total_ingresos), 2) if total_ingresos else None
+            ),
+            percentiles_margen_pct=MargenPercentilesResponse(
+                p10=_opcional(p10), p50=_opcional(p50), p90=_opcional(p90)
+            ),
+            grupos_pareto=int(analisis["pareto"].sum()),
+            items=items,
+        )
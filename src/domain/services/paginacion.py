@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import base64
+from datetime import date, datetime, time, timezone
+
+
+def encode_cursor(fecha: datetime, registro_id: int) -> str:
+    raw = f"{fecha.isoformat()}|{registro_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        fecha, registro_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(fecha), int(registro_id)
+    except Exception as exc:
+        raise ValueError("Cursor invalido") from exc
+
+
+def inicio_dia(fecha: date) -> datetime:
+    return datetime.combine(fecha, time.min, tzinfo=timezone.utc)
+
+
+def encode_clave(clave: str) -> str:
+    return base64.urlsafe_b64encode(clave.encode()).decode()
+
+
+def decode_clave(cursor: str) -> str:
+    try:
+        return base64.b64decode(cursor.encode(), altchars=b"-_", validate=True).decode()
+    except Exception as exc:
+        raise ValueError("Cursor invalido") from exc
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Sequence
+
+import numpy as np
+
+from domain.dtos.reposicionDto import (
+    SugerenciaReposicionResponse,
+    SugerenciasReposicionResponse,
+)
+from domain.interfaces.reposicion_repository_interface import (
+    ReposicionRepositoryInterface,
+)
+
+
+def calcular_reposicion(
+    producto_ids: np.ndarray,
+    cantidad_actual: np.ndarray,
+    cantidad_minima: np.ndarray,
+    ventas: Sequence[tuple[int, date, int]],
+    *,
+    desde: date,
+    dias_historia: int,
+    dias_lead_time: int,
+    dias_cobertura_objetivo: int,
+) -> dict[str, np.ndarray]:
+    """
+    Calcula velocidad de venta, dias de cobertura y cantidad sugerida para todo el
+    catalogo con operaciones vectorizadas. `producto_ids` debe venir ordenado.
+    """
+    n = len(producto_ids)
+    matriz = np.zeros((n, dias_historia), dtype=np.float64)
+
+    if ventas and n:
+        v_producto, v_dia, v_unidades = zip(*ventas)
+        v_producto = np.asarray(v_producto, dtype=np.int64)
+        v_offset = (
+            np.asarray(v_dia, dtype="datetime64[D]") - np.datetime64(desde, "D")
+        ).astype(np.int64)
+        v_unidades = np.asarray(v_unidades, dtype=np.float64)
+
+        idx = np.searchsorted(producto_ids, v_producto)
+        idx_seguro = np.minimum(idx, n - 1)
+        validos = (
+            (idx < n)
+            & (producto_ids[idx_seguro] == v_producto)
+            & (v_offset >= 0)
+            & (v_offset < dias_historia)
+        )
+        np.add.at(matriz, (idx[validos], v_offset[validos]), v_unidades[validos])
+
+    promedio = matriz.sum(axis=1) / dias_historia
+    ventana_corta = min(7, dias_historia)
+    promedio_7 = matriz[:, -ventana_corta:].sum(axis=1) / ventana_corta
+    # Se toma la mayor de ambas medias para reaccionar rapido a alzas de demanda.
+    velocidad = np.maximum(promedio, promedio_7)
+
+    actual = cantidad_actual.astype(np.float64)
+    cobertura = np.full(n, np.inf)
+    np.divide(actual, velocidad, out=cobertura, where=velocidad > 0)
+
+    objetivo = velocidad * (dias_lead_time + dias_cobertura_objetivo) + cantidad_minima
+    sugerida = np.ceil(np.clip(objetivo - actual, 0, None)).astype(np.int64)
+
+    return {
+        "venta_promedio_diaria": promedio,
+        "venta_promedio_7_dias": promedio_7,
+        "dias_cobertura": cobertura,
+        "cantidad_sugerida": sugerida,
+    }
+
+
+class ReposicionService:
+    """Caso de uso para sugerir cantidades de compra segun la velocidad de venta."""
+
+    def __init__(self, repository: ReposicionRepositoryInterface):
+        self.repository = repository
+
+    def calcular_sugerencias(
+        self,
+        *,
+        hasta: Optional[date] = None,
+        dias_historia: int = 28,
+        dias_lead_time: int = 3,
+        dias_cobertura_objetivo: int = 14,
+        solo_con_sugerencia: bool = True,
+    ) -> SugerenciasReposicionResponse:
+        hasta = hasta or datetime.now(timezone.utc).date()
+        desde = hasta - timedelta(days=dias_historia - 1)
+
+        catalogo = self.repository.get_catalogo_stock()
+        ventas = self.repository.get_unidades_vendidas_por_dia(desde, hasta)
+
+        n = len(catalogo)
+        producto_ids = np.fromiter((row[0] for row in catalogo), dtype=np.int64, count=n)
+        cantidad_actual = np.fromiter((row[3] for row in catalogo), dtype=np.int64, count=n)
+        cantidad_minima = np.fromiter((row[4] for row in catalogo), dtype=np.int64, count=n)
+
+        resultado = calcular_reposicion(
+            producto_ids,
+            cantidad_actual,
+            cantidad_minima,
+            ventas,
+            desde=desde,
+            dias_historia=dias_historia,
+            dias_lead_time=dias_lead_time,
+            dias_cobertura_objetivo=dias_cobertura_objetivo,
+        )
+
+        cobertura = resultado["dias_cobertura"]
+        sugerida = resultado["cantidad_sugerida"]
+        seleccion = np.flatnonzero(sugerida > 0) if solo_con_sugerencia else np.arange(n)
+        # Primero los productos que se agotan antes.
+        seleccion = seleccion[np.argsort(cobertura[seleccion], kind="stable")]
+
+        promedio = resultado["venta_promedio_diaria"]
+        promedio_7 = resultado["venta_promedio_7_dias"]
+        items = [
+            SugerenciaReposicionResponse(
+                producto_id=catalogo[i][0],
+                codigo_barras=catalogo[i][1],
+                nombre=catalogo[i][2],
+                cantidad_actual=catalogo[i][3],
+                cantidad_minima=catalogo[i][4],
+                venta_promedio_diaria=round(float(promedio[i]), 3),
+                venta_promedio_7_dias=round(float(promedio_7[i]), 3),
+                dias_cobertura=(
+                    round(float(cobertura[i]), 1) if np.isfinite(cobertura[i]) else None
+                ),
+                cantidad_sugerida=int(sugerida[i]),
+            )
+            for i in seleccion.tolist()
+        ]
+        return SugerenciasReposicionResponse(
+            desde=desde,
+            hasta=hasta,
+            productos_evaluados=n,
+            items=items,
+        )
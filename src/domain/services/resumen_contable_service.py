@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import date
+
+from domain.dtos.resumenContableDto import (
+    ReconstruirResumenContableResponse,
+    ResultadoMensualResponse,
+    ResumenContableMensualResponse,
+)
+from domain.interfaces.resumen_contable_repository_interface import (
+    ResumenContableRepositoryInterface,
+)
+
+
+def _rango_meses(desde: date, hasta: date) -> tuple[date, date]:
+    desde, hasta = desde.replace(day=1), hasta.replace(day=1)
+    if desde > hasta:
+        raise ValueError("La fecha desde no puede ser mayor que hasta")
+    return desde, hasta
+
+
+class ResumenContableService:
+    """
+    Estado de resultados mensual (ventas + ingresos - egresos) leido de los
+    acumulados de `resumen_contable_mensual`: una fila por mes y serie.
+    """
+
+    def __init__(self, repository: ResumenContableRepositoryInterface):
+        self.repository = repository
+
+    def get_resultado_mensual(self, desde: date, hasta: date) -> ResumenContableMensualResponse:
+        desde, hasta = _rango_meses(desde, hasta)
+        meses = self.repository.get_resultado_mensual(desde, hasta)
+        return ResumenContableMensualResponse(
+            desde=desde,
+            hasta=hasta,
+            items=[
+                ResultadoMensualResponse(
+                    mes=mes.mes,
+                    ventas=mes.ventas,
+                    ingresos=mes.ingresos,
+                    egresos=mes.egresos,
+                    resultado=mes.resultado,
+                )
+                for mes in meses
+            ],
+        )
+
+    def reconstruir(self, desde: date, hasta: date) -> ReconstruirResumenContableResponse:
+        desde, hasta = _rango_meses(desde, hasta)
+        filas = self.repository.reconstruir(desde, hasta)
+        return ReconstruirResumenContableResponse(desde=desde, hasta=hasta, filas=filas)
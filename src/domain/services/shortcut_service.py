@@ -1,20 +1,47 @@
 from __future__ import annotations
 from typing import Optional
 
+from domain.services.command_router import Command, CommandRouter, SenderAllowlist
+
+SHORTCUTS = {
+    "I": "Cual es el monto del ingreso de dinero.",
+    "S": "Cual es el monto de la salida de dinero.",
+}
+
+# Solo este numero puede disparar el atajo protegido para categorias.
+# Se valida usando los ultimos digitos para tolerar prefijos (e.g. 57, +57).
+ALLOWED_CATEGORY_SENDERS = frozenset({"3004356388"})
+
+
+def compilar_atajos(shortcuts: dict[str, str]) -> CommandRouter:
+    return CommandRouter(
+        Command(nombre=atajo, alias=(atajo,), ignorar_mayusculas=False)
+        for atajo in shortcuts
+    )
+
+
+# Se compilan al importar; cada mensaje cuesta un lookup y crear el servicio no
+# vuelve a armar la tabla.
+SHORTCUT_COMMANDS = compilar_atajos(SHORTCUTS)
+CATEGORY_SENDERS = SenderAllowlist(ALLOWED_CATEGORY_SENDERS)
+
 
 class ShortcutService:
     """
     Reglas de negocio para los atajos de mensajes recibidos (+/-).
     """
 
-    def __init__(self, shortcuts: Optional[dict[str, str]] = None):
-        self.shortcuts = shortcuts or {
-            "I": "Cual es el monto del ingreso de dinero.",
-            "S": "Cual es el monto de la salida de dinero.",
-        }
-        # Solo este numero puede disparar el atajo protegido para categorias.
-        # Se valida usando los ultimos digitos para tolerar prefijos (e.g. 57, +57).
-        self.allowed_category_senders = {"3004356388"}
+    def __init__(
+        self,
+        shortcuts: Optional[dict[str, str]] = None,
+        commands: Optional[CommandRouter] = None,
+    ):
+        self.shortcuts = shortcuts or SHORTCUTS
+        if commands is None:
+            commands = SHORTCUT_COMMANDS if shortcuts is None else compilar_atajos(shortcuts)
+        self.router = commands
+        self.allowed_category_senders = ALLOWED_CATEGORY_SENDERS
+        self._category_senders = CATEGORY_SENDERS
 
     def get_reply_for_shortcut(
         self, text: str, sender: Optional[str] = None
@@ -22,24 +49,13 @@ class ShortcutService:
         """
         Devuelve el mensaje de respuesta si el texto coincide con un atajo conocido.
         """
-        if text is None:
-            return None
-        normalized = text.strip()
-
         # Responde solo a los atajos basicos (I/S). El atajo A se maneja en el webhook.
-        return self.shortcuts.get(normalized)
+        coincidencia = self.router.route(text, sender)
+        return self.shortcuts[coincidencia.comando.nombre] if coincidencia else None
 
     def is_allowed_category_sender(self, sender: Optional[str]) -> bool:
         """
         Valida si el remitente puede ejecutar el atajo protegido de categorias.
         """
-        if not sender:
-            return False
-
-        # Extrae solo digitos para tolerar formatos como "573004356388" o "+57...".
-        digits = "".join(ch for ch in sender if ch.isdigit())
-        if not digits:
-            return False
-
-        # Considera valido si termina con alguno de los numeros permitidos.
-        return any(digits.endswith(allowed) for allowed in self.allowed_category_senders)
+        # Compara los ultimos digitos: tolera formatos como "573004356388" o "+57...".
+        return self._category_senders.is_allowed(sender)
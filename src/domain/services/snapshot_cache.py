@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Generic, Optional, Protocol, TypeVar
+
+DEFAULT_TTL_SECONDS = 300.0
+# Un id desconocido puede venir de texto libre (chat, API): recargar por cada uno
+# convertiria el cache en una consulta completa por pedido.
+DEFAULT_RECARGA_MINIMA_SECONDS = 5.0
+
+
+def normalizar_nombre(nombre: str) -> str:
+    return nombre.strip().casefold()
+
+
+class Foto(Protocol):
+    cargado_en: float
+
+
+F = TypeVar("F", bound=Foto)
+S = TypeVar("S")
+
+
+class SnapshotCache(Generic[S, F]):
+    """
+    Cache en proceso de tablas chicas que se leen mucho. Guarda una foto
+    inmutable (`F`) leida de una fuente (`S`: sesion o repositorio) y la
+    reemplaza completa cuando vence el TTL o se invalida; los lectores siempre
+    ven una foto consistente. Las subclases implementan `_leer`.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        *,
+        recarga_minima_seconds: float = DEFAULT_RECARGA_MINIMA_SECONDS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.recarga_minima_seconds = recarga_minima_seconds
+        self._clock = clock
+        self._data: Optional[F] = None
+        self._lock = threading.Lock()
+
+    def _leer(self, fuente: S, cargado_en: float) -> F:
+        raise NotImplementedError
+
+    def _cargar(self, fuente: S) -> F:
+        data = self._leer(fuente, self._clock())
+        self._data = data
+        return data
+
+    def load(self, fuente: S) -> F:
+        with self._lock:
+            return self._cargar(fuente)
+
+    def invalidate(self) -> None:
+        self._data = None
+
+    def get(self, fuente: S) -> F:
+        data = self._data
+        if data is None or self._clock() - data.cargado_en >= self.ttl_seconds:
+            return self.load(fuente)
+        return data
+
+    def recargar(self, fuente: S) -> F:
+        """
+        Recarga porque falta un dato (puede haberse creado en otro proceso), a lo
+        sumo una vez cada `recarga_minima_seconds`; si la foto es mas reciente,
+        la devuelve tal cual.
+        """
+        with self._lock:
+            data = self._data
+            if data is not None and self._clock() - data.cargado_en < self.recarga_minima_seconds:
+                return data
+            return self._cargar(fuente)
@@ -1,18 +1,44 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from datetime import date, timedelta
+from itertools import islice
+from typing import Iterable, List, Optional
 
+from domain.dtos.conteoStockDto import (
+    ConteoStockItem,
+    ConteoStockResponse,
+    ConteoStockVariacion,
+)
+from domain.dtos.movimientoStockDto import (
+    ConciliacionStockResponse,
+    MovimientoStockPageResponse,
+    MovimientoStockRequest,
+    MovimientoStockResponse,
+    SnapshotStockResponse,
+    StockLedgerResponse,
+)
 from domain.dtos.stockDto import StockRequest, StockResponse
+from domain.entities.movimientoStockEntity import MovimientoStockEntity
 from domain.entities.stockEntity import StockEntity
+from domain.interfaces.IStockAlertService import IStockAlertService
 from domain.interfaces.IStockService import IStockService
 from domain.interfaces.stock_repository_interface import StockRepositoryInterface
+from domain.services.paginacion import decode_cursor, encode_cursor, inicio_dia
+
+
+CONTEO_CHUNK_SIZE = 1000
 
 
 class StockService(IStockService):
     """Caso de uso para operaciones de stock."""
 
-    def __init__(self, repository: StockRepositoryInterface):
+    def __init__(
+        self,
+        repository: StockRepositoryInterface,
+        alert_service: Optional[IStockAlertService] = None,
+    ):
         self.repository = repository
+        self.alert_service = alert_service
 
     def create_stock(self, data: StockRequest) -> StockResponse:
         entity = StockEntity(
@@ -24,6 +50,7 @@ class StockService(IStockService):
             creado_por_id=data.creado_por_id,
         )
         created = self.repository.create_stock(entity)
+        self._notify_stock_change([created.producto_id])
         return StockResponse.model_validate(created)
 
     def list_stock(self) -> List[StockResponse]:
@@ -39,3 +66,127 @@ class StockService(IStockService):
     def search_stock(self, term: str) -> List[StockResponse]:
         stocks = self.repository.search_stock(term)
         return [StockResponse.model_validate(stock) for stock in stocks]
+
+    def list_low_stock(self) -> List[StockResponse]:
+        stocks = self.repository.list_low_stock()
+        return [StockResponse.model_validate(stock) for stock in stocks]
+
+    def registrar_movimiento(self, data: MovimientoStockRequest) -> MovimientoStockResponse:
+        entity = MovimientoStockEntity(
+            producto_id=data.producto_id,
+            tipo_movimiento_id=data.tipo_movimiento_id,
+            ref_movimiento_id=data.ref_movimiento_id,
+            cantidad=data.cantidad,
+            referencia_doc=data.referencia_doc,
+            nota=data.nota,
+            realizado_por_id=data.realizado_por_id,
+        )
+        created = self.repository.registrar_movimiento(entity)
+        self._notify_stock_change([created.producto_id])
+        return MovimientoStockResponse.model_validate(created)
+
+    def list_movimientos(
+        self,
+        producto_id: int,
+        *,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        tipo_movimiento_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> MovimientoStockPageResponse:
+        movimientos = self.repository.list_movimientos(
+            producto_id,
+            desde=inicio_dia(desde) if desde else None,
+            hasta=inicio_dia(hasta + timedelta(days=1)) if hasta else None,
+            tipo_movimiento_id=tipo_movimiento_id,
+            despues_de=decode_cursor(cursor) if cursor else None,
+            limit=limit + 1,
+        )
+        has_more = len(movimientos) > limit
+        movimientos = movimientos[:limit]
+
+        # Los catalogos de tipo/ref son pequenos: se resuelven en memoria.
+        tipos = self.repository.get_nombres_tipo_movimiento()
+        refs = self.repository.get_nombres_ref_movimiento()
+        items = []
+        for movimiento in movimientos:
+            movimiento.tipo_movimiento_nombre = tipos.get(movimiento.tipo_movimiento_id)
+            movimiento.ref_movimiento_nombre = refs.get(movimiento.ref_movimiento_id)
+            items.append(MovimientoStockResponse.model_validate(movimiento))
+
+        next_cursor = None
+        if has_more and movimientos:
+            last = movimientos[-1]
+            next_cursor = encode_cursor(last.fecha_creacion, last.movimiento_id)
+        return MovimientoStockPageResponse(items=items, next_cursor=next_cursor)
+
+    def get_stock_ledger(self, stock_id: int) -> Optional[StockLedgerResponse]:
+        ledger = self.repository.get_stock_ledger(stock_id)
+        if not ledger:
+            return None
+        return StockLedgerResponse.model_validate(ledger)
+
+    def conciliar_stock(self) -> ConciliacionStockResponse:
+        ledgers = self.repository.list_stock_ledger()
+        items = [
+            StockLedgerResponse.model_validate(ledger)
+            for ledger in ledgers
+            if ledger.diferencia != 0
+        ]
+        return ConciliacionStockResponse(
+            revisados=len(ledgers),
+            con_diferencia=len(items),
+            items=items,
+        )
+
+    def crear_snapshots(self) -> SnapshotStockResponse:
+        creados, movimiento_id = self.repository.crear_snapshots()
+        return SnapshotStockResponse(creados=creados, movimiento_id=movimiento_id)
+
+    def importar_conteo(
+        self,
+        items: Iterable[ConteoStockItem],
+        *,
+        tipo_entrada_id: int,
+        tipo_salida_id: int,
+        ref_movimiento_id: int,
+        referencia_doc: Optional[str] = None,
+        realizado_por_id: Optional[int] = None,
+        chunk_size: int = CONTEO_CHUNK_SIZE,
+    ) -> ConteoStockResponse:
+        # Un mismo codigo puede escanearse en varias ubicaciones: se suman.
+        conteos: dict[str, int] = {}
+        report = ConteoStockResponse()
+        for item in items:
+            report.filas += 1
+            conteos[item.codigo_barras] = conteos.get(item.codigo_barras, 0) + item.cantidad
+        report.productos = len(conteos)
+
+        codigos = iter(conteos)
+        while chunk := list(islice(codigos, chunk_size)):
+            variaciones, no_encontrados = self.repository.aplicar_conteo(
+                {codigo: conteos[codigo] for codigo in chunk},
+                tipo_entrada_id=tipo_entrada_id,
+                tipo_salida_id=tipo_salida_id,
+                ref_movimiento_id=ref_movimiento_id,
+                referencia_doc=referencia_doc,
+                realizado_por_id=realizado_por_id,
+            )
+            report.no_encontrados.extend(no_encontrados)
+            ajustados = []
+            for variacion in variaciones:
+                if variacion.diferencia == 0:
+                    report.sin_diferencia += 1
+                    continue
+                ajustados.append(variacion.producto_id)
+                report.valor_diferencia_total += variacion.valor_diferencia
+                report.variaciones.append(ConteoStockVariacion.model_validate(variacion))
+            report.ajustados += len(ajustados)
+            self._notify_stock_change(ajustados)
+
+        return report
+
+    def _notify_stock_change(self, producto_ids: Iterable[int]) -> None:
+        if self.alert_service is not None:
+            self.alert_service.notify_stock_change(producto_ids)
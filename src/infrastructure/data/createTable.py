@@ -6,7 +6,7 @@ from typing import Optional
 
 from sqlalchemy import create_engine
 
-from src.infrastructure.models.models import Base
+from src.infrastructure.data.migraciones import migrar
 
 
 def _load_dotenv_if_available() -> None:
@@ -46,9 +46,10 @@ def _load_env_file_simple(path: Path) -> None:
             os.environ[key] = value
 
 
-def create_tables(database_url: Optional[str] = None) -> None:
+def create_tables(database_url: Optional[str] = None) -> list[str]:
     """
-    Crea todas las tablas declaradas en `Base.metadata`.
+    Crea todas las tablas declaradas en `Base.metadata` y migra las que ya
+    existian (columnas e indices nuevos). Devuelve los cambios aplicados.
 
     - Si `database_url` es None, intenta usar la variable de entorno `DATABASE_URL`.
     - Si existe `python-dotenv`, carga `.env` automáticamente.
@@ -63,9 +64,10 @@ def create_tables(database_url: Optional[str] = None) -> None:
         )
 
     engine = create_engine(db_url, future=True)
-    Base.metadata.create_all(bind=engine)
+    return migrar(engine)
 
 
 if __name__ == "__main__":
-    create_tables()
+    for cambio in create_tables():
+        print(cambio)
     print("Tablas creadas exitosamente.")
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import Engine, Index, Table, func, inspect, or_, text, update
+from sqlalchemy.engine import Connection
+
+from src.infrastructure.models.models import Base, MovimientosStock, Stock, TipoMovimiento
+
+Migracion = Callable[[Connection], list[str]]
+
+# Se aplican en orden sobre una base existente; cada paso revisa el esquema
+# antes de tocarlo, asi que correrlos de nuevo no cambia nada.
+MIGRACIONES: list[tuple[str, Migracion]] = []
+
+# Tipos de movimiento que restan stock, por prefijo del nombre (en minusculas).
+# Los demas quedan en +1; revisar el listado que imprime la migracion.
+PREFIJOS_SALIDA = (
+    "salida",
+    "venta",
+    "merma",
+    "baja",
+    "perdida",
+    "pérdida",
+    "consumo",
+    "ajuste negativo",
+    "devolucion a proveedor",
+    "devolución a proveedor",
+)
+
+
+def migracion(nombre: str) -> Callable[[Migracion], Migracion]:
+    def registrar(paso: Migracion) -> Migracion:
+        MIGRACIONES.append((nombre, paso))
+        return paso
+
+    return registrar
+
+
+def _columnas(conn: Connection, tabla: str) -> set[str]:
+    return {columna["name"] for columna in inspect(conn).get_columns(tabla)}
+
+
+def _agregar_columna(conn: Connection, tabla: str, columna: str, ddl: str) -> bool:
+    """`ALTER TABLE ... ADD COLUMN` si la columna no existe; devuelve si la agrego."""
+    if not inspect(conn).has_table(tabla) or columna in _columnas(conn, tabla):
+        return False
+    conn.execute(text(f"ALTER TABLE {tabla} ADD COLUMN {columna} {ddl}"))
+    return True
+
+
+def _indice(tabla: Table, nombre: str) -> Index:
+    return next(indice for indice in tabla.indexes if indice.name == nombre)
+
+
+def _crear_indices(conn: Connection, indices: Iterable[Index]) -> list[str]:
+    existentes: dict[str, set[str]] = {}
+    creados = []
+    for indice in indices:
+        tabla = indice.table.name
+        if not inspect(conn).has_table(tabla):
+            continue
+        if tabla not in existentes:
+            existentes[tabla] = {i["name"] for i in inspect(conn).get_indexes(tabla)}
+        if indice.name not in existentes[tabla]:
+            indice.create(conn)
+            creados.append(f"indice {indice.name}")
+    return creados
+
+
+@migracion("ledger_stock")
+def _ledger_stock(conn: Connection) -> list[str]:
+    """Signo de `tipo_movimiento` e indices del ledger (la tabla `snapshot_stock` la crea `create_all`)."""
+    cambios = []
+    if _agregar_columna(conn, "tipo_movimiento", "signo", "INTEGER NOT NULL DEFAULT 1"):
+        tipos = TipoMovimiento.__table__
+        nombre = func.lower(tipos.c.nombre)
+        conn.execute(
+            update(tipos)
+            .where(or_(*(nombre.like(f"{prefijo}%") for prefijo in PREFIJOS_SALIDA)))
+            .values(signo=-1)
+        )
+        if conn.dialect.name == "postgresql":
+            # SQLite no admite agregar constraints a una tabla existente.
+            conn.execute(
+                text(
+                    "ALTER TABLE tipo_movimiento ADD CONSTRAINT ck_tipo_movimiento_signo "
+                    "CHECK (signo IN (-1, 1))"
+                )
+            )
+        signos = conn.execute(
+            text("SELECT nombre, signo FROM tipo_movimiento ORDER BY tipo_movimiento_id")
+        ).all()
+        cambios.append("columna tipo_movimiento.signo")
+        cambios.extend(f"  {fila.nombre}: {fila.signo:+d}" for fila in signos)
+    cambios += _crear_indices(
+        conn,
+        [
+            _indice(Stock.__table__, "ix_stock_producto_id"),
+            _indice(MovimientosStock.__table__, "ix_movimientos_stock_stock_id_movimiento_id"),
+        ],
+    )
+    return cambios
+
+
+
+@migracion("version_stock")
+def _version_stock(conn: Connection) -> list[str]:
+    """Columna de version para el bloqueo optimista de `stock`."""
+    if _agregar_columna(conn, "stock", "version", "INTEGER NOT NULL DEFAULT 1"):
+        return ["columna stock.version"]
+    return []
+
+
+@migracion("costo_venta_detalle")
+def _costo_venta_detalle(conn: Connection) -> list[str]:
+    """Costo unitario de cada linea; las ventas anteriores quedan en NULL (`lineas_sin_costo`)."""
+    if _agregar_columna(conn, "venta_detalle", "costo_unitario", "NUMERIC(10, 2)"):
+        return ["columna venta_detalle.costo_unitario"]
+    return []
+
+def migrar(engine: Engine, tablas: Optional[list[Table]] = None) -> list[str]:
+    """
+    Crea las tablas que falten y aplica las migraciones a las que ya existian
+    (`create_all` no agrega columnas ni indices a tablas existentes). Todo corre
+    en una transaccion; devuelve la lista de cambios aplicados.
+    """
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn, tables=tablas)
+        cambios = []
+        for nombre, paso in MIGRACIONES:
+            cambios.extend(f"{nombre}: {cambio}" for cambio in paso(conn))
+    return cambios
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date
+
+from src.config import SessionLocal
+from src.infrastructure.repository.createResumenContableRepository import (
+    ResumenContableRepository,
+)
+
+
+def reconstruir(desde: date, hasta: date) -> int:
+    """
+    Recalcula `resumen_contable_mensual` (ventas, ingresos y egresos) para los
+    meses del rango. Sirve para el backfill inicial y tras correcciones manuales.
+    """
+    db = SessionLocal()
+    try:
+        filas = ResumenContableRepository(db).reconstruir(desde, hasta)
+    finally:
+        db.close()
+    print(f"Resumen mensual reconstruido de {desde:%Y-%m} a {hasta:%Y-%m}: {filas} filas.")
+    return filas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reconstruye el resumen contable mensual.")
+    parser.add_argument("desde", type=date.fromisoformat, help="Fecha dentro del primer mes")
+    parser.add_argument("hasta", type=date.fromisoformat, help="Fecha dentro del ultimo mes")
+    args = parser.parse_args()
+
+    if args.desde > args.hasta:
+        parser.error("desde no puede ser mayor que hasta")
+    reconstruir(args.desde, args.hasta)
+
+
+if __name__ == "__main__":
+    main()
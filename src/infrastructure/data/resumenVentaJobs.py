@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date
+
+from src.config import SessionLocal
+from src.infrastructure.repository.createResumenVentaDiariaRepository import (
+    ResumenVentaDiariaRepository,
+)
+
+
+def reconstruir(desde: date, hasta: date) -> int:
+    """
+    Recalcula `resumen_venta_diaria` para el rango desde `venta` con un solo
+    GROUP BY. Util tras correcciones manuales o para cargar historico.
+    """
+    db = SessionLocal()
+    try:
+        dias = ResumenVentaDiariaRepository(db).reconstruir(desde, hasta)
+    finally:
+        db.close()
+    print(f"Resumen reconstruido de {desde} a {hasta}: {dias} dias con ventas.")
+    return dias
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reconstruye el resumen diario de ventas.")
+    parser.add_argument("desde", type=date.fromisoformat)
+    parser.add_argument("hasta", type=date.fromisoformat)
+    args = parser.parse_args()
+
+    if args.desde > args.hasta:
+        parser.error("desde no puede ser mayor que hasta")
+    reconstruir(args.desde, args.hasta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+
+from src.config import SessionLocal
+from src.infrastructure.repository.createStockRepository import StockRepository
+
+
+def crear_snapshots() -> None:
+    """
+    Crea un snapshot por cada stock con movimientos desde su ultimo snapshot.
+
+    Pensado para ejecutarse periodicamente (cron) fuera de horas pico, de modo que
+    el calculo del ledger solo sume los movimientos recientes.
+    """
+    db = SessionLocal()
+    try:
+        creados, movimiento_id = StockRepository(db).crear_snapshots()
+    finally:
+        db.close()
+    print(f"Snapshots creados: {creados} (hasta movimiento {movimiento_id}).")
+
+
+def conciliar() -> int:
+    """
+    Compara el ledger con `stock.cantidad_actual` para todo el catalogo e imprime
+    las diferencias. Devuelve la cantidad de stocks con diferencia.
+    """
+    db = SessionLocal()
+    try:
+        ledgers = StockRepository(db).list_stock_ledger()
+    finally:
+        db.close()
+
+    diferencias = [ledger for ledger in ledgers if ledger.diferencia != 0]
+    for ledger in diferencias:
+        print(
+            f"stock_id={ledger.stock_id} producto_id={ledger.producto_id} "
+            f"cantidad_actual={ledger.cantidad_actual} ledger={ledger.cantidad_ledger} "
+            f"diferencia={ledger.diferencia}"
+        )
+    print(f"Stocks revisados: {len(ledgers)}. Con diferencia: {len(diferencias)}.")
+    return len(diferencias)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tareas del ledger de stock.")
+    parser.add_argument("tarea", choices=["snapshot", "conciliar"])
+    args = parser.parse_args()
+
+    if args.tarea == "snapshot":
+        crear_snapshots()
+    else:
+        raise SystemExit(1 if conciliar() else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+from __future__ import annotations
+
+import argparse
+import ast
+import asyncio
+import copy
+import importlib
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable, Optional
+
+import httpx
+import numpy as np
+
+MARCA_PAYLOAD_TXT = "POST /payload: "
+
+
+def _es_payload(data) -> bool:
+    return isinstance(data, dict) and ("entry" in data or "value" in data)
+
+
+def cargar_payloads(path: str) -> list[dict]:
+    """
+    Lee payloads capturados por el logger del webhook. Acepta el NDJSON actual
+    (`{"msg": "POST /payload", "payload": {...}}`), el formato de texto anterior
+    (`<fecha> - POST /payload: {repr de python}`) y archivos con un payload JSON
+    por linea. Las lineas que no son payloads (mensajes sueltos) se ignoran.
+    """
+    payloads = []
+    with open(path, encoding="utf-8") as archivo:
+        for linea in archivo:
+            linea = linea.strip()
+            if not linea:
+                continue
+            if MARCA_PAYLOAD_TXT in linea:
+                texto = linea.split(MARCA_PAYLOAD_TXT, 1)[1]
+                try:
+                    data = ast.literal_eval(texto)
+                except (ValueError, SyntaxError):
+                    continue
+            else:
+                try:
+                    data = json.loads(linea)
+                except ValueError:
+                    continue
+                if isinstance(data, dict) and data.get("msg") == "POST /payload":
+                    data = data.get("payload")
+            if _es_payload(data):
+                payloads.append(data)
+    return payloads
+
+
+def _payload(value: dict) -> dict:
+    return {
+        "object": "whatsapp_business_account",
+        "entry": [{"id": "bench", "changes": [{"field": "messages", "value": value}]}],
+    }
+
+
+def generar_payloads(
+    total: int,
+    *,
+    remitentes: int = 50,
+    proporcion_estados: float = 0.6,
+    proporcion_comandos: float = 0.1,
+    seed: int = 0,
+) -> list[dict]:
+    """
+    Payloads sinteticos con la mezcla tipica de Meta: mayoria de callbacks de
+    estado (entregado/leido), algunos comandos "A" y texto libre. Los ids de
+    mensaje son unicos para que la deduplicacion no los descarte.
+    """
+    rand = random.Random(seed)
+    payloads = []
+    for i in range(total):
+        sender = f"57300{rand.randrange(remitentes):07d}"
+        metadata = {"display_phone_number": "15550000000", "phone_number_id": "bench"}
+        sorteo = rand.random()
+        if sorteo < proporcion_estados:
+            value = {
+                "messaging_product": "whatsapp",
+                "metadata": metadata,
+                "statuses": [
+                    {
+                        "id": f"wamid.bench.estado.{i}",
+                        "status": rand.choice(["sent", "delivered", "read"]),
+                        "timestamp": str(1_700_000_000 + i),
+                        "recipient_id": sender,
+                    }
+                ],
+            }
+        else:
+            texto = "A" if sorteo < proporcion_estados + proporcion_comandos else f"hola {i}"
+            value = {
+                "messaging_product": "whatsapp",
+                "metadata": metadata,
+                "contacts": [{"profile": {"name": f"Cliente {sender[-4:]}"}, "wa_id": sender}],
+                "messages": [
+                    {
+                        "from": sender,
+                        "id": f"wamid.bench.{i}",
+                        "timestamp": str(1_700_000_000 + i),
+                        "type": "text",
+                        "text": {"body": texto},
+                    }
+                ],
+            }
+        payloads.append(_payload(value))
+    return payloads
+
+
+def _values(payload: dict) -> Iterable[dict]:
+    for entry in payload.get("entry") or []:
+        for change in (entry or {}).get("changes") or []:
+            value = (change or {}).get("value")
+            if isinstance(value, dict):
+                yield value
+    if isinstance(payload.get("value"), dict):
+        yield payload["value"]
+
+
+def clasificar(payload: dict) -> str:
+    """Camino de codigo que recorre el payload en el webhook."""
+    mensajes = [m for v in _values(payload) for m in v.get("messages") or []]
+    if not mensajes:
+        return "estado"
+    if any(m.get("type", "text") != "text" for m in mensajes):
+        return "no_texto"
+    from src.app.services.webhook_service import WEBHOOK_COMMANDS
+
+    # La misma tabla de comandos que el webhook: si cambia, la clasificacion la sigue.
+    if any(
+        WEBHOOK_COMMANDS.route((m.get("text") or {}).get("body", ""), m.get("from"))
+        for m in mensajes
+    ):
+        return "comando"
+    return "texto"
+
+
+def reescribir_ids(payload: dict, sufijo: str) -> dict:
+    """Copia con ids de mensaje nuevos, para repetir una captura sin que sea duplicada."""
+    copia = copy.deepcopy(payload)
+    for value in _values(copia):
+        for message in value.get("messages") or []:
+            if message.get("id"):
+                message["id"] = f"{message['id']}.{sufijo}"
+    return copia
+
+
+class MockWhatsAppApi:
+    """
+    Graph API falsa en un hilo: responde cada envio tras `latencia` segundos y
+    devuelve 429 o 500 con probabilidad `tasa_error`.
+    """
+
+    def __init__(self, *, latencia: float = 0.05, tasa_error: float = 0.0, port: int = 0, seed: int = 0):
+        self.latencia = latencia
+        self.tasa_error = tasa_error
+        self.enviados = 0
+        self.errores = 0
+        self._rand = random.Random(seed)
+        self._lock = threading.Lock()
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                time.sleep(mock.latencia)
+                with mock._lock:
+                    falla = mock._rand.random() < mock.tasa_error
+                    if falla:
+                        mock.errores += 1
+                    else:
+                        mock.enviados += 1
+                        numero = mock.enviados
+                if falla:
+                    codigo, cuerpo = 429, {"error": {"code": 130429, "message": "rate limit"}}
+                else:
+                    codigo, cuerpo = 200, {"messages": [{"id": f"wamid.mock.{numero}"}]}
+                data = json.dumps(cuerpo).encode()
+                self.send_response(codigo)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-whatsapp", daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v19.0/bench/messages"
+
+    def __enter__(self) -> "MockWhatsAppApi":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@dataclass
+class Resultado:
+    camino: str
+    codigo: int
+    estado: str
+    latencia_ms: float
+
+
+async def replay(
+    client: httpx.AsyncClient,
+    url: str,
+    payloads: list[dict],
+    *,
+    rate: float = 0.0,
+    concurrencia: int = 50,
+) -> tuple[list[Resultado], float]:
+    """
+    Envia los payloads a `url`. Con `rate` > 0 cada envio sale en su instante
+    programado (carga abierta, no espera a los anteriores); con 0 van tan rapido
+    como permita `concurrencia`. Devuelve los resultados y la duracion total.
+    """
+    semaforo = asyncio.Semaphore(concurrencia)
+    inicio = time.perf_counter()
+
+    async def enviar(i: int, payload: dict) -> Resultado:
+        if rate > 0:
+            await asyncio.sleep(max(0.0, inicio + i / rate - time.perf_counter()))
+        async with semaforo:
+            t0 = time.perf_counter()
+            try:
+                response = await client.post(url, json=payload)
+                codigo = response.status_code
+                try:
+                    estado = str(response.json().get("status", codigo))
+                except (ValueError, AttributeError):
+                    estado = str(codigo)
+            except httpx.HTTPError as exc:
+                codigo, estado = 0, type(exc).__name__
+            return Resultado(clasificar(payload), codigo, estado, (time.perf_counter() - t0) * 1000)
+
+    resultados = await asyncio.gather(*(enviar(i, p) for i, p in enumerate(payloads)))
+    return list(resultados), time.perf_counter() - inicio
+
+
+def _percentiles(latencias: list[float]) -> dict:
+    if not latencias:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    p50, p95, p99 = np.percentile(latencias, [50, 95, 99])
+    return {
+        "p50_ms": round(float(p50), 2),
+        "p95_ms": round(float(p95), 2),
+        "p99_ms": round(float(p99), 2),
+        "max_ms": round(max(latencias), 2),
+    }
+
+
+def resumir(resultados: list[Resultado], duracion: float) -> dict:
+    """Throughput global y, por camino de codigo, latencias, estados y tasa de error."""
+    caminos: dict[str, list[Resultado]] = {}
+    for resultado in resultados:
+        caminos.setdefault(resultado.camino, []).append(resultado)
+
+    def bloque(items: list[Resultado]) -> dict:
+        errores = sum(1 for r in items if r.codigo == 0 or r.codigo >= 400)
+        estados: dict[str, int] = {}
+        for r in items:
+            estados[r.estado] = estados.get(r.estado, 0) + 1
+        return {
+            "total": len(items),
+            "errores": errores,
+            "tasa_error": round(errores / len(items), 4) if items else 0.0,
+            "estados": dict(sorted(estados.items())),
+            **_percentiles([r.latencia_ms for r in items]),
+        }
+
+    return {
+        "total": len(resultados),
+        "duracion_s": round(duracion, 3),
+        "por_segundo": round(len(resultados) / duracion, 1) if duracion > 0 else 0.0,
+        **bloque(resultados),
+        "por_camino": {camino: bloque(items) for camino, items in sorted(caminos.items())},
+    }
+
+
+def _cargar_app(spec: str):
+    from fastapi import APIRouter, FastAPI
+
+    modulo, _, atributo = spec.partition(":")
+    try:
+        objetivo = getattr(importlib.import_module(modulo), atributo or "app")
+    except (ImportError, AttributeError) as exc:
+        raise SystemExit(f"No se pudo cargar --app {spec}: {exc}") from exc
+    if isinstance(objetivo, APIRouter):
+        app = FastAPI()
+        app.include_router(objetivo)
+        return app
+    return objetivo
+
+
+async def _en_proceso(app_spec: str, path: str, payloads: list[dict], args) -> dict:
+    from src.app.services.webhook_worker_pool import webhook_pool
+
+    app = _cargar_app(app_spec)
+    if not any(getattr(r, "path", None) == path for r in app.routes):
+        raise SystemExit(f"--app {app_spec} no expone {path}")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        resultados, duracion = await replay(
+            client, path, payloads, rate=args.rate, concurrencia=args.concurrencia
+        )
+    inicio_drain = time.perf_counter()
+    # El endpoint solo encola: se espera a que los workers terminen para medir el proceso.
+    await webhook_pool.drain()
+    reporte = resumir(resultados, duracion)
+    reporte["proceso"] = {
+        **webhook_pool.metrics.as_dict(),
+        "drain_s": round(time.perf_counter() - inicio_drain, 3),
+    }
+    return reporte
+
+
+async def _por_http(url: str, payloads: list[dict], args) -> dict:
+    async with httpx.AsyncClient(timeout=args.timeout) as client:
+        resultados, duracion = await replay(
+            client, url, payloads, rate=args.rate, concurrencia=args.concurrencia
+        )
+        reporte = resumir(resultados, duracion)
+        try:
+            reporte["proceso"] = (await client.get(f"{url.rstrip('/')}/metrics")).json()
+        except (httpx.HTTPError, ValueError):
+            pass
+    return reporte
+
+
+def imprimir(reporte: dict) -> None:
+    print(
+        f"Entregas: {reporte['total']} en {reporte['duracion_s']}s "
+        f"({reporte['por_segundo']}/s), errores {reporte['errores']} ({reporte['tasa_error']:.2%})"
+    )
+    print(f"{'camino':<10} {'total':>7} {'err %':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}  estados")
+    for camino, datos in [("todos", reporte), *reporte["por_camino"].items()]:
+        print(
+            f"{camino:<10} {datos['total']:>7} {datos['tasa_error']:>7.2%} {datos['p50_ms']:>8} "
+            f"{datos['p95_ms']:>8} {datos['p99_ms']:>8} {datos['max_ms']:>8}  {datos['estados']}"
+        )
+    if "proceso" in reporte:
+        print(f"Proceso: {reporte['proceso']}")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Reproduce payloads del webhook de WhatsApp y mide throughput y latencias."
+    )
+    origen = parser.add_mutually_exclusive_group(required=True)
+    origen.add_argument("--captura", help="Archivo de log con payloads capturados (.ndjson o .txt)")
+    origen.add_argument("--sinteticos", type=int, help="Cantidad de payloads sinteticos a generar")
+    parser.add_argument("--repeticiones", type=int, default=1, help="Repite la captura con ids nuevos")
+    # Sin valor por defecto: la app principal todavia no monta /webhook.
+    destino = parser.add_mutually_exclusive_group(required=True)
+    destino.add_argument("--url", help="POST /webhook de un servidor corriendo")
+    destino.add_argument("--app", help="modulo:atributo (app o router) a medir en proceso")
+    parser.add_argument("--rate", type=float, default=0.0, help="Entregas por segundo (0 = sin limite)")
+    parser.add_argument("--concurrencia", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--remitentes", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--whatsapp-latencia", type=float, default=0.05, help="Segundos por envio en la API falsa")
+    parser.add_argument("--whatsapp-error", type=float, default=0.0, help="Fraccion de envios que responden 429")
+    parser.add_argument("--whatsapp-port", type=int, default=0)
+    parser.add_argument("--json", dest="salida_json", help="Guarda el reporte completo en este archivo")
+    args = parser.parse_args(argv)
+
+    if args.captura:
+        base = cargar_payloads(args.captura)
+        if not base:
+            raise SystemExit(f"No se encontraron payloads en {args.captura}")
+        payloads = [
+            reescribir_ids(p, f"r{n}") if n else p for n in range(args.repeticiones) for p in base
+        ]
+    else:
+        payloads = generar_payloads(args.sinteticos, remitentes=args.remitentes, seed=args.seed)
+
+    with MockWhatsAppApi(
+        latencia=args.whatsapp_latencia,
+        tasa_error=args.whatsapp_error,
+        port=args.whatsapp_port,
+        seed=args.seed,
+    ) as mock:
+        if args.url:
+            print(f"API de WhatsApp falsa en {mock.url} (configurar WHATSAPP_API_URL del servidor)")
+            reporte = asyncio.run(_por_http(args.url, payloads, args))
+        else:
+            # El cliente de WhatsApp lee el entorno al armarse: va antes de cargar la app.
+            os.environ["WHATSAPP_API_URL"] = mock.url
+            os.environ.setdefault("WHATSAPP_TOKEN", "bench")
+            reporte = asyncio.run(_en_proceso(args.app, "/webhook", payloads, args))
+        reporte["whatsapp"] = {"enviados": mock.enviados, "errores": mock.errores}
+
+    imprimir(reporte)
+    print(f"WhatsApp falso: {reporte['whatsapp']}")
+    if args.salida_json:
+        with open(args.salida_json, "w", encoding="utf-8") as archivo:
+            json.dump(reporte, archivo, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@ from typing import Optional
 import datetime
 import decimal
 
-from sqlalchemy import Boolean, CheckConstraint, DateTime, Enum, ForeignKeyConstraint, Identity, Index, Integer, Numeric, PrimaryKeyConstraint, String, Text, UniqueConstraint, Uuid
+from sqlalchemy import Boolean, CheckConstraint, Date, DateTime, Enum, ForeignKeyConstraint, Identity, Index, Integer, JSON, Numeric, PrimaryKeyConstraint, String, Text, UniqueConstraint, Uuid, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 class Base(DeclarativeBase):
@@ -45,6 +45,7 @@ class RefMovimiento(Base):
 class TipoMovimiento(Base):
     __tablename__ = 'tipo_movimiento'
     __table_args__ = (
+        CheckConstraint('signo IN (-1, 1)', name='ck_tipo_movimiento_signo'),
         PrimaryKeyConstraint('tipo_movimiento_id', name='tipo_movimiento_pkey'),
         UniqueConstraint('nombre', name='tipo_movimiento_nombre_key'),
         Index('ix_tipo_movimiento_tipo_movimiento_id', 'tipo_movimiento_id')
@@ -53,6 +54,7 @@ class TipoMovimiento(Base):
     tipo_movimiento_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     nombre: Mapped[str] = mapped_column(String(50), nullable=False)
     activo: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    signo: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('1'))
     descripcion: Mapped[Optional[str]] = mapped_column(String(255))
 
     movimientos_stock: Mapped[list['MovimientosStock']] = relationship('MovimientosStock', back_populates='tipo_movimiento')
@@ -205,6 +207,7 @@ class Product(Base):
     creado_por: Mapped[Optional['User']] = relationship('User', foreign_keys=[creado_por_id], back_populates='product_')
     stock: Mapped[list['Stock']] = relationship('Stock', back_populates='producto')
     movimientos_stock: Mapped[list['MovimientosStock']] = relationship('MovimientosStock', back_populates='producto')
+    snapshots_stock: Mapped[list['SnapshotStock']] = relationship('SnapshotStock', back_populates='producto')
     ventas_detalle: Mapped[list['VentaDetalle']] = relationship('VentaDetalle', back_populates='producto')
 
 
@@ -249,6 +252,7 @@ class VentaDetalle(Base):
     cantidad: Mapped[int] = mapped_column(Integer, nullable=False)
     precio_unitario: Mapped[decimal.Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     subtotal: Mapped[decimal.Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    costo_unitario: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric(10, 2))
 
     venta: Mapped['Venta'] = relationship('Venta', back_populates='detalles')
     producto: Mapped['Product'] = relationship('Product', back_populates='ventas_detalle')
@@ -261,7 +265,14 @@ class Stock(Base):
         ForeignKeyConstraint(['creado_por_id'], ['user.user_id'], ondelete='SET NULL', name='stock_creado_por_id_fkey'),
         ForeignKeyConstraint(['producto_id'], ['product.producto_id'], ondelete='CASCADE', name='stock_producto_id_fkey'),
         PrimaryKeyConstraint('stock_id', name='stock_pkey'),
-        Index('ix_stock_stock_id', 'stock_id')
+        Index('ix_stock_stock_id', 'stock_id'),
+        Index('ix_stock_producto_id', 'producto_id'),
+        Index(
+            'ix_stock_bajo_minimo',
+            'producto_id',
+            postgresql_where=text('cantidad_actual <= cantidad_minima'),
+            sqlite_where=text('cantidad_actual <= cantidad_minima'),
+        )
     )
 
     stock_id: Mapped[int] = mapped_column(Integer, Identity(start=1, increment=1, minvalue=1, maxvalue=2147483647, cycle=False, cache=1), primary_key=True)
@@ -269,13 +280,17 @@ class Stock(Base):
     cantidad_actual: Mapped[int] = mapped_column(Integer, nullable=False)
     cantidad_minima: Mapped[int] = mapped_column(Integer, nullable=False)
     ultima_actualizacion: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('1'))
     actualizado_por_id: Mapped[Optional[int]] = mapped_column(Integer)
     creado_por_id: Mapped[Optional[int]] = mapped_column(Integer)
 
+    __mapper_args__ = {'version_id_col': version}
+
     actualizado_por: Mapped[Optional['User']] = relationship('User', foreign_keys=[actualizado_por_id], back_populates='stock')
     creado_por: Mapped[Optional['User']] = relationship('User', foreign_keys=[creado_por_id], back_populates='stock_')
     producto: Mapped['Product'] = relationship('Product', back_populates='stock')
     movimientos_stock: Mapped[list['MovimientosStock']] = relationship('MovimientosStock', back_populates='stock')
+    snapshots: Mapped[list['SnapshotStock']] = relationship('SnapshotStock', back_populates='stock')
 
 
 class MovimientosStock(Base):
@@ -288,7 +303,9 @@ class MovimientosStock(Base):
         ForeignKeyConstraint(['stock_id'], ['stock.stock_id'], ondelete='CASCADE', name='movimientos_stock_stock_id_fkey'),
         ForeignKeyConstraint(['tipo_movimiento_id'], ['tipo_movimiento.tipo_movimiento_id'], name='movimientos_stock_tipo_movimiento_id_fkey'),
         PrimaryKeyConstraint('movimiento_id', name='movimientos_stock_pkey'),
-        Index('ix_movimientos_stock_movimiento_id', 'movimiento_id')
+        Index('ix_movimientos_stock_movimiento_id', 'movimiento_id'),
+        Index('ix_movimientos_stock_producto_id_fecha_creacion', 'producto_id', 'fecha_creacion', 'movimiento_id'),
+        Index('ix_movimientos_stock_stock_id_movimiento_id', 'stock_id', 'movimiento_id')
     )
 
     movimiento_id: Mapped[int] = mapped_column(Integer, Identity(start=1, increment=1, minvalue=1, maxvalue=2147483647, cycle=False, cache=1), primary_key=True)
@@ -307,3 +324,101 @@ class MovimientosStock(Base):
     ref_movimiento: Mapped['RefMovimiento'] = relationship('RefMovimiento', back_populates='movimientos_stock')
     stock: Mapped['Stock'] = relationship('Stock', back_populates='movimientos_stock')
     tipo_movimiento: Mapped['TipoMovimiento'] = relationship('TipoMovimiento', back_populates='movimientos_stock')
+
+
+class SnapshotStock(Base):
+    __tablename__ = 'snapshot_stock'
+    __table_args__ = (
+        ForeignKeyConstraint(['producto_id'], ['product.producto_id'], ondelete='CASCADE', name='snapshot_stock_producto_id_fkey'),
+        ForeignKeyConstraint(['stock_id'], ['stock.stock_id'], ondelete='CASCADE', name='snapshot_stock_stock_id_fkey'),
+        PrimaryKeyConstraint('snapshot_id', name='snapshot_stock_pkey'),
+        Index('ix_snapshot_stock_stock_id_snapshot_id', 'stock_id', 'snapshot_id')
+    )
+
+    snapshot_id: Mapped[int] = mapped_column(Integer, Identity(start=1, increment=1, minvalue=1, maxvalue=2147483647, cycle=False, cache=1), primary_key=True)
+    stock_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    producto_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    cantidad: Mapped[int] = mapped_column(Integer, nullable=False)
+    movimiento_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    fecha_creacion: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False)
+
+    producto: Mapped['Product'] = relationship('Product', back_populates='snapshots_stock')
+    stock: Mapped['Stock'] = relationship('Stock', back_populates='snapshots')
+
+
+class ResumenVentaDiaria(Base):
+    __tablename__ = 'resumen_venta_diaria'
+    __table_args__ = (
+        CheckConstraint('cantidad_transacciones >= 0', name='ck_resumen_venta_diaria_cantidad_no_negativa'),
+        PrimaryKeyConstraint('fecha', name='resumen_venta_diaria_pkey'),
+    )
+
+    fecha: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    total_ventas: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False, server_default=text('0'))
+    total_efectivo: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False, server_default=text('0'))
+    total_tarjeta: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False, server_default=text('0'))
+    total_transferencia: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False, server_default=text('0'))
+    cantidad_transacciones: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    fecha_actualizacion: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False)
+
+
+class CierreCaja(Base):
+    __tablename__ = 'cierre_caja'
+    __table_args__ = (
+        PrimaryKeyConstraint('cierre_id', name='cierre_caja_pkey'),
+        UniqueConstraint('fecha', name='cierre_caja_fecha_key'),
+    )
+
+    cierre_id: Mapped[int] = mapped_column(Integer, Identity(start=1, increment=1, minvalue=1, maxvalue=2147483647, cycle=False, cache=1), primary_key=True)
+    fecha: Mapped[datetime.date] = mapped_column(Date, nullable=False)
+    saldo_inicial: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    total_ventas_efectivo: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    total_ingresos: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    total_egresos: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    saldo_teorico: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    saldo_real: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    diferencia: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    fecha_creacion: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False)
+    observaciones: Mapped[Optional[str]] = mapped_column(String(255))
+    cerrado_por_whatsapp_user_id: Mapped[Optional[str]] = mapped_column(String(255))
+
+
+class ResumenContableMensual(Base):
+    __tablename__ = 'resumen_contable_mensual'
+    __table_args__ = (
+        CheckConstraint("serie IN ('venta', 'ingreso', 'egreso')", name='ck_resumen_contable_mensual_serie'),
+        PrimaryKeyConstraint('serie', 'mes', 'categoria_id', 'medio_pago', name='resumen_contable_mensual_pkey'),
+    )
+
+    serie: Mapped[str] = mapped_column(String(20), primary_key=True)
+    mes: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    categoria_id: Mapped[int] = mapped_column(Integer, primary_key=True, server_default=text('0'))
+    medio_pago: Mapped[str] = mapped_column(String(20), primary_key=True)
+    total: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False, server_default=text('0'))
+    cantidad: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    fecha_actualizacion: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False)
+
+
+class WebhookMensajeProcesado(Base):
+    __tablename__ = 'webhook_mensaje_procesado'
+    __table_args__ = (
+        PrimaryKeyConstraint('message_id', name='webhook_mensaje_procesado_pkey'),
+        Index('ix_webhook_mensaje_procesado_fecha', 'fecha_recepcion'),
+    )
+
+    message_id: Mapped[str] = mapped_column(String(128), primary_key=True)
+    fecha_recepcion: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False)
+
+
+class WebhookConversacion(Base):
+    __tablename__ = 'webhook_conversacion'
+    __table_args__ = (
+        PrimaryKeyConstraint('sender', name='webhook_conversacion_pkey'),
+        Index('ix_webhook_conversacion_expira_en', 'expira_en'),
+    )
+
+    sender: Mapped[str] = mapped_column(String(64), primary_key=True)
+    estado: Mapped[str] = mapped_column(String(50), nullable=False)
+    datos: Mapped[dict] = mapped_column(JSON, nullable=False)
+    expira_en: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False)
+    fecha_actualizacion: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable, TypeVar
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+T = TypeVar("T")
+
+MAX_ATTEMPTS = 3
+BASE_DELAY_SECONDS = 0.01
+
+# serialization_failure y deadlock_detected en PostgreSQL.
+_RETRYABLE_PGCODES = {"40001", "40P01"}
+
+
+def is_retryable_conflict(exc: Exception) -> bool:
+    if isinstance(exc, StaleDataError):
+        return True
+    if isinstance(exc, DBAPIError):
+        pgcode = getattr(exc.orig, "pgcode", None)
+        if pgcode in _RETRYABLE_PGCODES:
+            return True
+        return "database is locked" in str(exc.orig)
+    return False
+
+
+def run_with_retry(
+    db: Session,
+    operation: Callable[[], T],
+    *,
+    attempts: int = MAX_ATTEMPTS,
+    base_delay: float = BASE_DELAY_SECONDS,
+) -> T:
+    """
+    Ejecuta `operation` (una transaccion completa) y la repite ante conflictos de
+    concurrencia: version desactualizada, deadlock o fallo de serializacion.
+    Hace rollback antes de cada reintento y espera con backoff exponencial con jitter.
+    """
+    attempt = 1
+    while True:
+        try:
+            return operation()
+        except Exception as exc:
+            db.rollback()
+            if attempt >= attempts or not is_retryable_conflict(exc):
+                raise
+            time.sleep(base_delay * (2 ** (attempt - 1)) * (0.5 + random.random()))
+            attempt += 1
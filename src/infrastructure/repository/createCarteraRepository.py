@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import and_, case, func, literal, select
+from sqlalchemy.orm import Session
+
+from domain.entities.carteraEntity import CarteraAgingFilaEntity
+from domain.interfaces.cartera_repository_interface import CarteraRepositoryInterface
+from src.infrastructure.models.models import Cartera
+
+
+class CarteraRepository(CarteraRepositoryInterface):
+    """Consultas de cartera por cobrar."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_aging(
+        self,
+        fecha_corte: date,
+        *,
+        despues_de: Optional[str] = None,
+        limit_clientes: int = 50,
+    ) -> List[CarteraAgingFilaEntity]:
+        # "0" para los documentos sin cliente y "1" + nombre para el resto: un
+        # cliente "" no se mezcla con los NULL y el orden sigue siendo por nombre.
+        clave = case(
+            (Cartera.cliente.is_(None), literal("0")), else_=literal("1") + Cartera.cliente
+        )
+        # Dia en la zona horaria de la sesion: con el se arman los tramos y los dias.
+        dia = func.date(Cartera.fecha)
+        # Rango sobre la columna (con un dia de margen por zona horaria) para usar
+        # ix_cartera_fecha; el filtro por dia deja solo los documentos pedidos.
+        hasta_corte = (
+            Cartera.fecha < datetime.combine(fecha_corte + timedelta(days=2), time.min, tzinfo=timezone.utc),
+            dia <= fecha_corte,
+        )
+
+        # Pagina de clientes primero: las ventanas solo recorren sus documentos.
+        pagina = select(clave.label("clave")).where(*hasta_corte)
+        if despues_de is not None:
+            pagina = pagina.where(clave > despues_de)
+        pagina = pagina.group_by(clave).order_by(clave).limit(limit_clientes).cte("clientes_pagina")
+
+        por_cliente = {"partition_by": pagina.c.clave}
+        d30, d60, d90 = (fecha_corte - timedelta(days=dias) for dias in (30, 60, 90))
+        tramos = {
+            "total_0_30": dia >= d30,
+            "total_31_60": and_(dia < d30, dia >= d60),
+            "total_61_90": and_(dia < d60, dia >= d90),
+            "total_90_mas": dia < d90,
+        }
+        totales_tramo = [
+            func.sum(case((condicion, Cartera.monto), else_=0)).over(**por_cliente).label(nombre)
+            for nombre, condicion in tramos.items()
+        ]
+        query = (
+            select(
+                Cartera.cartera_id,
+                pagina.c.clave.label("clave_cliente"),
+                Cartera.cliente,
+                Cartera.fecha,
+                dia.label("dia"),
+                Cartera.monto,
+                Cartera.notas,
+                func.sum(Cartera.monto)
+                .over(
+                    **por_cliente,
+                    order_by=(Cartera.fecha, Cartera.cartera_id),
+                    rows=(None, 0),
+                )
+                .label("saldo_acumulado"),
+                *totales_tramo,
+                func.sum(Cartera.monto).over(**por_cliente).label("total_cliente"),
+            )
+            .join(pagina, pagina.c.clave == clave)
+            .where(*hasta_corte)
+            .order_by(pagina.c.clave, Cartera.fecha, Cartera.cartera_id)
+        )
+        return [
+            CarteraAgingFilaEntity.model_validate(row, from_attributes=True)
+            for row in self.db.execute(query)
+        ]
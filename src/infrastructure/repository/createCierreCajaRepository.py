@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from domain.entities.cierreCajaEntity import CierreCajaEntity, MovimientosCajaEntity
+from domain.interfaces.cierre_caja_repository_interface import (
+    CierreCajaRepositoryInterface,
+)
+from src.infrastructure.models.models import CierreCaja, Egreso, Ingreso, Venta
+from src.infrastructure.repository.fechas import filtro_dias
+
+EFECTIVO = "efectivo"
+
+
+def _suma_efectivo(modelo, columna_monto, columna_tipo, fecha: date):
+    return (
+        select(func.coalesce(func.sum(columna_monto), 0))
+        .where(columna_tipo == EFECTIVO, *filtro_dias(modelo.fecha, fecha, fecha))
+        .scalar_subquery()
+    )
+
+
+class CierreCajaRepository(CierreCajaRepositoryInterface):
+    """Repositorio para manejar los cierres de caja diarios."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create_cierre(self, entity: CierreCajaEntity) -> CierreCajaEntity:
+        cierre_orm = CierreCaja(
+            fecha=entity.fecha,
+            saldo_inicial=entity.saldo_inicial,
+            total_ventas_efectivo=entity.total_ventas_efectivo,
+            total_ingresos=entity.total_ingresos,
+            total_egresos=entity.total_egresos,
+            saldo_teorico=entity.saldo_teorico,
+            saldo_real=entity.saldo_real,
+            diferencia=entity.diferencia,
+            fecha_creacion=entity.fecha_creacion or datetime.now(timezone.utc),
+            observaciones=entity.observaciones,
+            cerrado_por_whatsapp_user_id=entity.cerrado_por_whatsapp_user_id,
+        )
+        self.db.add(cierre_orm)
+        try:
+            self.db.commit()
+        except IntegrityError as exc:
+            self.db.rollback()
+            raise ValueError("Ya existe un cierre de caja para la fecha") from exc
+        self.db.refresh(cierre_orm)
+        return CierreCajaEntity.from_model(cierre_orm)
+
+    def get_movimientos_caja(self, fecha: date) -> MovimientosCajaEntity:
+        saldo_anterior = (
+            select(CierreCaja.saldo_real)
+            .where(CierreCaja.fecha < fecha)
+            .order_by(CierreCaja.fecha.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        ventas = (
+            select(func.coalesce(func.sum(Venta.total), 0))
+            .where(
+                Venta.tipo_pago == EFECTIVO,
+                Venta.estado.is_(True),
+                *filtro_dias(Venta.fecha, fecha, fecha),
+            )
+            .scalar_subquery()
+        )
+        # Un solo viaje a la base: cada subconsulta usa el indice por fecha de su tabla.
+        row = self.db.execute(
+            select(
+                ventas,
+                _suma_efectivo(Ingreso, Ingreso.monto, Ingreso.tipo_ingreso, fecha),
+                _suma_efectivo(Egreso, Egreso.monto, Egreso.tipo_egreso, fecha),
+                saldo_anterior,
+            )
+        ).one()
+        total_ventas, total_ingresos, total_egresos, anterior = row
+        return MovimientosCajaEntity(
+            total_ventas_efectivo=Decimal(total_ventas),
+            total_ingresos=Decimal(total_ingresos),
+            total_egresos=Decimal(total_egresos),
+            saldo_anterior=None if anterior is None else Decimal(anterior),
+        )
+
+    def get_cierre(self, cierre_id: int) -> Optional[CierreCajaEntity]:
+        record = self.db.get(CierreCaja, cierre_id)
+        if not record:
+            return None
+        return CierreCajaEntity.from_model(record)
+
+    def get_by_fecha(self, fecha: date) -> Optional[CierreCajaEntity]:
+        record = self.db.execute(
+            select(CierreCaja).where(CierreCaja.fecha == fecha)
+        ).scalar_one_or_none()
+        if not record:
+            return None
+        return CierreCajaEntity.from_model(record)
+
+    def list_cierres(
+        self, *, desde: Optional[date] = None, hasta: Optional[date] = None
+    ) -> List[CierreCajaEntity]:
+        query = select(CierreCaja)
+        if desde:
+            query = query.where(CierreCaja.fecha >= desde)
+        if hasta:
+            query = query.where(CierreCaja.fecha <= hasta)
+        records = self.db.execute(query.order_by(CierreCaja.fecha)).scalars().all()
+        return [CierreCajaEntity.from_model(row) for row in records]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from domain.interfaces.conversation_state_store_interface import (
+    ConversationState,
+    ConversationStateStoreInterface,
+)
+from src.infrastructure.models.models import WebhookConversacion
+from src.infrastructure.repository.upsert import insert_for
+
+
+def _utc(valor: datetime) -> datetime:
+    # SQLite devuelve fechas sin zona; se guardan siempre en UTC.
+    return valor if valor.tzinfo else valor.replace(tzinfo=timezone.utc)
+
+
+class DbConversationStateStore(ConversationStateStoreInterface):
+    """
+    Estado de conversacion en la tabla `webhook_conversacion`, compartido entre
+    workers y nodos. Cada operacion es una sola sentencia: upsert por `sender`,
+    lectura filtrando vencidos y borrado. Sin mas, cada una usa una sesion corta
+    propia y la confirma (el store vive mas que cualquier request); `con_sesion`
+    da una vista que usa la sesion de la unidad de trabajo del llamador, que es
+    quien confirma o descarta.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        ttl_seconds: float,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+        *,
+        sesion: Optional[Callable[[], Session]] = None,
+    ):
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._sesion = sesion
+
+    def con_sesion(self, sesion: Callable[[], Session]) -> "DbConversationStateStore":
+        return DbConversationStateStore(
+            self.session_factory, self.ttl_seconds, self._clock, sesion=sesion
+        )
+
+    @contextmanager
+    def _db(self) -> Iterator[Session]:
+        if self._sesion is not None:
+            # Sesion ajena: la confirma y la cierra quien la abrio.
+            db = self._sesion()
+            yield db
+            db.flush()
+            return
+        with self.session_factory() as db:
+            yield db
+            db.commit()
+
+    def get(self, sender: str) -> Optional[ConversationState]:
+        with self._db() as db:
+            row = db.execute(
+                select(
+                    WebhookConversacion.estado,
+                    WebhookConversacion.expira_en,
+                    WebhookConversacion.datos,
+                ).where(
+                    WebhookConversacion.sender == sender,
+                    WebhookConversacion.expira_en > self._clock(),
+                )
+            ).first()
+        if row is None:
+            return None
+        return ConversationState(estado=row.estado, expira_en=_utc(row.expira_en), datos=row.datos)
+
+    def set(
+        self, sender: str, estado: str, datos: Optional[Dict[str, Any]] = None
+    ) -> ConversationState:
+        ahora = self._clock()
+        valores = {
+            "estado": estado,
+            "datos": dict(datos or {}),
+            "expira_en": ahora + timedelta(seconds=self.ttl_seconds),
+            "fecha_actualizacion": ahora,
+        }
+        with self._db() as db:
+            stmt = insert_for(db, WebhookConversacion).values(sender=sender, **valores)
+            db.execute(
+                stmt.on_conflict_do_update(index_elements=[WebhookConversacion.sender], set_=valores)
+            )
+        return ConversationState(estado=estado, expira_en=valores["expira_en"], datos=valores["datos"])
+
+    def clear(self, sender: str) -> None:
+        with self._db() as db:
+            db.execute(delete(WebhookConversacion).where(WebhookConversacion.sender == sender))
+
+    def purgar_vencidos(self) -> int:
+        """Borra los estados vencidos; las lecturas ya los ignoran, esto solo libera espacio."""
+        with self.session_factory() as db:
+            result = db.execute(
+                delete(WebhookConversacion).where(WebhookConversacion.expira_en <= self._clock())
+            )
+            db.commit()
+            return result.rowcount
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from domain.entities.egresoEntity import EgresoEntity
+from domain.entities.totalContableEntity import TotalContableEntity
+from domain.interfaces.egreso_repository_interface import EgresoRepositoryInterface
+from src.infrastructure.models.models import Categoria, Egreso
+from src.infrastructure.repository.createResumenContableRepository import (
+    ResumenContableRepository,
+)
+
+
+class EgresoRepository(EgresoRepositoryInterface):
+    """Repositorio para manejar operaciones relacionadas con egresos."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.resumen = ResumenContableRepository(db)
+
+    def create_egreso(self, entity: EgresoEntity) -> EgresoEntity:
+        egreso_orm = Egreso(
+            monto=entity.monto,
+            fecha=entity.fecha or datetime.now(timezone.utc),
+            tipo_egreso=entity.tipo_egreso,
+            categoria_id=entity.categoria_id,
+            notas=entity.notas,
+            cliente=entity.cliente,
+        )
+        self.db.add(egreso_orm)
+        self.db.flush()
+        self.resumen.acumular("egreso", egreso_orm.egreso_id)
+        self.db.commit()
+        self.db.refresh(egreso_orm)
+        return EgresoEntity.from_model(egreso_orm)
+
+    def get_egreso(self, egreso_id: int) -> Optional[EgresoEntity]:
+        record = self.db.get(Egreso, egreso_id)
+        if not record:
+            return None
+        return EgresoEntity.from_model(record)
+
+    def list_egresos(
+        self,
+        *,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+        despues_de: Optional[tuple[datetime, int]] = None,
+        limit: int = 50,
+    ) -> List[EgresoEntity]:
+        # Rango y orden por fecha: recorre ix_egreso_fecha sin OFFSET.
+        query = select(Egreso)
+        if desde is not None:
+            query = query.where(Egreso.fecha >= desde)
+        if hasta is not None:
+            query = query.where(Egreso.fecha < hasta)
+        if despues_de is not None:
+            query = query.where(tuple_(Egreso.fecha, Egreso.egreso_id) < tuple_(*despues_de))
+        query = query.order_by(Egreso.fecha.desc(), Egreso.egreso_id.desc()).limit(limit)
+        records = self.db.execute(query).scalars().all()
+        return [EgresoEntity.from_model(row) for row in records]
+
+    def get_totales(
+        self, *, desde_mes: Optional[date] = None, hasta_mes: Optional[date] = None
+    ) -> List[TotalContableEntity]:
+        totales = self.resumen.get_totales("egreso", desde_mes=desde_mes, hasta_mes=hasta_mes)
+        categoria_ids = {t.categoria_id for t in totales if t.categoria_id is not None}
+        if categoria_ids:
+            nombres = dict(
+                self.db.execute(
+                    select(Categoria.categoria_id, Categoria.nombre).where(
+                        Categoria.categoria_id.in_(categoria_ids)
+                    )
+                ).all()
+            )
+            for total in totales:
+                total.categoria_nombre = nombres.get(total.categoria_id)
+        return totales
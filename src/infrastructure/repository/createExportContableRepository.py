@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Iterator
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from domain.interfaces.export_contable_repository_interface import (
+    ExportContableRepositoryInterface,
+)
+from src.infrastructure.models.models import (
+    Categoria,
+    CategoriaContabilidad,
+    CierreCaja,
+    Egreso,
+    Ingreso,
+    Venta,
+)
+from src.infrastructure.repository.fechas import filtro_dias
+
+# Filas por viaje a la base; con `yield_per` PostgreSQL usa un cursor del lado
+# del servidor y nunca se materializa el periodo completo.
+BLOQUE_FILAS = 2000
+
+
+class ExportContableRepository(ExportContableRepositoryInterface):
+    def __init__(self, db: Session, bloque_filas: int = BLOQUE_FILAS):
+        self.db = db
+        self.bloque_filas = bloque_filas
+
+    def _iterar(self, query: Select) -> Iterator[tuple]:
+        result = self.db.execute(query.execution_options(yield_per=self.bloque_filas))
+        try:
+            for row in result:
+                yield tuple(row)
+        finally:
+            result.close()
+
+    def iter_ingresos(self, desde: date, hasta: date) -> Iterator[tuple]:
+        return self._iterar(
+            select(
+                Ingreso.ingreso_id,
+                Ingreso.fecha,
+                Ingreso.monto,
+                Ingreso.tipo_ingreso,
+                CategoriaContabilidad.nombre,
+                Ingreso.cliente,
+                Ingreso.notas,
+            )
+            .outerjoin(
+                CategoriaContabilidad,
+                CategoriaContabilidad.id == Ingreso.categoria_contabilidad_id,
+            )
+            .where(*filtro_dias(Ingreso.fecha, desde, hasta))
+            .order_by(Ingreso.fecha, Ingreso.ingreso_id)
+        )
+
+    def iter_egresos(self, desde: date, hasta: date) -> Iterator[tuple]:
+        return self._iterar(
+            select(
+                Egreso.egreso_id,
+                Egreso.fecha,
+                Egreso.monto,
+                Egreso.tipo_egreso,
+                Categoria.nombre,
+                Egreso.cliente,
+                Egreso.notas,
+            )
+            .outerjoin(Categoria, Categoria.categoria_id == Egreso.categoria_id)
+            .where(*filtro_dias(Egreso.fecha, desde, hasta))
+            .order_by(Egreso.fecha, Egreso.egreso_id)
+        )
+
+    def iter_ventas(self, desde: date, hasta: date) -> Iterator[tuple]:
+        return self._iterar(
+            select(
+                Venta.venta_id,
+                Venta.fecha,
+                Venta.tipo_pago,
+                Venta.subtotal,
+                Venta.impuesto,
+                Venta.descuento,
+                Venta.total,
+                Venta.estado,
+            )
+            .where(*filtro_dias(Venta.fecha, desde, hasta))
+            .order_by(Venta.fecha, Venta.venta_id)
+        )
+
+    def iter_cierres(self, desde: date, hasta: date) -> Iterator[tuple]:
+        return self._iterar(
+            select(
+                CierreCaja.cierre_id,
+                CierreCaja.fecha,
+                CierreCaja.saldo_inicial,
+                CierreCaja.total_ventas_efectivo,
+                CierreCaja.total_ingresos,
+                CierreCaja.total_egresos,
+                CierreCaja.saldo_teorico,
+                CierreCaja.saldo_real,
+                CierreCaja.diferencia,
+                CierreCaja.observaciones,
+            )
+            .where(CierreCaja.fecha.between(desde, hasta))
+            .order_by(CierreCaja.fecha)
+        )
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from domain.entities.ingresoEntity import IngresoEntity
+from domain.entities.totalContableEntity import TotalContableEntity
+from domain.interfaces.ingreso_repository_interface import IngresoRepositoryInterface
+from src.infrastructure.models.models import Ingreso
+from src.infrastructure.repository.createResumenContableRepository import (
+    ResumenContableRepository,
+)
+from src.infrastructure.repository.referenceData import (
+    ReferenceDataRegistry,
+    reference_data,
+)
+
+
+class IngresoRepository(IngresoRepositoryInterface):
+    """Repositorio para manejar operaciones relacionadas con ingresos."""
+
+    def __init__(self, db: Session, reference: Optional[ReferenceDataRegistry] = None):
+        self.db = db
+        self.reference = reference or reference_data
+        self.resumen = ResumenContableRepository(db)
+
+    def create_ingreso(self, entity: IngresoEntity) -> IngresoEntity:
+        ingreso_orm = Ingreso(
+            monto=entity.monto,
+            fecha=entity.fecha or datetime.now(timezone.utc),
+            tipo_ingreso=entity.tipo_ingreso,
+            categoria_contabilidad_id=entity.categoria_contabilidad_id,
+            notas=entity.notas,
+            cliente=entity.cliente,
+        )
+        self.db.add(ingreso_orm)
+        self.db.flush()
+        self.resumen.acumular("ingreso", ingreso_orm.ingreso_id)
+        self.db.commit()
+        self.db.refresh(ingreso_orm)
+        return IngresoEntity.from_model(ingreso_orm)
+
+    def get_ingreso(self, ingreso_id: int) -> Optional[IngresoEntity]:
+        record = self.db.get(Ingreso, ingreso_id)
+        if not record:
+            return None
+        return IngresoEntity.from_model(record)
+
+    def list_ingresos(
+        self,
+        *,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+        despues_de: Optional[tuple[datetime, int]] = None,
+        limit: int = 50,
+    ) -> List[IngresoEntity]:
+        # Rango y orden por fecha: recorre ix_ingreso_fecha sin OFFSET.
+        query = select(Ingreso)
+        if desde is not None:
+            query = query.where(Ingreso.fecha >= desde)
+        if hasta is not None:
+            query = query.where(Ingreso.fecha < hasta)
+        if despues_de is not None:
+            query = query.where(tuple_(Ingreso.fecha, Ingreso.ingreso_id) < tuple_(*despues_de))
+        query = query.order_by(Ingreso.fecha.desc(), Ingreso.ingreso_id.desc()).limit(limit)
+        records = self.db.execute(query).scalars().all()
+        return [IngresoEntity.from_model(row) for row in records]
+
+    def get_totales(
+        self, *, desde_mes: Optional[date] = None, hasta_mes: Optional[date] = None
+    ) -> List[TotalContableEntity]:
+        totales = self.resumen.get_totales("ingreso", desde_mes=desde_mes, hasta_mes=hasta_mes)
+        categorias = self.reference.get(self.db).categorias_contabilidad
+        for total in totales:
+            if total.categoria_id is not None:
+                categoria = categorias.get(total.categoria_id)
+                total.categoria_nombre = categoria.nombre if categoria else None
+        return totales
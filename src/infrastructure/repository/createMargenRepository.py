@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import List
+
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from domain.entities.margenEntity import MargenGrupoEntity
+from domain.interfaces.margen_repository_interface import MargenRepositoryInterface
+from src.infrastructure.models.models import Categoria, Product, Venta, VentaDetalle
+from src.infrastructure.repository.fechas import a_fecha, filtro_dias
+
+
+class MargenRepository(MargenRepositoryInterface):
+    """
+    Agregados de margen sobre `venta_detalle` usando el costo congelado en cada
+    linea (`costo_unitario`), no el costo actual del producto.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_margen(self, agrupar: str, desde: date, hasta: date) -> List[MargenGrupoEntity]:
+        if agrupar == "producto":
+            clave, nombre = VentaDetalle.producto_id, Product.nombre
+        elif agrupar == "categoria":
+            clave, nombre = Product.categoria_id, Categoria.nombre
+        elif agrupar == "dia":
+            clave = func.date(Venta.fecha)
+            nombre = None
+        else:
+            raise ValueError(f"Agrupacion no soportada: {agrupar}")
+
+        columnas = [
+            clave,
+            func.sum(VentaDetalle.cantidad),
+            func.sum(VentaDetalle.subtotal),
+            func.coalesce(func.sum(VentaDetalle.cantidad * VentaDetalle.costo_unitario), 0),
+            func.sum(case((VentaDetalle.costo_unitario.is_(None), 1), else_=0)),
+        ]
+        agrupacion = [clave]
+        if nombre is not None:
+            columnas.append(nombre)
+            agrupacion.append(nombre)
+
+        query = (
+            select(*columnas)
+            .select_from(VentaDetalle)
+            .join(Venta, Venta.venta_id == VentaDetalle.venta_id)
+            .where(Venta.estado.is_(True), *filtro_dias(Venta.fecha, desde, hasta))
+            .group_by(*agrupacion)
+        )
+        if agrupar != "dia":
+            query = query.join(Product, Product.producto_id == VentaDetalle.producto_id)
+        if agrupar == "categoria":
+            query = query.outerjoin(Categoria, Categoria.categoria_id == Product.categoria_id)
+
+        grupos = []
+        for row in self.db.execute(query):
+            valor = row[0]
+            if agrupar == "dia":
+                valor = a_fecha(valor).isoformat()
+            grupos.append(
+                MargenGrupoEntity(
+                    clave="sin-categoria" if valor is None else str(valor),
+                    nombre=row[5] if nombre is not None else None,
+                    unidades=row[1],
+                    ingresos=row[2],
+                    costo=row[3],
+                    lineas_sin_costo=row[4],
+                )
+            )
+        return grupos
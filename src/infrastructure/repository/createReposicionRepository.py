@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from domain.interfaces.reposicion_repository_interface import (
+    ReposicionRepositoryInterface,
+)
+from src.infrastructure.models.models import Product, Stock, Venta, VentaDetalle
+
+
+class ReposicionRepository(ReposicionRepositoryInterface):
+    """
+    Repositorio de lectura para el motor de reposicion. Devuelve tuplas planas en
+    lugar de entidades porque el servicio las convierte directo a arreglos NumPy.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_catalogo_stock(self) -> List[tuple[int, str, str, int, int]]:
+        rows = self.db.execute(
+            select(
+                Stock.producto_id,
+                Product.codigo_barras,
+                Product.nombre,
+                Stock.cantidad_actual,
+                Stock.cantidad_minima,
+            )
+            .join(Product, Product.producto_id == Stock.producto_id)
+            .where(Product.estado.is_(True))
+            .order_by(Stock.producto_id)
+        )
+        return [tuple(row) for row in rows]
+
+    def get_unidades_vendidas_por_dia(
+        self, desde: date, hasta: date
+    ) -> List[tuple[int, date, int]]:
+        inicio = datetime.combine(desde, time.min, tzinfo=timezone.utc)
+        fin = datetime.combine(hasta + timedelta(days=1), time.min, tzinfo=timezone.utc)
+        dia = func.date(Venta.fecha).label("dia")
+        rows = self.db.execute(
+            select(VentaDetalle.producto_id, dia, func.sum(VentaDetalle.cantidad))
+            .join(Venta, Venta.venta_id == VentaDetalle.venta_id)
+            .where(Venta.fecha >= inicio, Venta.fecha < fin, Venta.estado.is_(True))
+            .group_by(VentaDetalle.producto_id, dia)
+        )
+        return [
+            (
+                producto_id,
+                dia if isinstance(dia, date) else date.fromisoformat(str(dia)),
+                int(unidades),
+            )
+            for producto_id, dia, unidades in rows
+        ]
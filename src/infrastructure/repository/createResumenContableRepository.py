@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, List, Optional
+
+from sqlalchemy import DateTime, Select, String, case, cast, delete, func, literal, select
+from sqlalchemy.orm import Session
+
+from domain.entities.resumenContableEntity import ResultadoMensualEntity
+from domain.entities.totalContableEntity import TotalContableEntity
+from domain.interfaces.resumen_contable_repository_interface import (
+    ResumenContableRepositoryInterface,
+)
+from src.infrastructure.models.models import Egreso, Ingreso, ResumenContableMensual, Venta
+from src.infrastructure.repository.fechas import a_fecha, filtro_dias, inicio_mes
+from src.infrastructure.repository.upsert import insert_for
+
+SIN_CATEGORIA = 0
+
+
+@dataclass(frozen=True)
+class _Fuente:
+    id: Any
+    fecha: Any
+    medio_pago: Any
+    monto: Any
+    categoria: Any = None
+    filtros: tuple = ()
+
+
+FUENTES = {
+    "venta": _Fuente(
+        id=Venta.venta_id,
+        fecha=Venta.fecha,
+        medio_pago=Venta.tipo_pago,
+        monto=Venta.total,
+        filtros=(Venta.estado.is_(True),),
+    ),
+    "ingreso": _Fuente(
+        id=Ingreso.ingreso_id,
+        fecha=Ingreso.fecha,
+        categoria=func.coalesce(Ingreso.categoria_contabilidad_id, SIN_CATEGORIA),
+        medio_pago=Ingreso.tipo_ingreso,
+        monto=Ingreso.monto,
+    ),
+    "egreso": _Fuente(
+        id=Egreso.egreso_id,
+        fecha=Egreso.fecha,
+        categoria=func.coalesce(Egreso.categoria_id, SIN_CATEGORIA),
+        medio_pago=Egreso.tipo_egreso,
+        monto=Egreso.monto,
+    ),
+}
+
+COLUMNAS = ["serie", "mes", "categoria_id", "medio_pago", "total", "cantidad", "fecha_actualizacion"]
+
+
+def _fin_de_mes(mes: date) -> date:
+    return mes.replace(day=calendar.monthrange(mes.year, mes.month)[1])
+
+
+class ResumenContableRepository(ResumenContableRepositoryInterface):
+    """
+    Acumulados mensuales por (serie, mes, categoria, medio de pago). Se mantienen
+    en la misma transaccion que cada venta/ingreso/egreso y los reportes leen
+    solo estas filas.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _agregado(self, serie: str, *filtros) -> Select:
+        fuente = FUENTES[serie]
+        mes = inicio_mes(self.db, fuente.fecha)
+        medio_pago = cast(fuente.medio_pago, String(20))
+        agrupacion = [mes, medio_pago]
+        if fuente.categoria is None:
+            categoria = literal(SIN_CATEGORIA)
+        else:
+            categoria = fuente.categoria
+            agrupacion.append(categoria)
+        return (
+            select(
+                literal(serie, String(20)),
+                mes,
+                categoria,
+                medio_pago,
+                func.coalesce(func.sum(fuente.monto), 0),
+                func.count(),
+                literal(datetime.now(timezone.utc), DateTime(timezone=True)),
+            )
+            .where(*fuente.filtros, *filtros)
+            .group_by(*agrupacion)
+        )
+
+    def _insert_desde(self, agregado: Select):
+        return insert_for(self.db, ResumenContableMensual).from_select(COLUMNAS, agregado)
+
+    def acumular(self, serie: str, registro_id: int) -> None:
+        stmt = self._insert_desde(self._agregado(serie, FUENTES[serie].id == registro_id))
+        tabla = ResumenContableMensual.__table__
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[tabla.c.serie, tabla.c.mes, tabla.c.categoria_id, tabla.c.medio_pago],
+            set_={
+                "total": tabla.c.total + stmt.excluded.total,
+                "cantidad": tabla.c.cantidad + stmt.excluded.cantidad,
+                "fecha_actualizacion": stmt.excluded.fecha_actualizacion,
+            },
+        )
+        self.db.execute(stmt)
+
+    def reconstruir(self, desde_mes: date, hasta_mes: date) -> int:
+        desde_mes = desde_mes.replace(day=1)
+        hasta_mes = hasta_mes.replace(day=1)
+        try:
+            self.db.execute(
+                delete(ResumenContableMensual).where(
+                    ResumenContableMensual.mes.between(desde_mes, hasta_mes)
+                )
+            )
+            for serie, fuente in FUENTES.items():
+                filtros = filtro_dias(fuente.fecha, desde_mes, _fin_de_mes(hasta_mes))
+                self.db.execute(self._insert_desde(self._agregado(serie, *filtros)))
+            filas = self.db.scalar(
+                select(func.count())
+                .select_from(ResumenContableMensual)
+                .where(ResumenContableMensual.mes.between(desde_mes, hasta_mes))
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return int(filas or 0)
+
+    def get_totales(
+        self, serie: str, *, desde_mes: Optional[date] = None, hasta_mes: Optional[date] = None
+    ) -> List[TotalContableEntity]:
+        query = select(ResumenContableMensual).where(ResumenContableMensual.serie == serie)
+        if desde_mes:
+            query = query.where(ResumenContableMensual.mes >= desde_mes)
+        if hasta_mes:
+            query = query.where(ResumenContableMensual.mes <= hasta_mes)
+        query = query.order_by(
+            ResumenContableMensual.mes,
+            ResumenContableMensual.categoria_id,
+            ResumenContableMensual.medio_pago,
+        )
+        return [
+            TotalContableEntity(
+                mes=a_fecha(row.mes),
+                categoria_id=None if row.categoria_id == SIN_CATEGORIA else row.categoria_id,
+                medio_pago=row.medio_pago,
+                total=row.total,
+                cantidad=row.cantidad,
+            )
+            for row in self.db.execute(query).scalars()
+        ]
+
+    def get_resultado_mensual(
+        self, desde_mes: date, hasta_mes: date
+    ) -> List[ResultadoMensualEntity]:
+        def _suma(serie: str):
+            return func.coalesce(
+                func.sum(
+                    case(
+                        (ResumenContableMensual.serie == serie, ResumenContableMensual.total),
+                        else_=0,
+                    )
+                ),
+                0,
+            )
+
+        rows = self.db.execute(
+            select(
+                ResumenContableMensual.mes,
+                _suma("venta"),
+                _suma("ingreso"),
+                _suma("egreso"),
+            )
+            .where(ResumenContableMensual.mes.between(desde_mes, hasta_mes))
+            .group_by(ResumenContableMensual.mes)
+            .order_by(ResumenContableMensual.mes)
+        ).all()
+        return [
+            ResultadoMensualEntity(
+                mes=a_fecha(mes),
+                ventas=Decimal(ventas),
+                ingresos=Decimal(ingresos),
+                egresos=Decimal(egresos),
+            )
+            for mes, ventas, ingresos, egresos in rows
+        ]
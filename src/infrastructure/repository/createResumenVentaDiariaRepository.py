@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import DateTime, Select, case, delete, func, literal, select
+from sqlalchemy.orm import Session
+
+from domain.entities.resumenVentaDiariaEntity import ResumenVentaDiariaEntity
+from domain.interfaces.resumen_venta_diaria_repository_interface import (
+    ResumenVentaDiariaRepositoryInterface,
+)
+from src.infrastructure.models.models import ResumenVentaDiaria, Venta
+from src.infrastructure.repository.fechas import filtro_dias
+from src.infrastructure.repository.upsert import insert_for
+
+CONTADORES = (
+    "total_ventas",
+    "total_efectivo",
+    "total_tarjeta",
+    "total_transferencia",
+    "cantidad_transacciones",
+)
+
+
+def _total_por_tipo(tipo_pago: str):
+    return func.coalesce(
+        func.sum(case((Venta.tipo_pago == tipo_pago, Venta.total), else_=0)), 0
+    )
+
+
+def _agregado_ventas(*filtros) -> Select:
+    """
+    Agrega las ventas activas por dia. Es la misma expresion para el upsert
+    incremental y para la reconstruccion, asi ambos caminos coinciden.
+    """
+    dia = func.date(Venta.fecha)
+    return (
+        select(
+            dia,
+            func.coalesce(func.sum(Venta.total), 0),
+            _total_por_tipo("efectivo"),
+            _total_por_tipo("tarjeta"),
+            _total_por_tipo("transferencia"),
+            func.count(),
+            literal(datetime.now(timezone.utc), DateTime(timezone=True)),
+        )
+        .where(Venta.estado.is_(True), *filtros)
+        .group_by(dia)
+    )
+
+
+class ResumenVentaDiariaRepository(ResumenVentaDiariaRepositoryInterface):
+    """Repositorio del resumen diario de ventas, una fila por fecha."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _insert_desde(self, agregado: Select):
+        return insert_for(self.db, ResumenVentaDiaria).from_select(
+            ["fecha", *CONTADORES, "fecha_actualizacion"], agregado
+        )
+
+    def acumular_venta(self, venta_id: int) -> None:
+        stmt = self._insert_desde(_agregado_ventas(Venta.venta_id == venta_id))
+        tabla = ResumenVentaDiaria.__table__
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[tabla.c.fecha],
+            set_={
+                **{col: tabla.c[col] + stmt.excluded[col] for col in CONTADORES},
+                "fecha_actualizacion": stmt.excluded.fecha_actualizacion,
+            },
+        )
+        self.db.execute(stmt)
+
+    def reconstruir(self, desde: date, hasta: date) -> int:
+        agregado = _agregado_ventas(*filtro_dias(Venta.fecha, desde, hasta))
+        try:
+            self.db.execute(
+                delete(ResumenVentaDiaria).where(ResumenVentaDiaria.fecha.between(desde, hasta))
+            )
+            self.db.execute(self._insert_desde(agregado))
+            dias = self.db.scalar(
+                select(func.count())
+                .select_from(ResumenVentaDiaria)
+                .where(ResumenVentaDiaria.fecha.between(desde, hasta))
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return int(dias or 0)
+
+    def get_by_fecha(self, fecha: date) -> Optional[ResumenVentaDiariaEntity]:
+        record = self.db.get(ResumenVentaDiaria, fecha)
+        if not record:
+            return None
+        return ResumenVentaDiariaEntity.from_model(record)
+
+    def list_resumenes(
+        self, *, desde: Optional[date] = None, hasta: Optional[date] = None
+    ) -> List[ResumenVentaDiariaEntity]:
+        query = select(ResumenVentaDiaria)
+        if desde:
+            query = query.where(ResumenVentaDiaria.fecha >= desde)
+        if hasta:
+            query = query.where(ResumenVentaDiaria.fecha <= hasta)
+        records = self.db.execute(query.order_by(ResumenVentaDiaria.fecha)).scalars().all()
+        return [ResumenVentaDiariaEntity.from_model(row) for row in records]
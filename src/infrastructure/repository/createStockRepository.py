@@ -1,21 +1,36 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
-from sqlalchemy import or_
+from sqlalchemy import Select, bindparam, func, insert, literal, or_, select, text, tuple_, update
 from sqlalchemy.orm import Session
 
+from domain.entities.conteoStockEntity import ConteoStockVariacionEntity
+from domain.entities.movimientoStockEntity import MovimientoStockEntity
 from domain.entities.stockEntity import StockEntity
+from domain.entities.stockLedgerEntity import StockLedgerEntity
 from domain.interfaces.stock_repository_interface import StockRepositoryInterface
-from src.infrastructure.models.models import Stock
+from src.infrastructure.models.models import (
+    MovimientosStock,
+    Product,
+    SnapshotStock,
+    Stock,
+    TipoMovimiento,
+)
+from src.infrastructure.repository.concurrency import run_with_retry
+from src.infrastructure.repository.referenceData import (
+    ReferenceDataRegistry,
+    reference_data,
+)
 
 
 class StockRepository(StockRepositoryInterface):
     """Repositorio para manejar operaciones relacionadas con stock."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, reference: Optional[ReferenceDataRegistry] = None):
         self.db = db
+        self.reference = reference or reference_data
 
     def create_stock(self, stock_entity: StockEntity) -> StockEntity:
         ultima_actualizacion = stock_entity.ultima_actualizacion or datetime.now(timezone.utc)
@@ -30,6 +45,17 @@ class StockRepository(StockRepositoryInterface):
         )
 
         self.db.add(stock_orm)
+        self.db.flush()
+        # Snapshot inicial: el ledger del stock arranca en la cantidad creada.
+        self.db.add(
+            SnapshotStock(
+                stock_id=stock_orm.stock_id,
+                producto_id=stock_orm.producto_id,
+                cantidad=stock_orm.cantidad_actual,
+                movimiento_id=0,
+                fecha_creacion=ultima_actualizacion,
+            )
+        )
         self.db.commit()
         self.db.refresh(stock_orm)
         return StockEntity.from_model(stock_orm)
@@ -61,3 +87,332 @@ class StockRepository(StockRepositoryInterface):
             else self.db.query(Stock).all()
         )
         return [StockEntity.from_model(row) for row in records]
+
+    def list_low_stock(
+        self, producto_ids: Optional[Iterable[int]] = None
+    ) -> List[StockEntity]:
+        # El filtro coincide con el predicado de ix_stock_bajo_minimo para que
+        # la consulta recorra solo el indice parcial y no toda la tabla.
+        query = (
+            self.db.query(Stock, Product.nombre)
+            .join(Product, Product.producto_id == Stock.producto_id)
+            .filter(Stock.cantidad_actual <= Stock.cantidad_minima)
+        )
+        if producto_ids is not None:
+            ids = list(producto_ids)
+            if not ids:
+                return []
+            query = query.filter(Stock.producto_id.in_(ids))
+
+        entities = []
+        for record, producto_nombre in query.order_by(Stock.producto_id).all():
+            entity = StockEntity.from_model(record)
+            entity.producto_nombre = producto_nombre
+            entities.append(entity)
+        return entities
+
+    def registrar_movimiento(
+        self, movimiento: MovimientoStockEntity
+    ) -> MovimientoStockEntity:
+        return run_with_retry(self.db, lambda: self._registrar_movimiento(movimiento))
+
+    def _registrar_movimiento(
+        self, movimiento: MovimientoStockEntity
+    ) -> MovimientoStockEntity:
+        stock_id = (
+            self.db.query(Stock.stock_id)
+            .filter(Stock.producto_id == movimiento.producto_id)
+            .scalar()
+        )
+        if stock_id is None:
+            raise ValueError("El producto no tiene stock registrado")
+
+        tipo = self.reference.tipo_movimiento(self.db, movimiento.tipo_movimiento_id)
+        if tipo is None:
+            raise ValueError("Tipo de movimiento no encontrado")
+
+        delta = tipo.signo * movimiento.cantidad
+        fecha = movimiento.fecha_creacion or datetime.now(timezone.utc)
+        # UPDATE condicionado: el chequeo de saldo y la escritura son atomicos, asi
+        # dos cajeros vendiendo la ultima unidad no pierden actualizaciones ni
+        # necesitan SELECT ... FOR UPDATE.
+        values = {
+            "cantidad_actual": Stock.cantidad_actual + delta,
+            "version": Stock.version + 1,
+            "ultima_actualizacion": fecha,
+        }
+        if movimiento.realizado_por_id is not None:
+            values["actualizado_por_id"] = movimiento.realizado_por_id
+        result = self.db.execute(
+            update(Stock)
+            .where(Stock.stock_id == stock_id, Stock.cantidad_actual + delta >= 0)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            self.db.rollback()
+            raise ValueError("Stock insuficiente para el movimiento")
+
+        movimiento_orm = MovimientosStock(
+            stock_id=stock_id,
+            producto_id=movimiento.producto_id,
+            tipo_movimiento_id=movimiento.tipo_movimiento_id,
+            ref_movimiento_id=movimiento.ref_movimiento_id,
+            cantidad=movimiento.cantidad,
+            fecha_creacion=fecha,
+            referencia_doc=movimiento.referencia_doc,
+            nota=movimiento.nota,
+            realizado_por_id=movimiento.realizado_por_id,
+        )
+        self.db.add(movimiento_orm)
+        self.db.commit()
+        self.db.refresh(movimiento_orm)
+        return MovimientoStockEntity.from_model(movimiento_orm)
+
+    def get_stock_ledger(self, stock_id: int) -> Optional[StockLedgerEntity]:
+        row = self.db.execute(
+            self._ledger_select().where(Stock.stock_id == stock_id)
+        ).first()
+        if not row:
+            return None
+        return StockLedgerEntity.from_model(row)
+
+    def list_stock_ledger(self) -> List[StockLedgerEntity]:
+        rows = self.db.execute(self._ledger_select().order_by(Stock.stock_id))
+        return [StockLedgerEntity.from_model(row) for row in rows]
+
+    def _bloquear_movimientos(self) -> None:
+        """
+        Un movimiento puede recibir un ID menor y confirmarse despues de leer el
+        limite del snapshot; quedaria fuera de este y del siguiente (que arranca
+        en `> hasta`). En PostgreSQL el modo SHARE espera a que terminen las
+        transacciones que estan insertando movimientos y frena las nuevas hasta
+        el commit del snapshot. SQLite ya serializa las escrituras: un escritor
+        en curso hace fallar el snapshot en vez de quedar afuera.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            self.db.execute(text(f"LOCK TABLE {MovimientosStock.__tablename__} IN SHARE MODE"))
+
+    def crear_snapshots(self) -> tuple[int, int]:
+        self._bloquear_movimientos()
+        # Los movimientos con ID mayor al limite quedan para el siguiente snapshot.
+        hasta = self.db.query(
+            func.coalesce(func.max(MovimientosStock.movimiento_id), 0)
+        ).scalar()
+        ahora = datetime.now(timezone.utc)
+        snapshot, movimientos = self._ledger_parts(hasta_movimiento_id=hasta)
+
+        nuevos = (
+            select(
+                Stock.stock_id,
+                Stock.producto_id,
+                self._cantidad_ledger(snapshot, movimientos),
+                literal(hasta),
+                literal(ahora),
+            )
+            .join(snapshot, snapshot.c.stock_id == Stock.stock_id)
+            .join(movimientos, movimientos.c.stock_id == Stock.stock_id)
+        )
+        # Stocks previos al ledger: se inicializan desde su cantidad_actual.
+        iniciales = (
+            select(
+                Stock.stock_id,
+                Stock.producto_id,
+                Stock.cantidad_actual,
+                literal(hasta),
+                literal(ahora),
+            )
+            .outerjoin(snapshot, snapshot.c.stock_id == Stock.stock_id)
+            .where(snapshot.c.stock_id.is_(None))
+        )
+
+        columnas = ["stock_id", "producto_id", "cantidad", "movimiento_id", "fecha_creacion"]
+        creados = 0
+        for consulta in (nuevos, iniciales):
+            result = self.db.execute(
+                insert(SnapshotStock).from_select(columnas, consulta)
+            )
+            creados += max(result.rowcount or 0, 0)
+        self.db.commit()
+        return creados, hasta
+
+    def aplicar_conteo(
+        self,
+        conteos: Dict[str, int],
+        *,
+        tipo_entrada_id: int,
+        tipo_salida_id: int,
+        ref_movimiento_id: int,
+        referencia_doc: Optional[str] = None,
+        realizado_por_id: Optional[int] = None,
+    ) -> tuple[List[ConteoStockVariacionEntity], List[str]]:
+        if not conteos:
+            return [], []
+
+        entrada = self.reference.tipo_movimiento(self.db, tipo_entrada_id)
+        salida = self.reference.tipo_movimiento(self.db, tipo_salida_id)
+        if entrada is None or entrada.signo != 1 or salida is None or salida.signo != -1:
+            raise ValueError("Los tipos de movimiento de entrada/salida no son validos")
+
+        rows = self.db.execute(
+            select(
+                Stock.stock_id,
+                Stock.producto_id,
+                Product.codigo_barras,
+                Product.nombre,
+                Product.costo,
+                Stock.cantidad_actual.label("cantidad_sistema"),
+            )
+            .join(Product, Product.producto_id == Stock.producto_id)
+            .where(Product.codigo_barras.in_(list(conteos)))
+        ).all()
+
+        variaciones = [
+            ConteoStockVariacionEntity(
+                stock_id=row.stock_id,
+                producto_id=row.producto_id,
+                codigo_barras=row.codigo_barras,
+                nombre=row.nombre,
+                costo=row.costo,
+                cantidad_sistema=row.cantidad_sistema,
+                cantidad_contada=conteos[row.codigo_barras],
+            )
+            for row in rows
+        ]
+        encontrados = {row.codigo_barras for row in rows}
+        no_encontrados = [codigo for codigo in conteos if codigo not in encontrados]
+
+        ajustes = [v for v in variaciones if v.diferencia != 0]
+        if ajustes:
+            fecha = datetime.now(timezone.utc)
+            self.db.execute(
+                insert(MovimientosStock),
+                [
+                    {
+                        "stock_id": v.stock_id,
+                        "producto_id": v.producto_id,
+                        "tipo_movimiento_id": (
+                            tipo_entrada_id if v.diferencia > 0 else tipo_salida_id
+                        ),
+                        "ref_movimiento_id": ref_movimiento_id,
+                        "cantidad": abs(v.diferencia),
+                        "fecha_creacion": fecha,
+                        "referencia_doc": referencia_doc,
+                        "nota": "Conteo fisico",
+                        "realizado_por_id": realizado_por_id,
+                    }
+                    for v in ajustes
+                ],
+            )
+            # Se aplica la diferencia y no el valor contado para no pisar
+            # ventas registradas entre la lectura y la escritura.
+            valores = {
+                "cantidad_actual": Stock.__table__.c.cantidad_actual + bindparam("b_delta"),
+                "version": Stock.__table__.c.version + 1,
+                "ultima_actualizacion": fecha,
+            }
+            if realizado_por_id is not None:
+                valores["actualizado_por_id"] = realizado_por_id
+            self.db.execute(
+                update(Stock.__table__)
+                .where(Stock.__table__.c.stock_id == bindparam("b_stock_id"))
+                .values(**valores),
+                [{"b_stock_id": v.stock_id, "b_delta": v.diferencia} for v in ajustes],
+            )
+        self.db.commit()
+        return variaciones, no_encontrados
+
+    def list_movimientos(
+        self,
+        producto_id: int,
+        *,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+        tipo_movimiento_id: Optional[int] = None,
+        despues_de: Optional[tuple[datetime, int]] = None,
+        limit: int = 50,
+    ) -> List[MovimientoStockEntity]:
+        # Filtro y orden siguen ix_movimientos_stock_producto_id_fecha_creacion.
+        query = select(MovimientosStock).where(MovimientosStock.producto_id == producto_id)
+        if desde is not None:
+            query = query.where(MovimientosStock.fecha_creacion >= desde)
+        if hasta is not None:
+            query = query.where(MovimientosStock.fecha_creacion < hasta)
+        if tipo_movimiento_id is not None:
+            query = query.where(MovimientosStock.tipo_movimiento_id == tipo_movimiento_id)
+        if despues_de is not None:
+            query = query.where(
+                tuple_(MovimientosStock.fecha_creacion, MovimientosStock.movimiento_id)
+                < tuple_(*despues_de)
+            )
+        query = query.order_by(
+            MovimientosStock.fecha_creacion.desc(),
+            MovimientosStock.movimiento_id.desc(),
+        ).limit(limit)
+        records = self.db.execute(query).scalars().all()
+        return [MovimientoStockEntity.from_model(row) for row in records]
+
+    def get_nombres_tipo_movimiento(self) -> Dict[int, str]:
+        return self.reference.get(self.db).tipos_movimiento.nombres()
+
+    def get_nombres_ref_movimiento(self) -> Dict[int, str]:
+        return self.reference.get(self.db).refs_movimiento.nombres()
+
+    def _ledger_parts(self, hasta_movimiento_id: Optional[int] = None):
+        ultimo = (
+            select(
+                SnapshotStock.stock_id,
+                func.max(SnapshotStock.snapshot_id).label("snapshot_id"),
+            )
+            .group_by(SnapshotStock.stock_id)
+            .subquery()
+        )
+        snapshot = (
+            select(
+                SnapshotStock.stock_id,
+                SnapshotStock.cantidad,
+                SnapshotStock.movimiento_id,
+            )
+            .join(ultimo, ultimo.c.snapshot_id == SnapshotStock.snapshot_id)
+            .subquery()
+        )
+
+        movimientos_query = (
+            select(
+                MovimientosStock.stock_id,
+                func.sum(MovimientosStock.cantidad * TipoMovimiento.signo).label("delta"),
+            )
+            .join(
+                TipoMovimiento,
+                TipoMovimiento.tipo_movimiento_id == MovimientosStock.tipo_movimiento_id,
+            )
+            .outerjoin(snapshot, snapshot.c.stock_id == MovimientosStock.stock_id)
+            .where(
+                MovimientosStock.movimiento_id > func.coalesce(snapshot.c.movimiento_id, 0)
+            )
+            .group_by(MovimientosStock.stock_id)
+        )
+        if hasta_movimiento_id is not None:
+            movimientos_query = movimientos_query.where(
+                MovimientosStock.movimiento_id <= hasta_movimiento_id
+            )
+        return snapshot, movimientos_query.subquery()
+
+    @staticmethod
+    def _cantidad_ledger(snapshot, movimientos):
+        return (
+            func.coalesce(snapshot.c.cantidad, 0) + func.coalesce(movimientos.c.delta, 0)
+        ).label("cantidad_ledger")
+
+    def _ledger_select(self) -> Select:
+        snapshot, movimientos = self._ledger_parts()
+        return (
+            select(
+                Stock.stock_id,
+                Stock.producto_id,
+                Stock.cantidad_actual,
+                self._cantidad_ledger(snapshot, movimientos),
+            )
+            .outerjoin(snapshot, snapshot.c.stock_id == Stock.stock_id)
+            .outerjoin(movimientos, movimientos.c.stock_id == Stock.stock_id)
+        )
@@ -3,13 +3,19 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import or_
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session, selectinload
 
 from domain.entities.ventaDetalleEntity import VentaDetalleEntity
 from domain.entities.ventaEntity import VentaEntity
 from domain.interfaces.venta_repository_interface import VentaRepositoryInterface
-from src.infrastructure.models.models import Venta, VentaDetalle
+from src.infrastructure.models.models import Product, Venta, VentaDetalle
+from src.infrastructure.repository.createResumenContableRepository import (
+    ResumenContableRepository,
+)
+from src.infrastructure.repository.createResumenVentaDiariaRepository import (
+    ResumenVentaDiariaRepository,
+)
 
 
 class VentaRepository(VentaRepositoryInterface):
@@ -17,10 +23,28 @@ class VentaRepository(VentaRepositoryInterface):
 
     def __init__(self, db: Session):
         self.db = db
+        self.resumen = ResumenVentaDiariaRepository(db)
+        self.resumen_mensual = ResumenContableRepository(db)
 
     def create_venta(
         self, venta_entity: VentaEntity, detalles: List[VentaDetalleEntity]
     ) -> VentaEntity:
+        # Una sola consulta para todos los productos de la venta: el costo queda
+        # congelado en cada linea para los reportes de margen.
+        producto_ids = {detalle.producto_id for detalle in detalles}
+        costos = {}
+        if producto_ids:
+            costos = dict(
+                self.db.execute(
+                    select(Product.producto_id, Product.costo).where(
+                        Product.producto_id.in_(producto_ids)
+                    )
+                ).all()
+            )
+        faltantes = sorted(producto_ids - costos.keys())
+        if faltantes:
+            raise ValueError(f"Productos no encontrados: {faltantes}")
+
         venta_orm = Venta(
             venta_id=venta_entity.venta_id,
             fecha=venta_entity.fecha,
@@ -42,12 +66,16 @@ class VentaRepository(VentaRepositoryInterface):
                 cantidad=detalle.cantidad,
                 precio_unitario=detalle.precio_unitario,
                 subtotal=detalle.subtotal,
+                costo_unitario=costos[detalle.producto_id],
             )
             for detalle in detalles
         ]
         if detalle_orms:
             self.db.add_all(detalle_orms)
 
+        # Los resumenes diario y mensual se actualizan en la misma transaccion.
+        self.resumen.acumular_venta(venta_orm.venta_id)
+        self.resumen_mensual.acumular("venta", venta_orm.venta_id)
         self.db.commit()
         self.db.refresh(venta_orm)
         venta_orm.detalles = detalle_orms
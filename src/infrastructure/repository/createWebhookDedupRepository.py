@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from src.infrastructure.models.models import WebhookMensajeProcesado
+from src.infrastructure.repository.upsert import insert_for
+
+
+class WebhookDedupRepository:
+    """
+    Registro compartido de mensajes de WhatsApp ya procesados, para que varios
+    procesos no atiendan dos veces la misma entrega. La clave primaria sobre
+    `message_id` hace del INSERT un "reclamo" atomico.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def reclamar(self, message_id: str) -> bool:
+        """True si este proceso es el primero en ver `message_id`."""
+        stmt = (
+            insert_for(self.db, WebhookMensajeProcesado)
+            .values(message_id=message_id, fecha_recepcion=datetime.now(timezone.utc))
+            .on_conflict_do_nothing(index_elements=[WebhookMensajeProcesado.message_id])
+        )
+        result = self.db.execute(stmt)
+        self.db.commit()
+        return result.rowcount == 1
+
+    def purgar(self, antes_de: datetime) -> int:
+        """Borra los registros recibidos antes de `antes_de`; Meta no reintenta tanto."""
+        result = self.db.execute(
+            delete(WebhookMensajeProcesado).where(WebhookMensajeProcesado.fecha_recepcion < antes_de)
+        )
+        self.db.commit()
+        return result.rowcount
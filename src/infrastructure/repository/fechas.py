@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.orm import Session
+
+
+def filtro_dias(columna, desde: date, hasta: date) -> tuple:
+    """
+    Filtros para los registros cuyo dia (segun `date()` de la base) esta entre
+    `desde` y `hasta`. El rango sobre la columna, con un dia de margen por zona
+    horaria, permite usar su indice; el filtro por dia deja solo los pedidos.
+    """
+    inicio = datetime.combine(desde - timedelta(days=1), time.min, tzinfo=timezone.utc)
+    fin = datetime.combine(hasta + timedelta(days=2), time.min, tzinfo=timezone.utc)
+    return (
+        columna >= inicio,
+        columna < fin,
+        func.date(columna).between(desde, hasta),
+    )
+
+
+def inicio_mes(db: Session, columna):
+    """Expresion del primer dia del mes de `columna`, segun el dialecto."""
+    if db.get_bind().dialect.name == "sqlite":
+        return func.strftime("%Y-%m-01", columna)
+    # Literal en el SQL (no parametro) para que SELECT y GROUP BY coincidan.
+    return func.date(func.date_trunc(literal_column("'month'"), columna))
+
+
+def a_fecha(valor) -> date:
+    """Normaliza el resultado de `date()`/`inicio_mes` (SQLite devuelve texto)."""
+    return valor if isinstance(valor, date) else date.fromisoformat(str(valor)[:10])
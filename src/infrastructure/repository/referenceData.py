@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Generic, Mapping, Optional, TypeVar
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from domain.services.snapshot_cache import SnapshotCache, normalizar_nombre
+from src.infrastructure.models.models import (
+    CategoriaContabilidad,
+    RefMovimiento,
+    TipoMovimiento,
+)
+
+
+@dataclass(frozen=True)
+class TipoMovimientoRef:
+    tipo_movimiento_id: int
+    nombre: str
+    activo: bool
+    signo: int
+
+
+@dataclass(frozen=True)
+class RefMovimientoRef:
+    ref_movimiento_id: int
+    nombre: str
+    activo: bool
+
+
+@dataclass(frozen=True)
+class CategoriaContabilidadRef:
+    id: int
+    nombre: str
+    codigo: str
+
+
+T = TypeVar("T")
+
+
+class Catalogo(Generic[T]):
+    """Tabla de referencia inmutable indexada por id y por nombre normalizado."""
+
+    def __init__(self, items: list[T], id_attr: str):
+        self.por_id: Mapping[int, T] = MappingProxyType(
+            {getattr(item, id_attr): item for item in items}
+        )
+        self.por_nombre: Mapping[str, T] = MappingProxyType(
+            {normalizar_nombre(item.nombre): item for item in items}
+        )
+
+    def get(self, item_id: int) -> Optional[T]:
+        return self.por_id.get(item_id)
+
+    def get_by_nombre(self, nombre: str) -> Optional[T]:
+        return self.por_nombre.get(normalizar_nombre(nombre))
+
+    def nombres(self) -> dict[int, str]:
+        return {item_id: item.nombre for item_id, item in self.por_id.items()}
+
+    def __len__(self) -> int:
+        return len(self.por_id)
+
+
+@dataclass(frozen=True)
+class ReferenceData:
+    tipos_movimiento: Catalogo[TipoMovimientoRef]
+    refs_movimiento: Catalogo[RefMovimientoRef]
+    categorias_contabilidad: Catalogo[CategoriaContabilidadRef]
+    cargado_en: float
+
+
+def load_reference_data(db: Session, cargado_en: float) -> ReferenceData:
+    """Lee las tres tablas de referencia en una sola pasada."""
+    tipos = [
+        TipoMovimientoRef(*row)
+        for row in db.execute(
+            select(
+                TipoMovimiento.tipo_movimiento_id,
+                TipoMovimiento.nombre,
+                TipoMovimiento.activo,
+                TipoMovimiento.signo,
+            )
+        ).all()
+    ]
+    refs = [
+        RefMovimientoRef(*row)
+        for row in db.execute(
+            select(
+                RefMovimiento.ref_movimiento_id,
+                RefMovimiento.nombre,
+                RefMovimiento.activo,
+            )
+        ).all()
+    ]
+    categorias = [
+        CategoriaContabilidadRef(*row)
+        for row in db.execute(
+            select(
+                CategoriaContabilidad.id,
+                CategoriaContabilidad.nombre,
+                CategoriaContabilidad.codigo,
+            )
+        ).all()
+    ]
+    return ReferenceData(
+        tipos_movimiento=Catalogo(tipos, "tipo_movimiento_id"),
+        refs_movimiento=Catalogo(refs, "ref_movimiento_id"),
+        categorias_contabilidad=Catalogo(categorias, "id"),
+        cargado_en=cargado_en,
+    )
+
+
+class ReferenceDataRegistry(SnapshotCache[Session, ReferenceData]):
+    """
+    Cache en proceso de las tablas de referencia (tipos/refs de movimiento y
+    categorias contables). Se carga al arrancar y se reemplaza completa cuando
+    vence el TTL o cuando una sesion confirma escrituras sobre esas tablas.
+    """
+
+    def _leer(self, db: Session, cargado_en: float) -> ReferenceData:
+        return load_reference_data(db, cargado_en)
+
+    def tipo_movimiento(self, db: Session, tipo_movimiento_id: int) -> Optional[TipoMovimientoRef]:
+        tipo = self.get(db).tipos_movimiento.get(tipo_movimiento_id)
+        if tipo is None:
+            # Puede haberse creado en otro proceso: una recarga (limitada) antes de rechazarlo.
+            tipo = self.recargar(db).tipos_movimiento.get(tipo_movimiento_id)
+        return tipo
+
+    def ref_movimiento(self, db: Session, ref_movimiento_id: int) -> Optional[RefMovimientoRef]:
+        ref = self.get(db).refs_movimiento.get(ref_movimiento_id)
+        if ref is None:
+            ref = self.recargar(db).refs_movimiento.get(ref_movimiento_id)
+        return ref
+
+    def categoria_contabilidad(
+        self, db: Session, categoria_id: int
+    ) -> Optional[CategoriaContabilidadRef]:
+        categoria = self.get(db).categorias_contabilidad.get(categoria_id)
+        if categoria is None:
+            categoria = self.recargar(db).categorias_contabilidad.get(categoria_id)
+        return categoria
+
+
+REFERENCE_MODELS = (TipoMovimiento, RefMovimiento, CategoriaContabilidad)
+_PENDING_KEY = "reference_data_dirty"
+
+reference_data = ReferenceDataRegistry()
+
+
+@event.listens_for(Session, "after_flush")
+def _marcar_escritura_referencia(session: Session, flush_context) -> None:
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, REFERENCE_MODELS):
+            session.info[_PENDING_KEY] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _refrescar_tras_commit(session: Session) -> None:
+    if session.info.pop(_PENDING_KEY, False):
+        reference_data.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_marca(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def insert_for(db: Session, model):
+    """
+    Devuelve el INSERT del dialecto de la sesion, que expone
+    `on_conflict_do_update` para hacer upserts en una sola sentencia.
+    """
+    dialect = db.get_bind().dialect.name
+    try:
+        return _INSERTS[dialect](model)
+    except KeyError:
+        raise NotImplementedError(f"Upsert no soportado para el dialecto {dialect}") from None
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from src.domain.interfaces.IwhatsappClientRepository import IwhatsappClientRepository
+
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0)
+
+
+class WhatsAppApiError(RuntimeError):
+    def __init__(self, message: str, status_code: Optional[int] = None, body: str = ""):
+        super().__init__(message)
+        self.status_code = status_code
+        self.body = body
+
+
+class WhatsAppCircuitOpenError(WhatsAppApiError):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Corta los envios tras `failure_threshold` fallos seguidos de la API y deja
+    pasar una prueba cuando pasan `reset_seconds`; si la prueba sale bien se
+    cierra, si falla se vuelve a abrir.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.reset_seconds:
+            return "half-open"
+        return "open"
+
+    def acquire(self) -> Optional[bool]:
+        """`None` si el envio no pasa; `True` si es la prueba, `False` si el circuito esta cerrado."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return False
+            if state == "half-open" and not self._probing:
+                self._probing = True
+                return True
+            return None
+
+    def allow(self) -> bool:
+        return self.acquire() is not None
+
+    def release_probe(self) -> None:
+        """La prueba termino sin resultado de la API (excepcion ajena, cancelacion)."""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._probing = False
+
+
+class AsyncWhatsAppClient:
+    """
+    Cliente asincrono de la Graph API de WhatsApp sobre un `httpx.AsyncClient`
+    compartido (conexiones keep-alive reutilizadas entre envios). Reintenta 429 y
+    5xx con backoff exponencial con jitter completo, respeta `Retry-After` y pasa
+    por un circuit breaker para no martillar la API cuando esta caida.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        token: str,
+        *,
+        client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        max_retries: int = 3,
+        retry_status: frozenset[int] = RETRY_STATUS,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        jitter: Callable[[], float] = random.random,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.api_url = api_url
+        self.client = client or httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=timeout,
+            limits=limits,
+            transport=transport,
+        )
+        self.max_retries = max_retries
+        self.retry_status = retry_status
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+        self._sleep = sleep
+        self._jitter = jitter
+        self.logger = logger or logging.getLogger("whatsapp")
+
+    async def send_message(self, recipient_id: str, message: str) -> Dict[str, Any]:
+        return await self._post(
+            {
+                "messaging_product": "whatsapp",
+                "recipient_type": "individual",
+                "to": recipient_id,
+                "type": "text",
+                "text": {"preview_url": False, "body": message},
+            }
+        )
+
+    async def send_buttons(
+        self,
+        recipient_id: str,
+        body_text: str,
+        buttons: List[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        return await self._post(
+            {
+                "messaging_product": "whatsapp",
+                "recipient_type": "individual",
+                "to": recipient_id,
+                "type": "interactive",
+                "interactive": {
+                    "type": "button",
+                    "body": {"text": body_text},
+                    "action": {
+                        "buttons": [
+                            {"type": "reply", "reply": {"id": b["id"], "title": b["title"]}}
+                            for b in buttons
+                        ]
+                    },
+                },
+            }
+        )
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        if response is not None and response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return self._jitter() * min(self.backoff_max, self.backoff_base * 2**attempt)
+
+    async def _post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        probe = self.breaker.acquire()
+        if probe is None:
+            raise WhatsAppCircuitOpenError("WhatsApp API no disponible (circuito abierto)")
+        try:
+            return await self._send(payload)
+        except BaseException:
+            # Si la prueba no llego a registrar exito ni fallo, otro envio debe poder probar.
+            if probe:
+                self.breaker.release_probe()
+            raise
+
+    async def _send(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        for attempt in range(self.max_retries + 1):
+            response: Optional[httpx.Response] = None
+            try:
+                response = await self.client.post(self.api_url, json=payload)
+            except httpx.TransportError as exc:
+                error = WhatsAppApiError(f"WhatsApp API sin respuesta: {exc}")
+            else:
+                if response.status_code < 400:
+                    self.breaker.record_success()
+                    try:
+                        return response.json()
+                    except ValueError:
+                        return {}
+                error = WhatsAppApiError(
+                    f"WhatsApp API error {response.status_code}: {response.text}",
+                    status_code=response.status_code,
+                    body=response.text,
+                )
+                if response.status_code not in self.retry_status:
+                    # Error del pedido (4xx) o un 429 que maneja quien llama: la API responde.
+                    self.breaker.record_success()
+                    raise error
+
+            if attempt == self.max_retries:
+                break
+            delay = self._backoff(attempt, response)
+            self.logger.warning("%s; reintento %s en %.2fs", error, attempt + 1, delay)
+            await self._sleep(delay)
+
+        self.breaker.record_failure()
+        raise error
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+class PooledWhatsAppClient(IwhatsappClientRepository):
+    """
+    Fachada sincrona de `AsyncWhatsAppClient` para el codigo que corre en hilos
+    (workers del webhook, alertas de stock). Un event loop propio en un hilo de
+    fondo es dueno del `httpx.AsyncClient`, asi todos los hilos comparten el mismo
+    pool de conexiones.
+    """
+
+    def __init__(self, api_url: str, token: str, *, call_timeout: float = 60.0, **client_options):
+        self.call_timeout = call_timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="whatsapp-http", daemon=True
+        )
+        self._thread.start()
+        self.async_client = self._run(self._build(api_url, token, client_options)).result()
+
+    @staticmethod
+    async def _build(api_url: str, token: str, options: dict) -> AsyncWhatsAppClient:
+        # El AsyncClient se crea dentro de su propio loop.
+        return AsyncWhatsAppClient(api_url, token, **options)
+
+    def _run(self, coro) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _call(self, coro) -> Dict[str, Any]:
+        future = self._run(coro)
+        try:
+            return future.result(self.call_timeout)
+        except FutureTimeoutError as exc:
+            # Cancela la corrutina en el loop de fondo; si no, sigue reintentando sola.
+            future.cancel()
+            raise WhatsAppApiError(
+                f"WhatsApp API sin respuesta en {self.call_timeout}s"
+            ) from exc
+
+    def send_message(self, recipient_id: str, message: str) -> Dict[str, Any]:
+        return self._call(self.async_client.send_message(recipient_id, message))
+
+    def send_buttons(
+        self,
+        recipient_id: str,
+        body_text: str,
+        buttons: List[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        return self._call(self.async_client.send_buttons(recipient_id, body_text, buttons))
+
+    async def send_message_async(self, recipient_id: str, message: str) -> Dict[str, Any]:
+        """Para llamadores que ya estan en otro event loop."""
+        return await asyncio.wrap_future(
+            self._run(self.async_client.send_message(recipient_id, message))
+        )
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        self._run(self.async_client.aclose()).result(self.call_timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
@@ -1,4 +1,65 @@
+import sys
+from pathlib import Path
+
 import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+# Los modulos importan tanto `src.domain...` como `domain...`.
+for path in (PROJECT_ROOT, PROJECT_ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.append(str(path))
+
+from src.infrastructure.models import models  # noqa: E402
+from src.infrastructure.repository.referenceData import reference_data  # noqa: E402
+
+# Tablas de inventario y referencia compatibles con SQLite (sin CHECK con `::numeric`).
+INVENTARIO_TABLES = [
+    models.CategoriaContabilidad.__table__,
+    models.User.__table__,
+    models.Categoria.__table__,
+    models.Product.__table__,
+    models.Stock.__table__,
+    models.TipoMovimiento.__table__,
+    models.RefMovimiento.__table__,
+    models.MovimientosStock.__table__,
+    models.SnapshotStock.__table__,
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_reference_data():
+    # Cada test usa su propia base; el registro global no debe arrastrar datos.
+    reference_data.invalidate()
+    yield
+    reference_data.invalidate()
+
+
+@pytest.fixture
+def inventario_tables():
+    return INVENTARIO_TABLES
+
+
+def _strip_postgres_casts(conn, cursor, statement, parameters, context, executemany):
+    # Los CHECK del modelo usan `0::numeric`, que SQLite no entiende.
+    return statement.replace("::numeric", ""), parameters
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    event.listen(engine, "before_cursor_execute", _strip_postgres_casts, retval=True)
+    models.Base.metadata.create_all(bind=engine)
+    TestingSession = sessionmaker(bind=engine)
+    yield TestingSession
+    engine.dispose()
+
 
 @pytest.fixture
 def sample_data():
@@ -6,4 +67,4 @@ def sample_data():
         "message": "Hello, World!",
         "sender": "1234567890",
         "recipient": "0987654321"
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,129 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from domain.entities.carteraEntity import CarteraAgingFilaEntity
+from domain.interfaces.cartera_repository_interface import CarteraRepositoryInterface
+from domain.services.cartera_service import CarteraService
+from src.infrastructure.models.models import Cartera
+from src.infrastructure.repository.createCarteraRepository import CarteraRepository
+
+CORTE = date(2026, 6, 30)
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    for cliente, fecha, monto in (
+        ("Ana", date(2026, 6, 30), "10.00"),   # 0 dias
+        ("Ana", date(2026, 5, 31), "20.00"),   # 30 dias
+        ("Ana", date(2026, 5, 30), "30.00"),   # 31 dias
+        ("Ana", date(2026, 4, 1), "40.00"),    # 90 dias
+        ("Ana", date(2026, 3, 31), "50.00"),   # 91 dias
+        ("Ana", date(2026, 7, 1), "999.00"),   # posterior al corte
+        ("Beto", date(2026, 6, 1), "5.00"),
+        (None, date(2026, 6, 15), "7.00"),
+        ("Carla", date(2025, 12, 1), "15.00"),
+    ):
+        session.add(
+            Cartera(
+                cliente=cliente,
+                fecha=datetime(fecha.year, fecha.month, fecha.day, 12, tzinfo=timezone.utc),
+                monto=Decimal(monto),
+            )
+        )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_aging_buckets_and_running_balance_per_cliente(db_session):
+    service = CarteraService(CarteraRepository(db_session))
+
+    page = service.get_aging(fecha_corte=CORTE, incluir_movimientos=True)
+
+    assert [item.cliente for item in page.items] == [None, "Ana", "Beto", "Carla"]
+    ana = page.items[1]
+    assert (ana.total_0_30, ana.total_31_60, ana.total_61_90, ana.total_90_mas) == (
+        Decimal("30.00"),
+        Decimal("30.00"),
+        Decimal("40.00"),
+        Decimal("50.00"),
+    )
+    assert ana.total == Decimal("150.00")
+    assert ana.documentos == 5
+    assert [m.dias for m in ana.movimientos] == [91, 90, 31, 30, 0]
+    assert [m.saldo_acumulado for m in ana.movimientos] == [
+        Decimal("50.00"),
+        Decimal("90.00"),
+        Decimal("120.00"),
+        Decimal("140.00"),
+        Decimal("150.00"),
+    ]
+    assert page.items[3].total_90_mas == Decimal("15.00")
+    assert page.next_cursor is None
+
+
+def test_aging_pages_by_cliente(db_session):
+    service = CarteraService(CarteraRepository(db_session))
+
+    primera = service.get_aging(fecha_corte=CORTE, limit=2)
+    segunda = service.get_aging(fecha_corte=CORTE, limit=2, cursor=primera.next_cursor)
+
+    assert [item.cliente for item in primera.items] == [None, "Ana"]
+    assert primera.items[1].movimientos == []
+    assert [item.cliente for item in segunda.items] == ["Beto", "Carla"]
+    assert segunda.next_cursor is None
+
+    with pytest.raises(ValueError):
+        service.get_aging(fecha_corte=CORTE, cursor="%%%")
+
+
+def test_empty_cliente_is_not_merged_with_missing_cliente(db_session):
+    db_session.add(
+        Cartera(cliente="", fecha=datetime(2026, 6, 20, 12, tzinfo=timezone.utc), monto=Decimal("4.00"))
+    )
+    db_session.commit()
+    service = CarteraService(CarteraRepository(db_session))
+
+    primera = service.get_aging(fecha_corte=CORTE, limit=1)
+    segunda = service.get_aging(fecha_corte=CORTE, limit=2, cursor=primera.next_cursor)
+
+    assert [(item.cliente, item.total) for item in primera.items] == [(None, Decimal("7.00"))]
+    assert [(item.cliente, item.total) for item in segunda.items] == [
+        ("", Decimal("4.00")),
+        ("Ana", Decimal("150.00")),
+    ]
+
+
+class UnDocumentoRepository(CarteraRepositoryInterface):
+    def get_aging(self, fecha_corte, *, despues_de=None, limit_clientes=50):
+        # 01:00 UTC del 1 de junio es 31 de mayo en una base en America/Bogota.
+        return [
+            CarteraAgingFilaEntity(
+                cartera_id=1,
+                clave_cliente="1Ana",
+                cliente="Ana",
+                fecha=datetime(2026, 6, 1, 1, tzinfo=timezone.utc),
+                dia=date(2026, 5, 31),
+                monto=Decimal("10.00"),
+                saldo_acumulado=Decimal("10.00"),
+                total_0_30=Decimal("0.00"),
+                total_31_60=Decimal("10.00"),
+                total_61_90=Decimal("0.00"),
+                total_90_mas=Decimal("0.00"),
+                total_cliente=Decimal("10.00"),
+            )
+        ]
+
+
+def test_days_come_from_the_same_day_as_the_bucket():
+    page = CarteraService(UnDocumentoRepository()).get_aging(
+        fecha_corte=date(2026, 7, 1), incluir_movimientos=True
+    )
+
+    assert page.items[0].total_31_60 == Decimal("10.00")
+    assert page.items[0].movimientos[0].dias == 31
@@ -0,0 +1,88 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from domain.dtos.cierreCajaDto import CalcularCierreCajaRequest
+from domain.services.cierre_caja_service import CierreCajaService
+from src.infrastructure.models.models import Egreso, Ingreso, Venta
+from src.infrastructure.repository.createCierreCajaRepository import CierreCajaRepository
+
+DIA = date(2026, 7, 1)
+
+
+def _ts(dia, hora):
+    return datetime(dia.year, dia.month, dia.day, hora, tzinfo=timezone.utc)
+
+
+def _venta(total, tipo_pago, fecha, estado=True):
+    return Venta(
+        fecha=fecha,
+        subtotal=total,
+        impuesto=Decimal("0.00"),
+        descuento=Decimal("0.00"),
+        total=total,
+        tipo_pago=tipo_pago,
+        estado=estado,
+    )
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    session.add_all(
+        [
+            _venta(Decimal("100.00"), "efectivo", _ts(DIA, 10)),
+            _venta(Decimal("40.00"), "efectivo", _ts(DIA, 18)),
+            _venta(Decimal("70.00"), "tarjeta", _ts(DIA, 11)),
+            _venta(Decimal("500.00"), "efectivo", _ts(DIA, 12), estado=False),
+            _venta(Decimal("9.00"), "efectivo", _ts(date(2026, 7, 2), 9)),
+            Ingreso(monto=Decimal("25.00"), fecha=_ts(DIA, 9), tipo_ingreso="efectivo"),
+            Ingreso(monto=Decimal("80.00"), fecha=_ts(DIA, 9), tipo_ingreso="transferencia"),
+            Egreso(monto=Decimal("15.00"), fecha=_ts(DIA, 13), tipo_egreso="efectivo"),
+        ]
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_movimientos_caja_are_loaded_in_one_query(db_session):
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        movimientos = CierreCajaRepository(db_session).get_movimientos_caja(DIA)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert movimientos.total_ventas_efectivo == Decimal("140.00")
+    assert movimientos.total_ingresos == Decimal("25.00")
+    assert movimientos.total_egresos == Decimal("15.00")
+    assert movimientos.saldo_anterior is None
+
+
+def test_close_is_computed_and_chains_the_previous_real_balance(db_session):
+    service = CierreCajaService(CierreCajaRepository(db_session))
+
+    primero = service.calcular_cierre(
+        DIA, CalcularCierreCajaRequest(saldo_real=Decimal("148.00"))
+    )
+    assert primero.saldo_inicial == Decimal("0.00")
+    assert primero.saldo_teorico == Decimal("150.00")
+    assert primero.diferencia == Decimal("-2.00")
+
+    segundo = service.calcular_cierre(
+        date(2026, 7, 2), CalcularCierreCajaRequest(saldo_real=Decimal("157.00"))
+    )
+    assert segundo.saldo_inicial == Decimal("148.00")
+    assert segundo.saldo_teorico == Decimal("157.00")
+    assert segundo.diferencia == Decimal("0.00")
+
+    with pytest.raises(ValueError):
+        service.calcular_cierre(DIA, CalcularCierreCajaRequest(saldo_real=Decimal("1.00")))
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from src.app.services.message_handler_service import MessageHandlerService
+from src.domain.services.command_router import (
+    PREFIJO,
+    Command,
+    CommandRouter,
+    SenderAllowlist,
+)
+from src.domain.services import shortcut_service
+from src.domain.services.shortcut_service import ShortcutService
+
+
+def _router():
+    return CommandRouter(
+        [
+            Command(nombre="ingreso", alias=("I",), ignorar_mayusculas=False),
+            Command(nombre="saludo", alias=("hola", "buenas tardes")),
+            Command(nombre="crear_cliente", alias=("A",), modo=PREFIJO),
+            Command(nombre="agenda", alias=("AGENDA",), modo=PREFIJO),
+            Command(nombre="categorias", alias=("cat",), remitentes=("3004356388",)),
+        ]
+    )
+
+
+def test_exact_aliases_respect_case_setting():
+    router = _router()
+
+    assert router.route(" I ").comando.nombre == "ingreso"
+    assert router.route("i") is None
+    assert router.route("HOLA").comando.nombre == "saludo"
+    assert router.route("Buenas Tardes").comando.nombre == "saludo"
+    assert router.route("") is None
+    assert router.route(None) is None
+
+
+def test_prefix_commands_take_longest_alias_and_keep_argument():
+    router = _router()
+
+    coincidencia = router.route("Agenda  martes 3pm")
+    assert coincidencia.comando.nombre == "agenda"
+    assert coincidencia.argumento == "martes 3pm"
+    assert router.route("ana").comando.nombre == "crear_cliente"
+    assert router.route("Arroz").argumento == "rroz"
+    assert router.route("bueno") is None
+
+
+def test_restricted_command_only_routes_for_allowed_senders():
+    router = _router()
+
+    assert router.route("cat", "+57 300 435 6388").comando.nombre == "categorias"
+    assert router.route("cat", "573001112233") is None
+    assert router.route("cat") is None
+
+
+def test_duplicate_alias_across_commands_is_rejected():
+    with pytest.raises(ValueError):
+        CommandRouter([Command(nombre="a", alias=("x",)), Command(nombre="b", alias=("X",))])
+
+
+def test_sender_allowlist_matches_by_trailing_digits():
+    permitidos = SenderAllowlist(["3004356388", "+1 555 0100"])
+
+    assert permitidos.is_allowed("573004356388")
+    assert permitidos.is_allowed("15550100")
+    assert not permitidos.is_allowed("3004356389")
+    assert not permitidos.is_allowed("")
+    assert not permitidos.is_allowed(None)
+
+
+def test_shortcut_service_uses_compiled_table():
+    service = ShortcutService()
+
+    assert service.get_reply_for_shortcut(" I ") == "Cual es el monto del ingreso de dinero."
+    assert service.get_reply_for_shortcut("s") is None
+    assert service.get_reply_for_shortcut(None) is None
+    assert service.is_allowed_category_sender("+573004356388")
+    assert not service.is_allowed_category_sender("12345")
+    assert service.router is ShortcutService().router is shortcut_service.SHORTCUT_COMMANDS
+    propio = ShortcutService({"G": "gasto"})
+    assert propio.get_reply_for_shortcut("G") == "gasto"
+    assert propio.get_reply_for_shortcut("I") is None
+
+
+class FakeWhatsAppClient:
+    def __init__(self):
+        self.enviados = []
+
+    def send_message(self, recipient_id, message):
+        self.enviados.append((recipient_id, message))
+        return {}
+
+    def send_buttons(self, recipient_id, body_text, buttons):
+        self.enviados.append((recipient_id, body_text))
+        return {}
+
+
+def test_message_handler_routes_shortcuts_menu_and_greetings():
+    client = FakeWhatsAppClient()
+    service = MessageHandlerService(whatsapp_client=client)
+    sender = {"id": "573001", "name": "Ana"}
+
+    def handle(texto):
+        return asyncio.run(service.handle_incoming_message(texto, sender))
+
+    assert handle("+")["shortcut"] == "+"
+    assert handle(" a ") == {"status": "handled", "type": "shortcut", "shortcut": "A", "recipient": "573001"}
+    assert handle("Hola")["type"] == "greeting"
+    assert handle("que tal")["type"] == "unknown"
+    assert client.enviados == [("573001", "*Menu*\nElige una opcion:"), ("573001", "Hola Ana")]
+    assert service.is_greeting("HELLO")
+    assert not service.is_greeting("holaa")
@@ -0,0 +1,119 @@
+from uuid import uuid4
+
+from domain.dtos.contabilidadCategoriaDto import ContabilidadCategoriaRequest
+from domain.enums.contabilidadEnums import CategoriaTipo
+from domain.interfaces.contabilidad_categoria_repository_interface import (
+    ContabilidadCategoriaRepositoryInterface,
+)
+from domain.services.contabilidad_categoria_service import (
+    CategoriasContablesCache,
+    ContabilidadCategoriaService,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class InMemoryCategoriaRepository(ContabilidadCategoriaRepositoryInterface):
+    def __init__(self):
+        self.categorias = []
+        self.consultas = 0
+
+    def create_categoria(self, entity):
+        created = entity.model_copy(update={"id": uuid4()})
+        self.categorias.append(created)
+        return created
+
+    def list_categorias(self, *, tipo=None, activa=None):
+        self.consultas += 1
+        return [
+            c
+            for c in self.categorias
+            if (tipo is None or c.tipo == tipo) and (activa is None or c.activa == activa)
+        ]
+
+    def get_categoria(self, categoria_id):
+        raise AssertionError("el servicio debe resolver por id desde el cache")
+
+    def get_by_nombre(self, nombre):
+        raise AssertionError("el servicio debe resolver por nombre desde el cache")
+
+
+def _request(nombre, tipo=CategoriaTipo.EGRESO, activa=True):
+    return ContabilidadCategoriaRequest(
+        nombre=nombre, tipo=tipo, activa=activa, creada_por_whatsapp_user_id="573000000000"
+    )
+
+
+def test_lookups_are_served_from_one_load_until_a_write():
+    repo = InMemoryCategoriaRepository()
+    service = ContabilidadCategoriaService(repo, CategoriasContablesCache())
+    transporte = service.create_categoria(_request("Transporte"))
+    service.create_categoria(_request("Ventas mostrador", tipo=CategoriaTipo.INGRESO))
+    service.create_categoria(_request("Viejos", activa=False))
+
+    for _ in range(3):
+        assert service.get_by_nombre("  TRANSPORTE ").id == transporte.id
+        assert service.get_categoria(transporte.id).nombre == "Transporte"
+        assert [c.nombre for c in service.list_categorias(tipo=CategoriaTipo.EGRESO, activa=True)] == [
+            "Transporte"
+        ]
+        assert len(service.list_categorias()) == 3
+        assert service.get_by_nombre("inexistente") is None
+    assert repo.consultas == 1
+
+    service.create_categoria(_request("Arriendo"))
+    assert service.get_by_nombre("arriendo") is not None
+    assert repo.consultas == 2
+
+
+def test_cache_expires_after_ttl_and_reloads_on_unknown_id():
+    clock = FakeClock()
+    repo = InMemoryCategoriaRepository()
+    cache = CategoriasContablesCache(ttl_seconds=10, clock=clock, recarga_minima_seconds=0)
+    service = ContabilidadCategoriaService(repo, cache)
+    service.create_categoria(_request("Transporte"))
+    assert service.get_by_nombre("transporte") is not None
+
+    # Alta hecha por otro proceso: no pasa por este cache.
+    otro = ContabilidadCategoriaService(repo, CategoriasContablesCache()).create_categoria(
+        _request("Arriendo")
+    )
+    assert service.get_by_nombre("arriendo") is None
+    assert service.get_categoria(otro.id).nombre == "Arriendo"
+
+    service.create_categoria(_request("Luz"))
+    service.get_by_nombre("luz")
+    consultas = repo.consultas
+    clock.now = 10
+    service.get_by_nombre("luz")
+    assert repo.consultas == consultas + 1
+
+
+def test_unknown_ids_reload_at_most_once_per_interval():
+    clock = FakeClock()
+    repo = InMemoryCategoriaRepository()
+    cache = CategoriasContablesCache(ttl_seconds=300, clock=clock, recarga_minima_seconds=5)
+    service = ContabilidadCategoriaService(repo, cache)
+    service.list_categorias()
+    otro = ContabilidadCategoriaService(repo, CategoriasContablesCache()).create_categoria(
+        _request("Arriendo")
+    )
+    consultas = repo.consultas
+
+    # Una rafaga de ids invalidos no se convierte en una consulta por pedido.
+    for _ in range(50):
+        assert service.get_categoria(uuid4()) is None
+    assert service.get_categoria(otro.id) is None
+    assert repo.consultas == consultas
+
+    clock.now = 5
+    assert service.get_categoria(otro.id).nombre == "Arriendo"
+    for _ in range(50):
+        assert service.get_categoria(uuid4()) is None
+    assert repo.consultas == consultas + 1
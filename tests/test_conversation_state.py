@@ -0,0 +1,95 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from src.app.services.conversation_state import (
+    InMemoryConversationStateStore,
+    build_conversation_state_store,
+)
+from src.app.services.purga_periodica import PurgaPeriodica
+from src.infrastructure.models.models import WebhookConversacion
+from src.infrastructure.repository.createConversationStateRepository import (
+    DbConversationStateStore,
+)
+
+INICIO = datetime(2026, 6, 1, 12, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = INICIO
+
+    def __call__(self):
+        return self.now
+
+
+def test_memory_store_expires_states_and_evicts_least_recent():
+    clock = FakeClock()
+    store = InMemoryConversationStateStore(
+        ttl_seconds=60, max_size=2, clock=lambda: clock.now.timestamp()
+    )
+
+    store.set("111", "creando_cliente", {"nombre": "Ana"})
+    store.set("222", "creando_cliente")
+    assert store.get("111").datos == {"nombre": "Ana"}
+
+    clock.now += timedelta(seconds=30)
+    store.set("111", "creando_cliente")  # renueva y pasa al final
+    store.set("333", "creando_cliente")  # supera max_size: sale 222
+    assert store.get("222") is None
+    assert len(store) == 2
+
+    clock.now += timedelta(seconds=60)
+    assert store.get("111") is None
+    assert len(store) == 0
+
+
+@pytest.fixture
+def db_store(session_factory):
+    clock = FakeClock()
+    return DbConversationStateStore(session_factory, ttl_seconds=60, clock=clock), clock
+
+
+def test_db_store_is_shared_between_instances_and_honors_ttl(db_store, session_factory):
+    store, clock = db_store
+    otro_worker = DbConversationStateStore(session_factory, ttl_seconds=60, clock=clock)
+
+    store.set("111", "creando_cliente", {"paso": 1})
+    estado = otro_worker.get("111")
+    assert estado.estado == "creando_cliente"
+    assert estado.datos == {"paso": 1}
+    assert estado.expira_en == INICIO + timedelta(seconds=60)
+
+    otro_worker.set("111", "confirmando", {"paso": 2})
+    assert store.get("111").estado == "confirmando"
+
+    store.clear("111")
+    assert otro_worker.get("111") is None
+
+    store.set("222", "creando_cliente")
+    clock.now += timedelta(seconds=60)
+    assert store.get("222") is None
+    assert store.purgar_vencidos() == 1
+
+
+def test_db_backend_registers_its_purge_in_the_periodic_task(session_factory, monkeypatch):
+    monkeypatch.setenv("WEBHOOK_STATE_BACKEND", "db")
+    monkeypatch.setenv("WEBHOOK_STATE_TTL_SECONDS", "0")
+    purgas = PurgaPeriodica()
+
+    store = build_conversation_state_store(session_factory, purgas)
+    store.set("111", "creando_cliente")
+
+    assert asyncio.run(purgas.ejecutar()) == {"conversacion": 1}
+    with session_factory() as db:
+        assert db.scalar(select(func.count()).select_from(WebhookConversacion)) == 0
+
+
+def test_memory_backend_registers_no_purge(monkeypatch):
+    monkeypatch.delenv("WEBHOOK_STATE_BACKEND", raising=False)
+    purgas = PurgaPeriodica()
+
+    assert isinstance(build_conversation_state_store(purgas=purgas), InMemoryConversationStateStore)
+    assert purgas.tareas == {}
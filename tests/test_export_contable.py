@@ -0,0 +1,97 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+from openpyxl import load_workbook
+
+from domain.services.export_contable_service import ExportContableService
+from src.infrastructure.models.models import CierreCaja, Egreso, Ingreso, Venta
+from src.infrastructure.repository.createExportContableRepository import (
+    ExportContableRepository,
+)
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    for dia in (1, 15, 31):
+        session.add(
+            Ingreso(
+                monto=Decimal("10.00"),
+                fecha=datetime(2026, 5, dia, 15, tzinfo=timezone.utc),
+                tipo_ingreso="efectivo",
+                cliente="Ana",
+            )
+        )
+    session.add(
+        Ingreso(
+            monto=Decimal("99.00"),
+            fecha=datetime(2026, 6, 1, 15, tzinfo=timezone.utc),
+            tipo_ingreso="efectivo",
+        )
+    )
+    session.add(
+        Egreso(
+            monto=Decimal("4.50"),
+            fecha=datetime(2026, 5, 2, 15, tzinfo=timezone.utc),
+            tipo_egreso="transferencia",
+        )
+    )
+    session.add(
+        Venta(
+            fecha=datetime(2026, 5, 3, 15, tzinfo=timezone.utc),
+            subtotal=Decimal("20.00"),
+            impuesto=Decimal("0.00"),
+            descuento=Decimal("0.00"),
+            total=Decimal("20.00"),
+            tipo_pago="efectivo",
+            estado=True,
+        )
+    )
+    session.add(
+        CierreCaja(
+            fecha=date(2026, 5, 3),
+            saldo_inicial=Decimal("0.00"),
+            total_ventas_efectivo=Decimal("20.00"),
+            total_ingresos=Decimal("0.00"),
+            total_egresos=Decimal("0.00"),
+            saldo_teorico=Decimal("20.00"),
+            saldo_real=Decimal("20.00"),
+            diferencia=Decimal("0.00"),
+            fecha_creacion=datetime(2026, 5, 3, 22, tzinfo=timezone.utc),
+        )
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_export_writes_one_sheet_per_source_for_the_period(db_session):
+    service = ExportContableService(ExportContableRepository(db_session, bloque_filas=2))
+    destino = BytesIO()
+
+    service.escribir_xlsx(date(2026, 5, 1), date(2026, 5, 31), destino)
+
+    workbook = load_workbook(BytesIO(destino.getvalue()), read_only=True)
+    assert workbook.sheetnames == ["Ingresos", "Egresos", "Ventas", "Cierres"]
+    ingresos = list(workbook["Ingresos"].iter_rows(values_only=True))
+    assert ingresos[0][:3] == ("ingreso_id", "fecha", "monto")
+    assert [fila[1] for fila in ingresos[1:]] == [
+        datetime(2026, 5, 1, 15),
+        datetime(2026, 5, 15, 15),
+        datetime(2026, 5, 31, 15),
+    ]
+    assert ingresos[1][5] == "Ana"
+    assert len(list(workbook["Egresos"].iter_rows())) == 2
+    assert list(workbook["Ventas"].iter_rows(values_only=True))[1][6] == 20
+    assert list(workbook["Cierres"].iter_rows(values_only=True))[1][1] == datetime(2026, 5, 3)
+
+
+def test_export_rejects_inverted_range(db_session):
+    service = ExportContableService(ExportContableRepository(db_session))
+
+    with pytest.raises(ValueError):
+        service.escribir_xlsx(date(2026, 6, 1), date(2026, 5, 1), BytesIO())
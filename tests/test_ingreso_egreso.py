@@ -0,0 +1,122 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from domain.dtos.egresoDto import EgresoRequest
+from domain.dtos.ingresoDto import IngresoRequest
+from domain.services.egreso_service import EgresoService
+from domain.services.ingreso_service import IngresoService
+from src.infrastructure.models.models import Categoria, CategoriaContabilidad
+from src.infrastructure.repository.createEgresoRepository import EgresoRepository
+from src.infrastructure.repository.createIngresoRepository import IngresoRepository
+
+
+def _ts(mes, dia, hora=12):
+    return datetime(2026, mes, dia, hora, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    now = datetime.now(timezone.utc)
+    session.add_all(
+        [
+            CategoriaContabilidad(id=1, nombre="Servicios", codigo="SRV"),
+            Categoria(
+                categoria_id=1,
+                nombre="Aseo",
+                estado=True,
+                fecha_creacion=now,
+                fecha_actualizacion=now,
+            ),
+        ]
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_ingresos_are_keyset_paginated_by_date_range(db_session):
+    service = IngresoService(IngresoRepository(db_session))
+    for dia in (1, 2, 2, 3, 4):
+        service.create_ingreso(
+            IngresoRequest(monto=Decimal(dia), tipo_ingreso="efectivo", fecha=_ts(1, dia))
+        )
+
+    pages = []
+    cursor = None
+    while True:
+        page = service.list_ingresos(
+            desde=date(2026, 1, 2), hasta=date(2026, 1, 3), cursor=cursor, limit=2
+        )
+        pages.append([item.ingreso_id for item in page.items])
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert pages == [[4, 3], [2]]
+    with pytest.raises(ValueError):
+        service.list_ingresos(cursor="no-es-un-cursor")
+
+
+def test_ingreso_totals_group_by_month_category_and_payment_method(db_session):
+    service = IngresoService(IngresoRepository(db_session))
+    rows = [
+        (_ts(1, 5), "efectivo", 1, "10.00"),
+        (_ts(1, 20), "efectivo", 1, "5.00"),
+        (_ts(1, 20), "transferencia", 1, "7.00"),
+        (_ts(2, 1), "efectivo", None, "3.00"),
+        (_ts(3, 1), "efectivo", 1, "100.00"),
+    ]
+    for fecha, tipo, categoria, monto in rows:
+        service.create_ingreso(
+            IngresoRequest(
+                monto=Decimal(monto),
+                tipo_ingreso=tipo,
+                fecha=fecha,
+                categoria_contabilidad_id=categoria,
+            )
+        )
+
+    totales = service.get_totales(desde_mes=date(2026, 1, 1), hasta_mes=date(2026, 2, 1))
+
+    assert totales.total == Decimal("25.00")
+    assert [
+        (t.mes, t.categoria_nombre, t.medio_pago, t.total, t.cantidad) for t in totales.items
+    ] == [
+        (date(2026, 1, 1), "Servicios", "efectivo", Decimal("15.00"), 2),
+        (date(2026, 1, 1), "Servicios", "transferencia", Decimal("7.00"), 1),
+        (date(2026, 2, 1), None, "efectivo", Decimal("3.00"), 1),
+    ]
+
+
+def test_egreso_totals_include_category_names(db_session):
+    service = EgresoService(EgresoRepository(db_session))
+    service.create_egreso(
+        EgresoRequest(monto=Decimal("8.00"), tipo_egreso="efectivo", fecha=_ts(4, 2), categoria_id=1)
+    )
+    service.create_egreso(
+        EgresoRequest(monto=Decimal("2.00"), tipo_egreso="efectivo", fecha=_ts(4, 9), categoria_id=1)
+    )
+
+    totales = service.get_totales()
+
+    assert [(t.mes, t.categoria_nombre, t.total, t.cantidad) for t in totales.items] == [
+        (date(2026, 4, 1), "Aseo", Decimal("10.00"), 2)
+    ]
+    assert service.get_egreso(1).tipo_egreso == "efectivo"
+    assert service.get_egreso(99) is None
+
+
+def test_totals_reject_dates_that_are_not_month_starts(db_session):
+    service = IngresoService(IngresoRepository(db_session))
+
+    with pytest.raises(ValueError, match="hasta_mes"):
+        service.get_totales(desde_mes=date(2026, 3, 1), hasta_mes=date(2026, 3, 20))
+    with pytest.raises(ValueError, match="desde_mes"):
+        service.get_totales(desde_mes=date(2026, 3, 15))
+    with pytest.raises(ValueError):
+        service.get_totales(desde_mes=date(2026, 4, 1), hasta_mes=date(2026, 3, 1))
@@ -0,0 +1,112 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from domain.dtos.margenDto import MargenAgrupacion
+from domain.dtos.ventaDto import VentaDetalleRequest, VentaRequest
+from domain.services.margen_service import MargenService, analizar_margen
+from domain.services.venta_service import VentaService
+from src.infrastructure.models.models import Categoria, Product, VentaDetalle
+from src.infrastructure.repository.createMargenRepository import MargenRepository
+from src.infrastructure.repository.createVentaRepository import VentaRepository
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    now = datetime.now(timezone.utc)
+    session.add(
+        Categoria(categoria_id=1, nombre="Granos", estado=True, fecha_creacion=now, fecha_actualizacion=now)
+    )
+    for producto_id, nombre, costo, categoria_id in (
+        (1, "Arroz", "6.00", 1),
+        (2, "Frijol", "2.00", 1),
+        (3, "Jabon", "9.00", None),
+    ):
+        session.add(
+            Product(
+                producto_id=producto_id,
+                codigo_barras=f"COD{producto_id}",
+                nombre=nombre,
+                precio_venta=Decimal("10.00"),
+                costo=Decimal(costo),
+                fecha_creacion=now,
+                fecha_actualizacion=now,
+                estado=True,
+                categoria_id=categoria_id,
+            )
+        )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _vender(session, fecha, *lineas):
+    VentaService(VentaRepository(session)).create_venta(
+        VentaRequest(
+            tipo_pago="efectivo",
+            fecha=fecha,
+            detalles=[
+                VentaDetalleRequest(producto_id=p, cantidad=c, precio_unitario=Decimal("10.00"))
+                for p, c in lineas
+            ],
+        )
+    )
+
+
+def test_checkout_freezes_unit_cost_and_rejects_unknown_products(db_session):
+    _vender(db_session, datetime(2026, 8, 1, 12, tzinfo=timezone.utc), (1, 2), (3, 1))
+
+    costos = {d.producto_id: d.costo_unitario for d in db_session.query(VentaDetalle)}
+    assert costos == {1: Decimal("6.00"), 3: Decimal("9.00")}
+
+    with pytest.raises(ValueError):
+        _vender(db_session, datetime(2026, 8, 1, 12, tzinfo=timezone.utc), (99, 1))
+
+
+def test_margin_report_uses_captured_cost_per_product_category_and_day(db_session):
+    _vender(db_session, datetime(2026, 8, 1, 12, tzinfo=timezone.utc), (1, 2), (2, 1))
+    _vender(db_session, datetime(2026, 8, 2, 12, tzinfo=timezone.utc), (2, 3), (3, 1))
+    # Cambiar el costo actual no altera el margen de ventas pasadas.
+    db_session.get(Product, 2).costo = Decimal("9.99")
+    db_session.commit()
+
+    service = MargenService(MargenRepository(db_session))
+    por_producto = service.get_reporte(MargenAgrupacion.PRODUCTO, date(2026, 8, 1), date(2026, 8, 31))
+
+    assert por_producto.ingresos == Decimal("70.00")
+    assert por_producto.costo == Decimal("29.00")
+    assert [(i.nombre, i.margen, i.pareto) for i in por_producto.items] == [
+        ("Frijol", Decimal("32.00"), True),
+        ("Arroz", Decimal("8.00"), True),
+        ("Jabon", Decimal("1.00"), False),
+    ]
+    assert por_producto.items[0].margen_pct == 80.0
+    assert por_producto.percentiles_margen_pct.p50 == 40.0
+
+    por_categoria = service.get_reporte(MargenAgrupacion.CATEGORIA, date(2026, 8, 1), date(2026, 8, 31))
+    assert {(i.clave, i.nombre, i.margen) for i in por_categoria.items} == {
+        ("1", "Granos", Decimal("40.00")),
+        ("sin-categoria", None, Decimal("1.00")),
+    }
+
+    por_dia = service.get_reporte(MargenAgrupacion.DIA, date(2026, 8, 1), date(2026, 8, 31))
+    assert [(i.clave, i.margen) for i in por_dia.items] == [
+        ("2026-08-01", Decimal("16.00")),
+        ("2026-08-02", Decimal("25.00")),
+    ]
+
+
+def test_pareto_flags_groups_needed_for_80_percent_of_margin():
+    ingresos = np.array([100.0, 100.0, 100.0, 100.0, 0.0])
+    costo = np.array([20.0, 90.0, 50.0, 120.0, 0.0])
+
+    analisis = analizar_margen(ingresos, costo)
+
+    assert analisis["orden"].tolist()[:3] == [0, 2, 1]
+    assert analisis["pareto"].tolist() == [True, False, True, False, False]
+    assert np.isnan(analisis["margen_pct"][4])
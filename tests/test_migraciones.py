@@ -0,0 +1,104 @@
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.data.migraciones import migrar
+from src.infrastructure.models.models import Stock
+
+# Esquema previo al ledger: `tipo_movimiento` sin `signo`.
+TIPO_MOVIMIENTO_LEGACY = """
+CREATE TABLE tipo_movimiento (
+    tipo_movimiento_id INTEGER NOT NULL,
+    nombre VARCHAR(50) NOT NULL,
+    activo BOOLEAN NOT NULL,
+    descripcion VARCHAR(255),
+    CONSTRAINT tipo_movimiento_pkey PRIMARY KEY (tipo_movimiento_id)
+)
+"""
+
+
+def _engine(tmp_path, *ddl):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        for sentencia in ddl:
+            conn.execute(text(sentencia))
+    return engine
+
+
+def test_ledger_migration_adds_signo_and_backfills_outbound_types(tmp_path, inventario_tables):
+    engine = _engine(
+        tmp_path,
+        TIPO_MOVIMIENTO_LEGACY,
+        "INSERT INTO tipo_movimiento VALUES (1, 'Entrada', 1, NULL), (2, 'Salida', 1, NULL), "
+        "(3, 'Venta', 1, NULL), (4, 'Merma por vencimiento', 1, NULL), (5, 'Devolucion de cliente', 1, NULL)",
+    )
+
+    cambios = migrar(engine, inventario_tables)
+
+    assert "ledger_stock: columna tipo_movimiento.signo" in cambios
+    with engine.connect() as conn:
+        signos = dict(conn.execute(text("SELECT nombre, signo FROM tipo_movimiento")).all())
+        conn.execute(text("INSERT INTO tipo_movimiento (tipo_movimiento_id, nombre, activo) VALUES (6, 'Ajuste', 1)"))
+        nuevo = conn.execute(text("SELECT signo FROM tipo_movimiento WHERE tipo_movimiento_id = 6")).scalar()
+    assert signos == {
+        "Entrada": 1,
+        "Salida": -1,
+        "Venta": -1,
+        "Merma por vencimiento": -1,
+        "Devolucion de cliente": 1,
+    }
+    assert nuevo == 1
+    assert "snapshot_stock" in inspect(engine).get_table_names()
+
+    # Una segunda corrida no vuelve a tocar el esquema ni los datos.
+    assert migrar(engine, inventario_tables) == []
+
+    # Tablas que ya existian sin los indices del ledger.
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_stock_producto_id"))
+        conn.execute(text("DROP INDEX ix_movimientos_stock_stock_id_movimiento_id"))
+    assert migrar(engine, inventario_tables) == [
+        "ledger_stock: indice ix_stock_producto_id",
+        "ledger_stock: indice ix_movimientos_stock_stock_id_movimiento_id",
+    ]
+
+
+def test_fresh_database_needs_no_migration(tmp_path, inventario_tables):
+    engine = _engine(tmp_path)
+
+    assert migrar(engine, inventario_tables) == []
+    columnas = {c["name"] for c in inspect(engine).get_columns("tipo_movimiento")}
+    assert "signo" in columnas
+
+
+def test_stock_version_migration_keeps_existing_rows_loadable(tmp_path, inventario_tables):
+    engine = _engine(
+        tmp_path,
+        "CREATE TABLE stock (stock_id INTEGER NOT NULL PRIMARY KEY, producto_id INTEGER NOT NULL, "
+        "cantidad_actual INTEGER NOT NULL, cantidad_minima INTEGER NOT NULL, "
+        "ultima_actualizacion DATETIME NOT NULL, actualizado_por_id INTEGER, creado_por_id INTEGER)",
+        "INSERT INTO stock VALUES (1, 10, 5, 2, '2026-01-01 00:00:00', NULL, NULL)",
+    )
+
+    assert "version_stock: columna stock.version" in migrar(engine, inventario_tables)
+
+    session = sessionmaker(bind=engine)()
+    stock = session.get(Stock, 1)
+    assert stock.version == 1
+    stock.cantidad_actual = 4
+    session.commit()
+    assert stock.version == 2
+    session.close()
+
+
+def test_sale_line_cost_migration_leaves_legacy_lines_without_cost(tmp_path):
+    engine = _engine(
+        tmp_path,
+        "CREATE TABLE venta_detalle (venta_detalle_id INTEGER NOT NULL PRIMARY KEY, venta_id INTEGER NOT NULL, "
+        "producto_id INTEGER NOT NULL, cantidad INTEGER NOT NULL, precio_unitario NUMERIC(10, 2) NOT NULL, "
+        "subtotal NUMERIC(12, 2) NOT NULL)",
+        "INSERT INTO venta_detalle VALUES (1, 1, 10, 2, 5.00, 10.00)",
+    )
+
+    assert migrar(engine, []) == ["costo_venta_detalle: columna venta_detalle.costo_unitario"]
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT costo_unitario FROM venta_detalle")).scalar() is None
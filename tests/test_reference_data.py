@@ -0,0 +1,68 @@
+import pytest
+
+from src.infrastructure.models.models import CategoriaContabilidad, RefMovimiento, TipoMovimiento
+from src.infrastructure.repository.referenceData import ReferenceDataRegistry, reference_data
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    session.add_all(
+        [
+            TipoMovimiento(tipo_movimiento_id=1, nombre="Entrada", activo=True, signo=1),
+            TipoMovimiento(tipo_movimiento_id=2, nombre="Salida", activo=True, signo=-1),
+            RefMovimiento(ref_movimiento_id=1, nombre="compra", activo=True),
+            CategoriaContabilidad(nombre="Servicios", codigo="SRV"),
+        ]
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_lookups_by_id_and_name_are_served_from_memory(db_session):
+    registry = ReferenceDataRegistry()
+    data = registry.load(db_session)
+
+    assert data.tipos_movimiento.get(2).signo == -1
+    assert data.tipos_movimiento.get_by_nombre(" salida ").tipo_movimiento_id == 2
+    assert data.refs_movimiento.nombres() == {1: "compra"}
+    assert data.categorias_contabilidad.get_by_nombre("servicios").codigo == "SRV"
+    with pytest.raises(TypeError):
+        data.tipos_movimiento.por_id[3] = None
+    assert registry.get(db_session) is data
+
+
+def test_registry_reloads_after_ttl(db_session):
+    clock = FakeClock()
+    registry = ReferenceDataRegistry(ttl_seconds=10, clock=clock)
+    data = registry.load(db_session)
+    # Un UPDATE masivo no pasa por la unidad de trabajo: solo el TTL lo detecta.
+    db_session.query(TipoMovimiento).filter_by(tipo_movimiento_id=1).update({"nombre": "Ingreso"})
+    db_session.commit()
+
+    clock.now = 9
+    assert registry.get(db_session) is data
+    clock.now = 10
+    assert registry.get(db_session).tipos_movimiento.get(1).nombre == "Ingreso"
+
+
+def test_global_registry_is_invalidated_when_reference_rows_are_committed(db_session):
+    reference_data.load(db_session)
+    assert reference_data.tipo_movimiento(db_session, 3) is None
+
+    db_session.add(TipoMovimiento(tipo_movimiento_id=3, nombre="Ajuste", activo=True, signo=1))
+    db_session.commit()
+
+    assert reference_data._data is None
+    assert reference_data.tipo_movimiento(db_session, 3).nombre == "Ajuste"
@@ -0,0 +1,105 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+from domain.interfaces.reposicion_repository_interface import (
+    ReposicionRepositoryInterface,
+)
+from domain.services.reposicion_service import ReposicionService, calcular_reposicion
+
+HASTA = date(2026, 3, 28)
+
+
+class FakeReposicionRepository(ReposicionRepositoryInterface):
+    def __init__(self, catalogo, ventas):
+        self.catalogo = catalogo
+        self.ventas = ventas
+
+    def get_catalogo_stock(self):
+        return self.catalogo
+
+    def get_unidades_vendidas_por_dia(self, desde, hasta):
+        return [row for row in self.ventas if desde <= row[1] <= hasta]
+
+
+def test_suggestions_use_sales_velocity_and_cover_target():
+    catalogo = [
+        (1, "COD1", "Arroz", 10, 5),
+        (2, "COD2", "Leche", 100, 5),
+        (3, "COD3", "Cafe", 0, 2),
+    ]
+    # Arroz: 2 unidades diarias los 28 dias. Leche: 7 unidades solo en la ultima semana.
+    ventas = [(1, HASTA - timedelta(days=d), 2) for d in range(28)]
+    ventas += [(2, HASTA - timedelta(days=d), 7) for d in range(7)]
+    ventas.append((99, HASTA, 50))
+
+    service = ReposicionService(FakeReposicionRepository(catalogo, ventas))
+    result = service.calcular_sugerencias(
+        hasta=HASTA, dias_historia=28, dias_lead_time=3, dias_cobertura_objetivo=14
+    )
+
+    assert result.desde == date(2026, 3, 1)
+    assert result.productos_evaluados == 3
+    items = {item.producto_id: item for item in result.items}
+
+    assert items[1].venta_promedio_diaria == 2.0
+    assert items[1].dias_cobertura == 5.0
+    assert items[1].cantidad_sugerida == 2 * 17 + 5 - 10
+
+    assert items[2].venta_promedio_diaria == 1.75
+    assert items[2].venta_promedio_7_dias == 7.0
+    assert items[2].cantidad_sugerida == 7 * 17 + 5 - 100
+
+    assert items[3].dias_cobertura is None
+    assert items[3].cantidad_sugerida == 2
+    assert [item.producto_id for item in result.items] == [1, 2, 3]
+
+
+def test_products_without_suggestion_are_filtered_by_default():
+    catalogo = [(1, "COD1", "Arroz", 500, 5)]
+    ventas = [(1, HASTA, 1)]
+    service = ReposicionService(FakeReposicionRepository(catalogo, ventas))
+
+    assert service.calcular_sugerencias(hasta=HASTA).items == []
+    todos = service.calcular_sugerencias(hasta=HASTA, solo_con_sugerencia=False)
+    assert [item.cantidad_sugerida for item in todos.items] == [0]
+
+
+def test_vectorized_engine_aggregates_every_sku_at_catalog_scale():
+    n = 50_000
+    dias = 28
+    rng = np.random.default_rng(7)
+    producto_ids = np.arange(1, n + 1, dtype=np.int64)
+    cantidad_actual = rng.integers(0, 200, n)
+    cantidad_minima = rng.integers(0, 20, n)
+    desde = HASTA - timedelta(days=dias - 1)
+    filas = 200_000
+    ventas = list(
+        zip(
+            rng.integers(1, n + 1, filas).tolist(),
+            (desde + timedelta(days=int(d)) for d in rng.integers(0, dias, filas)),
+            rng.integers(1, 10, filas).tolist(),
+        )
+    )
+
+    resultado = calcular_reposicion(
+        producto_ids,
+        cantidad_actual,
+        cantidad_minima,
+        ventas,
+        desde=desde,
+        dias_historia=dias,
+        dias_lead_time=3,
+        dias_cobertura_objetivo=14,
+    )
+    assert resultado["cantidad_sugerida"].shape == (n,)
+    total_vendido = resultado["venta_promedio_diaria"].sum() * dias
+    assert np.isclose(total_vendido, sum(row[2] for row in ventas))
+    vendido_por_sku = {}
+    for producto_id, _, cantidad in ventas:
+        vendido_por_sku[producto_id] = vendido_por_sku.get(producto_id, 0) + cantidad
+    for producto_id in rng.integers(1, n + 1, 100).tolist():
+        assert np.isclose(
+            resultado["venta_promedio_diaria"][producto_id - 1] * dias,
+            vendido_por_sku.get(producto_id, 0),
+        )
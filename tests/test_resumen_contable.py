@@ -0,0 +1,114 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from domain.dtos.egresoDto import EgresoRequest
+from domain.dtos.ingresoDto import IngresoRequest
+from domain.dtos.ventaDto import VentaDetalleRequest, VentaRequest
+from domain.services.egreso_service import EgresoService
+from domain.services.ingreso_service import IngresoService
+from domain.services.resumen_contable_service import ResumenContableService
+from domain.services.venta_service import VentaService
+from src.infrastructure.models.models import Ingreso, Product, ResumenContableMensual
+from src.infrastructure.repository.createEgresoRepository import EgresoRepository
+from src.infrastructure.repository.createIngresoRepository import IngresoRepository
+from src.infrastructure.repository.createResumenContableRepository import (
+    ResumenContableRepository,
+)
+from src.infrastructure.repository.createVentaRepository import VentaRepository
+
+
+def _ts(mes, dia):
+    return datetime(2026, mes, dia, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    now = datetime.now(timezone.utc)
+    session.add(
+        Product(
+            producto_id=1,
+            codigo_barras="COD1",
+            nombre="Arroz",
+            precio_venta=Decimal("10.00"),
+            costo=Decimal("5.00"),
+            fecha_creacion=now,
+            fecha_actualizacion=now,
+            estado=True,
+        )
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _registrar(session):
+    ventas = VentaService(VentaRepository(session))
+    ingresos = IngresoService(IngresoRepository(session))
+    egresos = EgresoService(EgresoRepository(session))
+    for mes, precio in ((1, "50.00"), (1, "25.00"), (2, "40.00")):
+        ventas.create_venta(
+            VentaRequest(
+                tipo_pago="efectivo",
+                fecha=_ts(mes, 3),
+                detalles=[VentaDetalleRequest(producto_id=1, cantidad=1, precio_unitario=precio)],
+            )
+        )
+    ingresos.create_ingreso(
+        IngresoRequest(monto=Decimal("10.00"), tipo_ingreso="transferencia", fecha=_ts(1, 9))
+    )
+    for fecha, monto in ((_ts(1, 20), "30.00"), (_ts(2, 1), "5.00")):
+        egresos.create_egreso(
+            EgresoRequest(monto=Decimal(monto), tipo_egreso="efectivo", fecha=fecha)
+        )
+
+
+def _filas(session):
+    return sorted(
+        (r.serie, r.mes, r.categoria_id, r.medio_pago, r.total, r.cantidad)
+        for r in session.query(ResumenContableMensual).all()
+    )
+
+
+def test_writes_keep_monthly_rollups_and_pl_reads_them(db_session):
+    _registrar(db_session)
+
+    assert _filas(db_session) == [
+        ("egreso", date(2026, 1, 1), 0, "efectivo", Decimal("30.00"), 1),
+        ("egreso", date(2026, 2, 1), 0, "efectivo", Decimal("5.00"), 1),
+        ("ingreso", date(2026, 1, 1), 0, "transferencia", Decimal("10.00"), 1),
+        ("venta", date(2026, 1, 1), 0, "efectivo", Decimal("75.00"), 2),
+        ("venta", date(2026, 2, 1), 0, "efectivo", Decimal("40.00"), 1),
+    ]
+
+    service = ResumenContableService(ResumenContableRepository(db_session))
+    resultado = service.get_resultado_mensual(date(2026, 1, 15), date(2026, 3, 1))
+    assert resultado.desde == date(2026, 1, 1)
+    assert [(m.mes, m.ventas, m.ingresos, m.egresos, m.resultado) for m in resultado.items] == [
+        (date(2026, 1, 1), Decimal("75.00"), Decimal("10.00"), Decimal("30.00"), Decimal("55.00")),
+        (date(2026, 2, 1), Decimal("40.00"), Decimal("0.00"), Decimal("5.00"), Decimal("35.00")),
+    ]
+
+
+def test_rebuild_recomputes_months_from_source_rows(db_session):
+    _registrar(db_session)
+    incremental = _filas(db_session)
+
+    # Un ingreso cargado por fuera de la aplicacion no pasa por el acumulado.
+    db_session.add(Ingreso(monto=Decimal("4.00"), fecha=_ts(2, 2), tipo_ingreso="efectivo"))
+    db_session.commit()
+
+    service = ResumenContableService(ResumenContableRepository(db_session))
+    result = service.reconstruir(date(2026, 1, 1), date(2026, 2, 28))
+
+    assert result.filas == len(incremental) + 1
+    db_session.expire_all()
+    assert _filas(db_session) == sorted(
+        incremental + [("ingreso", date(2026, 2, 1), 0, "efectivo", Decimal("4.00"), 1)]
+    )
+    with pytest.raises(ValueError):
+        service.reconstruir(date(2026, 3, 1), date(2026, 1, 1))
@@ -0,0 +1,119 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from domain.dtos.ventaDto import VentaDetalleRequest, VentaRequest
+from domain.services.resumen_venta_diaria_service import ResumenVentaDiariaService
+from domain.services.venta_service import VentaService
+from src.infrastructure.models.models import Product, ResumenVentaDiaria, Venta
+from src.infrastructure.repository.createResumenVentaDiariaRepository import (
+    ResumenVentaDiariaRepository,
+)
+from src.infrastructure.repository.createVentaRepository import VentaRepository
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    now = datetime.now(timezone.utc)
+    session.add(
+        Product(
+            producto_id=1,
+            codigo_barras="COD1",
+            nombre="Arroz",
+            precio_venta=Decimal("10.00"),
+            costo=Decimal("5.00"),
+            fecha_creacion=now,
+            fecha_actualizacion=now,
+            estado=True,
+        )
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _vender(session, tipo_pago, precio, fecha, estado=True):
+    VentaService(VentaRepository(session)).create_venta(
+        VentaRequest(
+            tipo_pago=tipo_pago,
+            estado=estado,
+            fecha=fecha,
+            detalles=[VentaDetalleRequest(producto_id=1, cantidad=2, precio_unitario=precio)],
+        )
+    )
+
+
+def _contadores(resumen):
+    return (
+        resumen.total_ventas,
+        resumen.total_efectivo,
+        resumen.total_tarjeta,
+        resumen.total_transferencia,
+        resumen.cantidad_transacciones,
+    )
+
+
+def test_each_sale_updates_its_day_in_the_same_transaction(db_session):
+    dia = datetime(2026, 5, 4, 15, 0, tzinfo=timezone.utc)
+    _vender(db_session, "efectivo", Decimal("10.00"), dia)
+    _vender(db_session, "tarjeta", Decimal("5.50"), dia)
+    _vender(db_session, "efectivo", Decimal("1.00"), dia)
+    _vender(db_session, "transferencia", Decimal("99.00"), dia, estado=False)
+    _vender(db_session, "transferencia", Decimal("3.00"), datetime(2026, 5, 5, 9, tzinfo=timezone.utc))
+
+    service = ResumenVentaDiariaService(ResumenVentaDiariaRepository(db_session))
+    resumen = service.get_by_fecha(date(2026, 5, 4))
+
+    assert _contadores(resumen) == (
+        Decimal("33.00"),
+        Decimal("22.00"),
+        Decimal("11.00"),
+        Decimal("0.00"),
+        3,
+    )
+    assert service.get_by_fecha(date(2026, 5, 5)).total_transferencia == Decimal("6.00")
+    assert service.get_by_fecha(date(2026, 5, 6)) is None
+
+
+def test_rebuild_matches_incremental_counters_and_drops_stale_days(db_session):
+    _vender(db_session, "efectivo", Decimal("10.00"), datetime(2026, 5, 4, 8, tzinfo=timezone.utc))
+    _vender(db_session, "tarjeta", Decimal("4.00"), datetime(2026, 5, 4, 20, tzinfo=timezone.utc))
+    repo = ResumenVentaDiariaRepository(db_session)
+    incremental = _contadores(repo.get_by_fecha(date(2026, 5, 4)))
+
+    # Una venta anulada por fuera y un dia con datos obsoletos.
+    db_session.query(Venta).filter(Venta.tipo_pago == "tarjeta").update({"estado": False})
+    db_session.add(
+        ResumenVentaDiaria(
+            fecha=date(2026, 5, 3),
+            total_ventas=Decimal("1.00"),
+            total_efectivo=Decimal("1.00"),
+            total_tarjeta=Decimal("0.00"),
+            total_transferencia=Decimal("0.00"),
+            cantidad_transacciones=1,
+            fecha_actualizacion=datetime.now(timezone.utc),
+        )
+    )
+    db_session.commit()
+
+    service = ResumenVentaDiariaService(repo)
+    result = service.reconstruir(date(2026, 5, 1), date(2026, 5, 31))
+
+    assert result.dias == 1
+    assert incremental[4] == 2
+    db_session.expire_all()
+    assert _contadores(repo.get_by_fecha(date(2026, 5, 4))) == (
+        Decimal("20.00"),
+        Decimal("20.00"),
+        Decimal("0.00"),
+        Decimal("0.00"),
+        1,
+    )
+    assert repo.get_by_fecha(date(2026, 5, 3)) is None
+
+    with pytest.raises(ValueError):
+        service.reconstruir(date(2026, 6, 1), date(2026, 5, 1))
@@ -0,0 +1,125 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from src.app.services.stock_alert_service import StockAlertService
+from src.infrastructure.models.models import Product, Stock
+
+
+class FakeWhatsAppClient:
+    def __init__(self):
+        self.sent = []
+
+    def send_message(self, recipient_id, message):
+        self.sent.append((recipient_id, message))
+        return {}
+
+    def send_buttons(self, recipient_id, body_text, buttons):
+        return {}
+
+
+def _add_stock(session, producto_id, nombre, actual, minima):
+    now = datetime.now(timezone.utc)
+    session.add(
+        Product(
+            producto_id=producto_id,
+            codigo_barras=f"COD{producto_id}",
+            nombre=nombre,
+            precio_venta=Decimal("10.00"),
+            costo=Decimal("5.00"),
+            fecha_creacion=now,
+            fecha_actualizacion=now,
+            estado=True,
+        )
+    )
+    session.add(
+        Stock(
+            producto_id=producto_id,
+            cantidad_actual=actual,
+            cantidad_minima=minima,
+            ultima_actualizacion=now,
+        )
+    )
+    session.commit()
+
+
+def test_flush_sends_single_digest_for_low_stock_products(session_factory):
+    session = session_factory()
+    _add_stock(session, 1, "Arroz", 2, 5)
+    _add_stock(session, 2, "Leche", 10, 5)
+    _add_stock(session, 3, "Cafe", 5, 5)
+    session.close()
+
+    client = FakeWhatsAppClient()
+    service = StockAlertService(
+        session_factory=session_factory,
+        whatsapp_client=client,
+        recipients=["573000000000"],
+        debounce_seconds=60,
+    )
+    service.notify_stock_change([1, 2])
+    service.notify_stock_change([1, 3])
+
+    alerted = service.flush()
+
+    assert alerted == [1, 3]
+    assert len(client.sent) == 1
+    recipient, message = client.sent[0]
+    assert recipient == "573000000000"
+    assert "Arroz: 2 (minimo 5)" in message
+    assert "Cafe: 5 (minimo 5)" in message
+    assert "Leche" not in message
+
+
+def test_products_are_debounced_until_they_recover(session_factory):
+    session = session_factory()
+    _add_stock(session, 1, "Arroz", 2, 5)
+
+    client = FakeWhatsAppClient()
+    service = StockAlertService(
+        session_factory=session_factory,
+        whatsapp_client=client,
+        recipients=["573000000000"],
+        debounce_seconds=60,
+    )
+    service.notify_stock_change([1])
+    assert service.flush() == [1]
+
+    service.notify_stock_change([1])
+    assert service.flush() == []
+
+    stock = session.query(Stock).filter(Stock.producto_id == 1).one()
+    stock.cantidad_actual = 20
+    session.commit()
+    service.notify_stock_change([1])
+    assert service.flush() == []
+
+    stock.cantidad_actual = 1
+    session.commit()
+    session.close()
+    service.notify_stock_change([1])
+    assert service.flush() == [1]
+    assert len(client.sent) == 2
+
+
+def test_close_cancels_pending_timer_and_sends_digest(session_factory):
+    session = session_factory()
+    _add_stock(session, 1, "Arroz", 2, 5)
+    session.close()
+
+    client = FakeWhatsAppClient()
+    service = StockAlertService(
+        session_factory=session_factory,
+        whatsapp_client=client,
+        recipients=["573000000000"],
+        debounce_seconds=3600,
+    )
+    service.notify_stock_change([1])
+    timer = service._timer
+    assert timer is not None and timer.is_alive()
+
+    assert service.close() == [1]
+    timer.join(timeout=1)
+    assert not timer.is_alive()
+    assert service._timer is None
+    assert len(client.sent) == 1
+
@@ -0,0 +1,142 @@
+import threading
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
+
+from domain.entities.movimientoStockEntity import MovimientoStockEntity
+from domain.entities.stockEntity import StockEntity
+from src.infrastructure.models.models import (
+    Base,
+    MovimientosStock,
+    Product,
+    RefMovimiento,
+    Stock,
+    TipoMovimiento,
+)
+from src.infrastructure.repository.createStockRepository import StockRepository
+
+SALIDA = 2
+STOCK_INICIAL = 100
+WRITERS = 8
+INTENTOS_POR_WRITER = 25
+
+
+@pytest.fixture
+def file_session_factory(tmp_path, inventario_tables):
+    # SQLite en archivo: cada hilo usa su propia conexion, como en produccion.
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'stock.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+        pool_size=WRITERS,
+    )
+    Base.metadata.create_all(bind=engine, tables=inventario_tables)
+    factory = sessionmaker(bind=engine)
+
+    session = factory()
+    now = datetime.now(timezone.utc)
+    session.add_all(
+        [
+            TipoMovimiento(tipo_movimiento_id=SALIDA, nombre="salida", activo=True, signo=-1),
+            RefMovimiento(ref_movimiento_id=1, nombre="venta", activo=True),
+            Product(
+                producto_id=1,
+                codigo_barras="COD1",
+                nombre="Arroz",
+                precio_venta=Decimal("10.00"),
+                costo=Decimal("5.00"),
+                fecha_creacion=now,
+                fecha_actualizacion=now,
+                estado=True,
+            ),
+        ]
+    )
+    session.commit()
+    StockRepository(session).create_stock(
+        StockEntity(producto_id=1, cantidad_actual=STOCK_INICIAL, cantidad_minima=0)
+    )
+    session.close()
+
+    yield factory
+    engine.dispose()
+
+
+def test_concurrent_sales_never_lose_updates_or_oversell(file_session_factory):
+    vendidos = []
+    rechazados = []
+    errores = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(WRITERS)
+
+    def writer():
+        session = file_session_factory()
+        repo = StockRepository(session)
+        barrier.wait()
+        try:
+            for _ in range(INTENTOS_POR_WRITER):
+                try:
+                    repo.registrar_movimiento(
+                        MovimientoStockEntity(
+                            producto_id=1,
+                            tipo_movimiento_id=SALIDA,
+                            ref_movimiento_id=1,
+                            cantidad=1,
+                        )
+                    )
+                    with lock:
+                        vendidos.append(1)
+                except ValueError:
+                    with lock:
+                        rechazados.append(1)
+        except Exception as exc:
+            with lock:
+                errores.append(exc)
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=writer) for _ in range(WRITERS)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    total = WRITERS * INTENTOS_POR_WRITER
+    print(f"\n{total} movimientos concurrentes en {elapsed:.3f}s ({total / elapsed:.0f} ops/s)")
+
+    assert errores == []
+    assert len(vendidos) == STOCK_INICIAL
+    assert len(rechazados) == total - STOCK_INICIAL
+
+    session = file_session_factory()
+    try:
+        stock = session.query(Stock).one()
+        assert stock.cantidad_actual == 0
+        assert stock.version == STOCK_INICIAL + 1
+        assert session.query(MovimientosStock).count() == STOCK_INICIAL
+        assert StockRepository(session).get_stock_ledger(stock.stock_id).diferencia == 0
+    finally:
+        session.close()
+
+
+def test_stale_orm_write_is_rejected_by_version_check(file_session_factory):
+    first = file_session_factory()
+    second = file_session_factory()
+    try:
+        stock_a = first.query(Stock).one()
+        stock_b = second.query(Stock).one()
+
+        stock_a.cantidad_actual -= 1
+        first.commit()
+
+        stock_b.cantidad_actual -= 1
+        with pytest.raises(StaleDataError):
+            second.commit()
+    finally:
+        first.close()
+        second.close()
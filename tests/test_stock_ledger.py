@@ -0,0 +1,268 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from domain.dtos.conteoStockDto import ConteoStockItem
+from domain.entities.movimientoStockEntity import MovimientoStockEntity
+from domain.entities.stockEntity import StockEntity
+from domain.services.stock_service import StockService
+from src.infrastructure.models.models import (
+    MovimientosStock,
+    Product,
+    RefMovimiento,
+    SnapshotStock,
+    Stock,
+    TipoMovimiento,
+    User,
+)
+from src.infrastructure.repository.createStockRepository import StockRepository
+
+ENTRADA = 1
+SALIDA = 2
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    now = datetime.now(timezone.utc)
+    session.add_all(
+        [
+            TipoMovimiento(tipo_movimiento_id=ENTRADA, nombre="entrada", activo=True, signo=1),
+            TipoMovimiento(tipo_movimiento_id=SALIDA, nombre="salida", activo=True, signo=-1),
+            RefMovimiento(ref_movimiento_id=1, nombre="compra", activo=True),
+            Product(
+                producto_id=1,
+                codigo_barras="COD1",
+                nombre="Arroz",
+                precio_venta=Decimal("10.00"),
+                costo=Decimal("5.00"),
+                fecha_creacion=now,
+                fecha_actualizacion=now,
+                estado=True,
+            ),
+        ]
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _movimiento(tipo, cantidad):
+    return MovimientoStockEntity(
+        producto_id=1, tipo_movimiento_id=tipo, ref_movimiento_id=1, cantidad=cantidad
+    )
+
+
+def test_ledger_matches_cantidad_actual_after_movements(db_session):
+    repo = StockRepository(db_session)
+    stock = repo.create_stock(StockEntity(producto_id=1, cantidad_actual=10, cantidad_minima=2))
+
+    repo.registrar_movimiento(_movimiento(ENTRADA, 5))
+    repo.registrar_movimiento(_movimiento(SALIDA, 3))
+
+    ledger = repo.get_stock_ledger(stock.stock_id)
+    assert ledger.cantidad_ledger == 12
+    assert ledger.cantidad_actual == 12
+    assert ledger.diferencia == 0
+
+
+def test_snapshot_only_sums_later_movements(db_session):
+    repo = StockRepository(db_session)
+    stock = repo.create_stock(StockEntity(producto_id=1, cantidad_actual=10, cantidad_minima=2))
+    repo.registrar_movimiento(_movimiento(ENTRADA, 5))
+
+    creados, _ = repo.crear_snapshots()
+    assert creados == 1
+    assert repo.crear_snapshots()[0] == 0
+
+    repo.registrar_movimiento(_movimiento(SALIDA, 4))
+    ultimo = (
+        db_session.query(SnapshotStock)
+        .order_by(SnapshotStock.snapshot_id.desc())
+        .first()
+    )
+    assert ultimo.cantidad == 15
+    assert repo.get_stock_ledger(stock.stock_id).cantidad_ledger == 11
+
+
+def test_snapshot_includes_lower_id_movement_committed_while_waiting_for_lock(db_session, monkeypatch):
+    repo = StockRepository(db_session)
+    stock = repo.create_stock(StockEntity(producto_id=1, cantidad_actual=10, cantidad_minima=2))
+    repo.registrar_movimiento(_movimiento(ENTRADA, 5))
+    # El ID 2 lo tomo otra transaccion que todavia no confirmo.
+    db_session.add(
+        MovimientosStock(
+            movimiento_id=3,
+            stock_id=stock.stock_id,
+            producto_id=1,
+            tipo_movimiento_id=ENTRADA,
+            ref_movimiento_id=1,
+            cantidad=1,
+            fecha_creacion=datetime.now(timezone.utc),
+        )
+    )
+    db_session.get(Stock, stock.stock_id).cantidad_actual = 16
+    db_session.commit()
+
+    def confirma_el_rezagado():
+        # Lo que en PostgreSQL pasa mientras el LOCK espera a los escritores.
+        db_session.add(
+            MovimientosStock(
+                movimiento_id=2,
+                stock_id=stock.stock_id,
+                producto_id=1,
+                tipo_movimiento_id=ENTRADA,
+                ref_movimiento_id=1,
+                cantidad=2,
+                fecha_creacion=datetime.now(timezone.utc),
+            )
+        )
+        db_session.get(Stock, stock.stock_id).cantidad_actual = 18
+        db_session.commit()
+
+    monkeypatch.setattr(repo, "_bloquear_movimientos", confirma_el_rezagado)
+
+    assert repo.crear_snapshots() == (1, 3)
+    ultimo = db_session.query(SnapshotStock).order_by(SnapshotStock.snapshot_id.desc()).first()
+    assert ultimo.cantidad == 18
+    assert repo.get_stock_ledger(stock.stock_id).diferencia == 0
+
+
+def test_snapshot_locks_movements_before_reading_the_cutoff_on_postgres():
+    class Corte(Exception):
+        pass
+
+    llamadas = []
+    db = MagicMock()
+    db.get_bind.return_value.dialect.name = "postgresql"
+    db.execute.side_effect = lambda stmt, *a, **k: llamadas.append(str(stmt))
+
+    def query(*args):
+        llamadas.append("max(movimiento_id)")
+        raise Corte
+
+    db.query.side_effect = query
+
+    with pytest.raises(Corte):
+        StockRepository(db).crear_snapshots()
+    assert llamadas == ["LOCK TABLE movimientos_stock IN SHARE MODE", "max(movimiento_id)"]
+
+
+def test_reconciliation_reports_drift(db_session):
+    repo = StockRepository(db_session)
+    stock = repo.create_stock(StockEntity(producto_id=1, cantidad_actual=10, cantidad_minima=2))
+    repo.registrar_movimiento(_movimiento(SALIDA, 2))
+
+    record = db_session.get(Stock, stock.stock_id)
+    record.cantidad_actual = 20
+    db_session.commit()
+
+    ledgers = repo.list_stock_ledger()
+    assert [(l.stock_id, l.cantidad_ledger, l.diferencia) for l in ledgers] == [
+        (stock.stock_id, 8, 12)
+    ]
+
+
+def test_movement_cannot_leave_negative_stock(db_session):
+    repo = StockRepository(db_session)
+    repo.create_stock(StockEntity(producto_id=1, cantidad_actual=1, cantidad_minima=0))
+
+    with pytest.raises(ValueError):
+        repo.registrar_movimiento(_movimiento(SALIDA, 2))
+
+
+def test_conteo_import_adjusts_stock_in_chunks_and_reports_variance(db_session):
+    now = datetime.now(timezone.utc)
+    for producto_id in (2, 3):
+        db_session.add(
+            Product(
+                producto_id=producto_id,
+                codigo_barras=f"COD{producto_id}",
+                nombre=f"Producto {producto_id}",
+                precio_venta=Decimal("10.00"),
+                costo=Decimal("2.50"),
+                fecha_creacion=now,
+                fecha_actualizacion=now,
+                estado=True,
+            )
+        )
+    db_session.add(
+        User(
+            user_id=7,
+            correo="conteo@example.com",
+            contrasena_hash="x",
+            role="administrador",
+            activo=True,
+            creado_at=now,
+            actualizado_at=now,
+        )
+    )
+    db_session.commit()
+    repo = StockRepository(db_session)
+    for producto_id in (1, 2, 3):
+        repo.create_stock(
+            StockEntity(producto_id=producto_id, cantidad_actual=10, cantidad_minima=0)
+        )
+
+    items = [
+        ConteoStockItem(codigo_barras="COD1", cantidad=4),
+        ConteoStockItem(codigo_barras="COD2", cantidad=10),
+        ConteoStockItem(codigo_barras="COD1", cantidad=3),
+        ConteoStockItem(codigo_barras="COD3", cantidad=12),
+        ConteoStockItem(codigo_barras="NOEXISTE", cantidad=1),
+    ]
+    report = StockService(repo).importar_conteo(
+        items,
+        tipo_entrada_id=ENTRADA,
+        tipo_salida_id=SALIDA,
+        ref_movimiento_id=1,
+        realizado_por_id=7,
+        chunk_size=2,
+    )
+
+    assert report.filas == 5
+    assert report.productos == 4
+    assert report.ajustados == 2
+    assert report.sin_diferencia == 1
+    assert report.no_encontrados == ["NOEXISTE"]
+    diferencias = {v.codigo_barras: v.diferencia for v in report.variaciones}
+    assert diferencias == {"COD1": -3, "COD3": 2}
+    assert report.valor_diferencia_total == Decimal("-10.00")
+
+    ledgers = {l.producto_id: l for l in repo.list_stock_ledger()}
+    assert ledgers[1].cantidad_actual == ledgers[1].cantidad_ledger == 7
+    assert ledgers[3].cantidad_actual == ledgers[3].cantidad_ledger == 12
+    editores = {s.producto_id: s.actualizado_por_id for s in db_session.query(Stock)}
+    # Solo los stocks ajustados por el conteo cambian de editor.
+    assert editores == {1: 7, 2: None, 3: 7}
+
+
+def test_movement_history_is_keyset_paginated_with_reference_names(db_session):
+    repo = StockRepository(db_session)
+    repo.create_stock(StockEntity(producto_id=1, cantidad_actual=0, cantidad_minima=0))
+    base = datetime(2026, 1, 10, 12, 0, tzinfo=timezone.utc)
+    for offset in range(5):
+        movimiento = _movimiento(ENTRADA, offset + 1)
+        movimiento.fecha_creacion = base + timedelta(hours=offset % 3)
+        repo.registrar_movimiento(movimiento)
+    service = StockService(repo)
+
+    pages = []
+    cursor = None
+    while True:
+        page = service.list_movimientos(1, cursor=cursor, limit=2)
+        pages.append([item.cantidad for item in page.items])
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert pages == [[3, 5], [2, 4], [1]]
+    assert page.items[0].tipo_movimiento_nombre == "entrada"
+    assert page.items[0].ref_movimiento_nombre == "compra"
+
+    filtered = service.list_movimientos(1, tipo_movimiento_id=SALIDA)
+    assert filtered.items == []
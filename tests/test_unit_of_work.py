@@ -0,0 +1,176 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from src.app.services.conversation_state import InMemoryConversationStateStore
+from src.app.services.unit_of_work import LazyUnitOfWork, UnitOfWorkMetrics
+from src.app.services.webhook_service import WebhookService
+from src.infrastructure.repository.createConversationStateRepository import (
+    DbConversationStateStore,
+)
+
+
+class FakeSession:
+    def __init__(self):
+        self.cerrada = False
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def close(self):
+        self.cerrada = True
+
+
+class FakeSessionFactory:
+    def __init__(self):
+        self.sesiones = []
+
+    def __call__(self):
+        session = FakeSession()
+        self.sesiones.append(session)
+        return session
+
+
+class FakeClienteService:
+    def __init__(self, db):
+        self.db = db
+        self.creados = []
+
+    def create_cliente(self, payload):
+        self.creados.append(payload)
+        return SimpleNamespace(nombre=payload.nombre)
+
+
+class FakeWhatsAppClient:
+    def send_message(self, recipient_id, message):
+        return {}
+
+    def send_buttons(self, recipient_id, body_text, buttons):
+        return {}
+
+
+def _message(sender, text, message_id):
+    return {"from": sender, "id": message_id, "type": "text", "text": {"body": text}}
+
+
+def _service():
+    return WebhookService(
+        verify_token="token",
+        state=InMemoryConversationStateStore(),
+        logger=logging.getLogger("test-webhook"),
+        whatsapp_client=FakeWhatsAppClient(),
+    )
+
+
+def test_session_opens_on_first_use_and_closes_once():
+    factory = FakeSessionFactory()
+    metrics = UnitOfWorkMetrics()
+
+    with LazyUnitOfWork(factory, metrics) as uow:
+        assert not uow.abierta
+        servicio = uow.lazy(FakeClienteService)
+        assert not servicio.resuelto
+        assert factory.sesiones == []
+
+        assert servicio.creados == []
+        assert servicio.db is uow.session
+        assert len(factory.sesiones) == 1
+
+    assert factory.sesiones[0].cerrada
+    assert factory.sesiones[0].commits == 1
+    with LazyUnitOfWork(factory, metrics):
+        pass
+    assert metrics.as_dict() == {"unidades": 2, "sesiones_abiertas": 1, "sesiones_evitadas": 1}
+
+
+def test_messages_without_cliente_flow_never_open_a_session():
+    factory = FakeSessionFactory()
+    service = _service()
+
+    with LazyUnitOfWork(factory) as uow:
+        cliente_service = uow.lazy(FakeClienteService)
+        service.handle_sender_messages(
+            [({}, _message("111", "hola", "m1")), ({}, _message("111", "A", "m2"))],
+            cliente_service=cliente_service,
+        )
+
+    assert factory.sesiones == []
+
+    with LazyUnitOfWork(factory) as uow:
+        cliente_service = uow.lazy(FakeClienteService)
+        service.handle_sender_messages(
+            [({}, _message("111", "Juan\n3001234567", "m3"))],
+            cliente_service=cliente_service,
+        )
+        assert [c.nombre for c in cliente_service.creados] == ["Juan"]
+
+    assert len(factory.sesiones) == 1
+
+
+class CountingFactory:
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+        self.abiertas = 0
+
+    def __call__(self):
+        self.abiertas += 1
+        return self.session_factory()
+
+
+def test_db_state_lookups_go_through_the_unit_of_work(session_factory):
+    propias = CountingFactory(session_factory)
+    store = DbConversationStateStore(propias, ttl_seconds=60)
+    service = _service().con_estado(store)
+    metrics = UnitOfWorkMetrics()
+
+    def procesar(*mensajes):
+        factory = CountingFactory(session_factory)
+        with LazyUnitOfWork(factory, metrics) as uow:
+            job = service.con_estado(service.state.con_sesion(lambda: uow.session))
+            job.handle_sender_messages(
+                [({}, m) for m in mensajes], cliente_service=uow.lazy(FakeClienteService)
+            )
+        return factory.abiertas
+
+    # Texto sin flujo activo: solo la consulta de estado, en una sesion contada.
+    assert procesar(_message("111", "hola", "m1")) == 1
+    # Alta completa: estado, cliente y limpieza comparten la misma sesion.
+    assert procesar(_message("111", "A", "m2"), _message("111", "Juan", "m3")) == 1
+
+    assert propias.abiertas == 0
+    assert metrics.as_dict() == {"unidades": 2, "sesiones_abiertas": 2, "sesiones_evitadas": 0}
+    assert store.get("111") is None
+
+
+def test_unit_of_work_discards_pending_work_on_error():
+    factory = FakeSessionFactory()
+
+    with pytest.raises(RuntimeError):
+        with LazyUnitOfWork(factory) as uow:
+            uow.session
+            raise RuntimeError("fallo")
+
+    assert factory.sesiones[0].commits == 0
+    assert factory.sesiones[0].cerrada
+
+
+def test_state_view_leaves_commit_to_the_unit_of_work(session_factory):
+    store = DbConversationStateStore(session_factory, ttl_seconds=60)
+
+    with LazyUnitOfWork(session_factory) as uow:
+        vista = store.con_sesion(lambda: uow.session)
+        vista.set("111", "creando_cliente")
+        assert vista.get("111").estado == "creando_cliente"
+        # La vista no confirma: descartar la unidad de trabajo lo deshace.
+        uow.session.rollback()
+    assert store.get("111") is None
+
+    with LazyUnitOfWork(session_factory) as uow:
+        store.con_sesion(lambda: uow.session).set("111", "creando_cliente")
+    assert store.get("111").estado == "creando_cliente"
+
+    # Sin vista, cada operacion confirma en su propia sesion.
+    store.clear("111")
+    assert store.get("111") is None
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import sys
+import types
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+
+from src.infrastructure.data.webhookBenchmark import (
+    MockWhatsAppApi,
+    cargar_payloads,
+    clasificar,
+    generar_payloads,
+    main,
+    reescribir_ids,
+    replay,
+    resumir,
+)
+
+
+def _texto(sender, body, message_id):
+    return {
+        "entry": [
+            {
+                "changes": [
+                    {
+                        "value": {
+                            "messages": [
+                                {"from": sender, "id": message_id, "type": "text", "text": {"body": body}}
+                            ]
+                        }
+                    }
+                ]
+            }
+        ]
+    }
+
+
+def test_cargar_payloads_reads_ndjson_old_text_and_plain_json(tmp_path):
+    payload = _texto("573001", "hola", "wamid.1")
+    log = tmp_path / "captura.log"
+    log.write_text(
+        "\n".join(
+            [
+                json.dumps({"ts": "x", "level": "INFO", "msg": "POST /payload", "payload": payload}),
+                json.dumps({"ts": "x", "level": "INFO", "msg": "Mensaje detectado", "payload": {"id": "m"}}),
+                f"2024-01-01 10:00:00,000 - POST /payload: {payload!r}",
+                "2024-01-01 10:00:00,000 - No se encontraron mensajes en el payload",
+                json.dumps(payload),
+                "no es json",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    assert cargar_payloads(str(log)) == [payload, payload, payload]
+
+
+def test_generated_payloads_mix_code_paths_with_unique_ids():
+    payloads = generar_payloads(200, proporcion_estados=0.5, proporcion_comandos=0.2, seed=1)
+
+    caminos = [clasificar(p) for p in payloads]
+    assert set(caminos) == {"estado", "comando", "texto"}
+    assert 60 < caminos.count("estado") < 140
+    ids = [
+        m["id"]
+        for p in payloads
+        for m in p["entry"][0]["changes"][0]["value"].get("messages", [])
+    ]
+    assert len(ids) == len(set(ids))
+
+
+def test_reescribir_ids_leaves_original_untouched():
+    payload = _texto("573001", "A", "wamid.1")
+
+    copia = reescribir_ids(payload, "r1")
+
+    assert copia["entry"][0]["changes"][0]["value"]["messages"][0]["id"] == "wamid.1.r1"
+    assert payload["entry"][0]["changes"][0]["value"]["messages"][0]["id"] == "wamid.1"
+    assert clasificar(copia) == "comando"
+
+
+def test_replay_reports_throughput_latency_and_errors_per_path():
+    app = FastAPI()
+
+    @app.post("/webhook")
+    async def webhook(request: Request):
+        body = await request.json()
+        if clasificar(body) == "comando":
+            return {"status": "queued"}
+        if clasificar(body) == "estado":
+            return {"status": "ignored"}
+        raise HTTPException(status_code=503, detail="saturado")
+
+    payloads = generar_payloads(50, proporcion_estados=0.5, proporcion_comandos=0.2, seed=2)
+
+    async def escenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return await replay(client, "/webhook", payloads, concurrencia=5)
+
+    resultados, duracion = asyncio.run(escenario())
+    reporte = resumir(resultados, duracion)
+
+    assert reporte["total"] == 50
+    assert reporte["por_segundo"] > 0
+    caminos = reporte["por_camino"]
+    assert caminos["estado"]["estados"] == {"ignored": caminos["estado"]["total"]}
+    assert caminos["comando"]["tasa_error"] == 0
+    assert caminos["texto"]["tasa_error"] == 1
+    assert reporte["errores"] == caminos["texto"]["total"]
+    assert caminos["estado"]["p50_ms"] <= caminos["estado"]["max_ms"]
+
+
+def test_mock_whatsapp_api_answers_and_injects_rate_limits():
+    with MockWhatsAppApi(latencia=0, tasa_error=0.5, seed=3) as mock:
+        codigos = [httpx.post(mock.url, json={"to": "1"}).status_code for _ in range(20)]
+
+    assert set(codigos) == {200, 429}
+    assert mock.enviados == codigos.count(200)
+    assert mock.errores == codigos.count(429)
+
+
+def test_main_requires_a_target_and_rejects_apps_without_webhook(capsys, monkeypatch):
+    # main() apunta la app a la API falsa; se restaura al terminar.
+    monkeypatch.setenv("WHATSAPP_API_URL", "http://sin-uso")
+    monkeypatch.setenv("WHATSAPP_TOKEN", "token")
+    modulo = types.ModuleType("bench_sin_webhook")
+    modulo.app = FastAPI()
+    monkeypatch.setitem(sys.modules, "bench_sin_webhook", modulo)
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--sinteticos", "1"])
+    assert exc_info.value.code == 2
+    assert "--url" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--sinteticos", "1", "--app", "no_existe.modulo:app", "--whatsapp-latencia", "0"])
+    assert "No se pudo cargar --app no_existe.modulo:app" in str(exc_info.value)
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--sinteticos", "1", "--app", "bench_sin_webhook", "--whatsapp-latencia", "0"])
+    assert "no expone /webhook" in str(exc_info.value)
@@ -0,0 +1,111 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from functools import partial
+
+from sqlalchemy import select, update
+
+from src.app.services.purga_periodica import PurgaPeriodica
+
+from src.app.services.webhook_dedup import TtlIdCache, WebhookDeduplicator
+from src.infrastructure.models.models import WebhookMensajeProcesado
+from src.infrastructure.repository.createWebhookDedupRepository import WebhookDedupRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _grupos(*ids):
+    return {"111": [({}, {"id": message_id, "from": "111"}) for message_id in ids]}
+
+
+def test_ttl_cache_expires_ids_and_stays_bounded():
+    clock = FakeClock()
+    cache = TtlIdCache(max_size=3, ttl_seconds=10, clock=clock)
+
+    assert cache.add_if_absent("a")
+    assert not cache.add_if_absent("a")
+    clock.now = 10
+    assert cache.add_if_absent("a")  # vencio
+
+    for clave in ("b", "c", "d"):
+        cache.add_if_absent(clave)
+    assert len(cache) == 3
+    assert "a" not in cache  # el mas viejo salio por tamano
+
+
+def test_deduplicator_drops_redelivered_messages_and_forgets_rejected_ones():
+    dedup = WebhookDeduplicator(TtlIdCache())
+
+    assert [m["id"] for _, m in dedup.filtrar_nuevos(_grupos("m1", "m2"))["111"]] == ["m1", "m2"]
+    assert dedup.filtrar_nuevos(_grupos("m1", "m2")) == {}
+    assert [m["id"] for _, m in dedup.filtrar_nuevos(_grupos("m2", "m3"))["111"]] == ["m3"]
+    assert dedup.duplicados == 3
+
+    rechazados = dedup.filtrar_nuevos(_grupos("m4"))
+    dedup.olvidar(rechazados.values())
+    assert "111" in dedup.filtrar_nuevos(_grupos("m4"))
+
+
+def test_shared_table_lets_only_one_process_claim_a_message(session_factory):
+    db_a, db_b = session_factory(), session_factory()
+    try:
+        proceso_a = WebhookDeduplicator(TtlIdCache(), compartido=True)
+        proceso_b = WebhookDeduplicator(TtlIdCache(), compartido=True)
+        mensajes = _grupos("m1", "m2")["111"]
+
+        assert len(proceso_a.reclamar(db_a, mensajes)) == 2
+        assert proceso_b.reclamar(db_b, mensajes) == []
+        assert proceso_b.duplicados == 2
+
+        repo = WebhookDedupRepository(db_a)
+        assert repo.purgar(datetime.now(timezone.utc) + timedelta(seconds=1)) == 2
+        assert repo.reclamar("m1")
+    finally:
+        db_a.close()
+        db_b.close()
+
+
+def test_periodic_purge_trims_claims_older_than_the_ttl(session_factory):
+    dedup = WebhookDeduplicator(TtlIdCache(ttl_seconds=3600), compartido=True)
+    with session_factory() as db:
+        dedup.reclamar(db, _grupos("viejo", "nuevo")["111"])
+        db.execute(
+            update(WebhookMensajeProcesado)
+            .where(WebhookMensajeProcesado.message_id == "viejo")
+            .values(fecha_recepcion=datetime.now(timezone.utc) - timedelta(hours=2))
+        )
+        db.commit()
+
+    purgas = PurgaPeriodica(intervalo_seconds=60)
+    purgas.registrar("dedup", partial(dedup.purgar_vencidos, session_factory))
+
+    async def escenario():
+        purgas.start()
+        while not purgas.pasadas:
+            await asyncio.sleep(0.01)
+        await purgas.stop()
+
+    asyncio.run(escenario())
+
+    with session_factory() as db:
+        restantes = db.execute(select(WebhookMensajeProcesado.message_id)).scalars().all()
+    assert restantes == ["nuevo"]
+    assert purgas.borrados == {"dedup": 1}
+
+
+def test_periodic_purge_keeps_running_when_a_task_fails():
+    purgas = PurgaPeriodica()
+
+    def falla():
+        raise RuntimeError("base caida")
+
+    purgas.registrar("falla", falla)
+    purgas.registrar("ok", lambda: 3)
+
+    assert asyncio.run(purgas.ejecutar()) == {"ok": 3}
+    assert purgas.pasadas == 1
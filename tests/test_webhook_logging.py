@@ -0,0 +1,60 @@
+import gzip
+import json
+import logging
+import queue
+
+from src.app.services.webhook_logging import (
+    NonBlockingQueueHandler,
+    PayloadSampler,
+    build_file_handler,
+    setup_webhook_logger,
+)
+
+
+def _record(msg, payload=None, level=logging.INFO):
+    record = logging.LogRecord("webhook", level, __file__, 1, msg, None, None)
+    if payload is not None:
+        record.payload = payload
+    return record
+
+
+def test_payloads_are_written_as_ndjson_off_the_request_thread(tmp_path):
+    log_path = tmp_path / "webhook.ndjson"
+    logger = setup_webhook_logger(str(log_path), name="test-webhook-ndjson")
+
+    logger.info("POST /payload", extra={"payload": {"entry": [{"id": "1", "texto": "ñandú"}]}})
+    logger.warning("cola llena")
+    logger.handlers[0].queue.join()
+
+    lineas = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert lineas[0]["msg"] == "POST /payload"
+    assert lineas[0]["payload"] == {"entry": [{"id": "1", "texto": "ñandú"}]}
+    assert lineas[1]["level"] == "WARNING" and "payload" not in lineas[1]
+
+
+def test_rotated_files_are_gzipped(tmp_path):
+    log_path = tmp_path / "webhook.ndjson"
+    handler = build_file_handler(str(log_path), max_bytes=300, backups=2)
+    try:
+        for i in range(20):
+            handler.handle(_record("POST /payload", {"i": i, "relleno": "x" * 50}))
+    finally:
+        handler.close()
+
+    rotado = tmp_path / "webhook.ndjson.1.gz"
+    assert rotado.exists()
+    assert not (tmp_path / "webhook.ndjson.3.gz").exists()
+    with gzip.open(rotado, "rt", encoding="utf-8") as archivo:
+        assert all("payload" in json.loads(line) for line in archivo)
+
+
+def test_sampling_keeps_non_payload_records_and_full_queue_never_blocks():
+    sampler = PayloadSampler(rate=0.0)
+    assert not sampler.filter(_record("POST /payload", {"a": 1}))
+    assert sampler.filter(_record("Error creando cliente", level=logging.ERROR))
+    assert sampler.descartados == 1
+
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    handler.handle(_record("uno"))
+    handler.handle(_record("dos"))
+    assert handler.descartados == 1
@@ -0,0 +1,112 @@
+import logging
+from types import SimpleNamespace
+
+from src.app.services.conversation_state import InMemoryConversationStateStore
+from src.app.services.webhook_service import ESTADO_CREANDO_CLIENTE, WebhookService
+
+
+class FakeWhatsAppClient:
+    def __init__(self):
+        self.sent = []
+
+    def send_message(self, recipient_id, message):
+        self.sent.append((recipient_id, message))
+        return {}
+
+    def send_buttons(self, recipient_id, body_text, buttons):
+        return {}
+
+
+class FakeClienteService:
+    def __init__(self):
+        self.creados = []
+
+    def create_cliente(self, payload):
+        self.creados.append(payload)
+        return SimpleNamespace(nombre=payload.nombre)
+
+
+def _message(sender, text, message_id):
+    return {"from": sender, "id": message_id, "type": "text", "text": {"body": text}}
+
+
+def _payload():
+    return {
+        "object": "whatsapp_business_account",
+        "entry": [
+            {
+                "changes": [
+                    {"value": {"statuses": [{"id": "wamid.x", "status": "read"}]}},
+                    {
+                        "value": {
+                            "messages": [
+                                _message("111", "A", "m1"),
+                                _message("222", "hola", "m2"),
+                                _message("111", "Juan\n3001234567", "m3"),
+                            ]
+                        }
+                    },
+                ]
+            },
+            {"changes": [{"value": {"messages": [_message("222", "A", "m4")]}}]},
+        ],
+    }
+
+
+def _service():
+    return WebhookService(
+        verify_token="token",
+        state=InMemoryConversationStateStore(),
+        logger=logging.getLogger("test-webhook"),
+        whatsapp_client=FakeWhatsAppClient(),
+    )
+
+
+def test_messages_are_grouped_by_sender_in_payload_order_and_statuses_dropped():
+    grupos = _service().messages_by_sender(_payload())
+
+    assert list(grupos) == ["111", "222"]
+    assert [m["id"] for _, m in grupos["111"]] == ["m1", "m3"]
+    assert [m["id"] for _, m in grupos["222"]] == ["m2", "m4"]
+
+    solo_estados = {"entry": [{"changes": [{"value": {"statuses": [{"status": "delivered"}]}}]}]}
+    assert _service().messages_by_sender(solo_estados) == {}
+
+
+def test_every_message_in_the_delivery_is_processed():
+    service = _service()
+    clientes = FakeClienteService()
+
+    result = service.handle_webhook(_payload(), cliente_service=clientes)
+
+    assert result == {"status": "ok", "mensajes": 4}
+    assert [c.nombre for c in clientes.creados] == ["Juan"]
+    assert clientes.creados[0].telefono == "3001234567"
+    # El remitente 222 inicio el flujo en el ultimo mensaje y queda pendiente.
+    assert service.state.get("111") is None
+    assert service.state.get("222").estado == ESTADO_CREANDO_CLIENTE
+    assert [r for r, _ in service.whatsapp_client.sent] == ["111", "111", "222"]
+
+
+class TimeoutOnceWhatsAppClient(FakeWhatsAppClient):
+    def send_message(self, recipient_id, message):
+        if not self.sent:
+            self.sent.append((recipient_id, None))
+            raise TimeoutError("sin respuesta")
+        return super().send_message(recipient_id, message)
+
+
+def test_unexpected_error_in_one_message_does_not_drop_the_next(caplog):
+    service = _service()
+    service.whatsapp_client = TimeoutOnceWhatsAppClient()
+    clientes = FakeClienteService()
+
+    with caplog.at_level(logging.ERROR, logger="test-webhook"):
+        resultados = service.handle_sender_messages(
+            [({}, _message("111", "A", "m1")), ({}, _message("111", "Juan\n300", "m2"))],
+            cliente_service=clientes,
+        )
+
+    assert resultados == [{"status": "error", "detail": "sin respuesta"}, {"status": "ok"}]
+    assert [c.nombre for c in clientes.creados] == ["Juan"]
+    assert any(r.exc_info and r.exc_info[0] is TimeoutError for r in caplog.records)
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+
+from src.app.services.webhook_worker_pool import WebhookWorkerPool
+
+
+def test_submit_returns_immediately_and_workers_process_in_background():
+    procesados = []
+    liberar = threading.Event()
+
+    def trabajo(i):
+        liberar.wait(1)
+        procesados.append(i)
+
+    async def escenario():
+        pool = WebhookWorkerPool(workers=2, queue_size=10)
+        inicio = time.monotonic()
+        for i in range(5):
+            assert pool.submit(lambda i=i: trabajo(i))
+        assert time.monotonic() - inicio < 0.1
+        assert procesados == []
+        liberar.set()
+        await pool.drain(timeout=2)
+        return pool
+
+    pool = asyncio.run(escenario())
+
+    assert sorted(procesados) == [0, 1, 2, 3, 4]
+    metricas = pool.metrics.as_dict()
+    assert metricas["recibidos"] == 5
+    assert metricas["procesados"] == 5
+    assert metricas["max_en_cola"] >= 3
+    assert not pool.running
+
+
+def test_full_queue_rejects_and_failures_are_counted():
+    bloqueo = threading.Event()
+
+    def falla():
+        raise RuntimeError("boom")
+
+    async def escenario():
+        pool = WebhookWorkerPool(workers=1, queue_size=1)
+        assert pool.submit(lambda: bloqueo.wait(1))
+        await asyncio.sleep(0.05)  # el worker toma el primero, la cola queda vacia
+        assert pool.submit(falla)
+        assert not pool.submit(falla)
+        bloqueo.set()
+        await pool.drain(timeout=2)
+        assert not pool.submit(falla)  # cerrado
+        return pool
+
+    pool = asyncio.run(escenario())
+
+    assert pool.metrics.procesados == 1
+    assert pool.metrics.fallidos == 1
+    assert pool.metrics.rechazados == 2
+
+
+def test_drain_gives_up_after_timeout_and_counts_dropped_jobs():
+    bloqueo = threading.Event()
+
+    async def escenario():
+        pool = WebhookWorkerPool(workers=1, queue_size=5)
+        for _ in range(3):
+            pool.submit(lambda: bloqueo.wait(0.5))
+        await pool.drain(timeout=0.05)
+        return pool
+
+    pool = asyncio.run(escenario())
+    bloqueo.set()
+
+    assert pool.metrics.descartados_al_cerrar == 2
+    assert not pool.running
+
+
+def test_jobs_with_same_key_run_in_order_while_other_keys_run_concurrently():
+    eventos = []
+    lock = threading.Lock()
+    b_termino = threading.Event()
+
+    def trabajo(nombre, espera=None):
+        def run():
+            if espera is not None:
+                # "a1" solo termina si "b1" corre en paralelo mientras tanto.
+                assert espera.wait(1)
+            with lock:
+                eventos.append(nombre)
+            if nombre == "b1":
+                b_termino.set()
+
+        return run
+
+    async def escenario():
+        pool = WebhookWorkerPool(workers=4, queue_size=10)
+        assert pool.submit_all(
+            [
+                ("a", trabajo("a1", espera=b_termino)),
+                ("a", trabajo("a2")),
+                ("b", trabajo("b1")),
+                ("a", trabajo("a3")),
+            ]
+        )
+        await pool.drain(timeout=2)
+        return pool
+
+    pool = asyncio.run(escenario())
+
+    assert [e for e in eventos if e.startswith("a")] == ["a1", "a2", "a3"]
+    assert eventos.index("b1") < eventos.index("a1")
+    assert pool.metrics.procesados == 4
+
+
+def test_submit_all_is_all_or_nothing():
+    async def escenario():
+        pool = WebhookWorkerPool(workers=1, queue_size=2)
+        aceptado = pool.submit_all([("a", lambda: None)] * 3)
+        await pool.drain(timeout=1)
+        return aceptado, pool
+
+    aceptado, pool = asyncio.run(escenario())
+
+    assert not aceptado
+    assert pool.metrics.rechazados == 3
+    assert pool.metrics.recibidos == 0
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from src.infrastructure.repository.whatsappAsyncClientRepository import (
+    RETRY_STATUS,
+    AsyncWhatsAppClient,
+    CircuitBreaker,
+    PooledWhatsAppClient,
+    WhatsAppApiError,
+    WhatsAppCircuitOpenError,
+)
+
+API_URL = "https://graph.test/v19.0/123/messages"
+
+
+class FakeGraphApi:
+    """Graph API simulada: responde con la lista de estados configurada y luego 200."""
+
+    def __init__(self, statuses=(), headers=None):
+        self.statuses = list(statuses)
+        self.headers = headers or {}
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        status = self.statuses.pop(0) if self.statuses else 200
+        if status != 200:
+            return httpx.Response(status, json={"error": {"code": status}}, headers=self.headers)
+        to = json.loads(request.content)["to"]
+        return httpx.Response(200, json={"messages": [{"id": f"wamid.{len(self.requests)}"}], "to": to})
+
+
+def _client(api, **options):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    client = AsyncWhatsAppClient(
+        API_URL,
+        "token",
+        transport=httpx.MockTransport(api),
+        sleep=fake_sleep,
+        jitter=lambda: 0.5,
+        **options,
+    )
+    return client, sleeps
+
+
+def test_retries_429_and_5xx_with_jittered_backoff_then_succeeds():
+    api = FakeGraphApi([429, 503, 500])
+    client, sleeps = _client(api, max_retries=3, backoff_base=1.0)
+
+    result = asyncio.run(client.send_message("573001112233", "hola"))
+
+    assert result["messages"][0]["id"] == "wamid.4"
+    assert sleeps == [0.5, 1.0, 2.0]
+    sent = json.loads(api.requests[0].content)
+    assert sent["text"]["body"] == "hola"
+    assert api.requests[0].headers["Authorization"] == "Bearer token"
+
+
+def test_client_errors_are_not_retried_and_retry_after_is_honored():
+    api = FakeGraphApi([400])
+    client, sleeps = _client(api)
+    with pytest.raises(WhatsAppApiError) as exc_info:
+        asyncio.run(client.send_message("1", "x"))
+    assert exc_info.value.status_code == 400
+    assert len(api.requests) == 1 and sleeps == []
+
+    api = FakeGraphApi([429], headers={"Retry-After": "3"})
+    client, sleeps = _client(api)
+    asyncio.run(client.send_message("1", "x"))
+    assert sleeps == [3.0]
+
+
+
+def test_429_can_be_left_to_the_caller():
+    api = FakeGraphApi([429])
+    client, sleeps = _client(api, retry_status=RETRY_STATUS - {429})
+
+    with pytest.raises(WhatsAppApiError) as exc_info:
+        asyncio.run(client.send_message("1", "x"))
+
+    assert exc_info.value.status_code == 429
+    assert len(api.requests) == 1 and sleeps == []
+    assert client.breaker.state == "closed"
+
+def test_circuit_opens_after_consecutive_failures_and_recovers_after_probe():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=lambda: now[0])
+    api = FakeGraphApi([503] * 4)
+    client, _ = _client(api, max_retries=1, breaker=breaker)
+
+    async def escenario():
+        for _ in range(2):
+            with pytest.raises(WhatsAppApiError):
+                await client.send_message("1", "x")
+        with pytest.raises(WhatsAppCircuitOpenError):
+            await client.send_message("1", "x")
+        llamadas = len(api.requests)
+        now[0] = 30
+        result = await client.send_message("1", "x")
+        return llamadas, result
+
+    llamadas, result = asyncio.run(escenario())
+
+    assert llamadas == 4
+    assert breaker.state == "closed"
+    assert result["to"] == "1"
+
+
+
+def test_probe_that_raises_unexpected_error_frees_the_half_open_slot():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30, clock=lambda: now[0])
+    breaker.record_failure()
+    now[0] = 30
+    fallar = [True]
+
+    def api(request):
+        if fallar.pop(0) if fallar else False:
+            raise RuntimeError("fallo inesperado")
+        return FakeGraphApi()(request)
+
+    client, _ = _client(api, breaker=breaker)
+
+    async def escenario():
+        with pytest.raises(RuntimeError):
+            await client.send_message("1", "x")
+        assert breaker.state == "half-open"
+        return await client.send_message("1", "x")
+
+    result = asyncio.run(escenario())
+
+    assert result["to"] == "1"
+    assert breaker.state == "closed"
+
+def test_pooled_client_shares_one_connection_pool_across_threads():
+    api = FakeGraphApi()
+    client = PooledWhatsAppClient(API_URL, "token", transport=httpx.MockTransport(api))
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: client.send_message(str(i), "hola"), range(200)))
+    finally:
+        client.close()
+
+    assert len(api.requests) == 200
+    assert sorted(r["to"] for r in results) == sorted(str(i) for i in range(200))
+
+
+def test_pooled_client_timeout_cancels_the_send_and_raises_api_error():
+    cancelados = []
+
+    async def lento(request):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelados.append(request)
+            raise
+        return httpx.Response(200, json={})
+
+    client = PooledWhatsAppClient(
+        API_URL, "token", call_timeout=0.05, transport=httpx.MockTransport(lento)
+    )
+    try:
+        with pytest.raises(WhatsAppApiError, match="sin respuesta"):
+            client.send_message("1", "x")
+        limite = time.monotonic() + 2
+        while not cancelados and time.monotonic() < limite:
+            time.sleep(0.01)
+    finally:
+        client.close()
+
+    assert len(cancelados) == 1
@@ -0,0 +1,215 @@
+import threading
+import time
+
+import pytest
+
+from src.app.services.whatsapp_outbox import (
+    PRIORIDAD_NOTIFICACION,
+    PRIORIDAD_RESPUESTA,
+    ScheduledWhatsAppClient,
+    TokenBucket,
+    WhatsAppOutbox,
+)
+from src.domain.interfaces.IwhatsappClientRepository import IwhatsappClientRepository
+from src.infrastructure.repository.whatsappAsyncClientRepository import WhatsAppApiError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeWhatsAppClient(IwhatsappClientRepository):
+    def __init__(self, errores=None):
+        self.enviados = []
+        self.errores = list(errores or [])
+        self.bloqueo = threading.Event()
+        self.bloqueo.set()
+        self.ocupado = threading.Event()
+
+    def send_message(self, recipient_id, message):
+        self.ocupado.set()
+        self.bloqueo.wait(2)
+        if self.errores:
+            raise self.errores.pop(0)
+        self.enviados.append((recipient_id, message))
+        return {"messages": [{"id": f"wamid.{len(self.enviados)}"}]}
+
+    def send_buttons(self, recipient_id, body_text, buttons):
+        return self.send_message(recipient_id, body_text)
+
+
+def test_token_bucket_allows_burst_then_refills_at_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+    for _ in range(3):
+        assert bucket.espera() == 0
+        bucket.tomar()
+    assert bucket.espera() == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert bucket.espera() == 0
+    bucket.tomar()
+
+    clock.now += 10
+    bucket.espera()
+    assert bucket._tokens == 3
+
+
+def test_token_bucket_pause_blocks_even_with_tokens():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, burst=10, clock=clock)
+    bucket.pausar(5)
+
+    assert bucket.espera() == pytest.approx(5)
+    clock.now += 5
+    assert bucket.espera() == 0
+
+
+def test_replies_go_ahead_of_queued_notifications():
+    client = FakeWhatsAppClient()
+    client.bloqueo.clear()
+    outbox = WhatsAppOutbox({"123": client}, senders=1)
+    try:
+        # El primero ocupa al unico hilo; el resto queda en cola.
+        primero = outbox.submit("send_message", "a", "alerta 0", prioridad=PRIORIDAD_NOTIFICACION)
+        assert client.ocupado.wait(2)
+        futuros = [
+            outbox.submit("send_message", "a", f"alerta {i}", prioridad=PRIORIDAD_NOTIFICACION)
+            for i in range(1, 4)
+        ]
+        respuesta = outbox.submit("send_message", "b", "hola", prioridad=PRIORIDAD_RESPUESTA)
+        assert outbox.metrics()["en_cola"] == {"123": 4}
+
+        client.bloqueo.set()
+        respuesta.result(2)
+        for futuro in [primero, *futuros]:
+            futuro.result(2)
+    finally:
+        outbox.close()
+
+    assert [m for _, m in client.enviados] == ["alerta 0", "hola", "alerta 1", "alerta 2", "alerta 3"]
+    metricas = outbox.metrics()
+    assert metricas["en_cola"] == {"123": 0}
+    assert metricas["por_prioridad"]["0"]["enviados"] == 1
+    assert metricas["por_prioridad"]["10"]["enviados"] == 4
+
+
+def test_rate_limit_is_per_phone_number():
+    clock = FakeClock()
+    lento, rapido = FakeWhatsAppClient(), FakeWhatsAppClient()
+    outbox = WhatsAppOutbox(
+        {"lento": lento, "rapido": rapido}, rate_per_second=1, burst=1, senders=1, clock=clock
+    )
+    try:
+        outbox.submit("send_message", "a", "1", phone_number_id="lento").result(2)
+        bloqueado = outbox.submit("send_message", "a", "2", phone_number_id="lento")
+        # Otro numero tiene su propio bucket y no espera al primero.
+        outbox.submit("send_message", "b", "x", phone_number_id="rapido").result(2)
+        assert not bloqueado.done()
+
+        clock.now += 1
+        with outbox._cond:
+            outbox._cond.notify_all()
+        bloqueado.result(2)
+    finally:
+        outbox.close()
+
+    assert lento.enviados == [("a", "1"), ("a", "2")]
+    assert rapido.enviados == [("b", "x")]
+
+
+def _esperar(condicion, timeout=2.0):
+    limite = time.monotonic() + timeout
+    while not condicion():
+        assert time.monotonic() < limite
+        time.sleep(0.01)
+
+
+def test_429_pauses_the_number_and_requeues_the_send():
+    clock = FakeClock()
+    client = FakeWhatsAppClient(errores=[WhatsAppApiError("limite", status_code=429)])
+    outbox = WhatsAppOutbox({"123": client}, rate_per_second=100, burst=100, senders=1, clock=clock)
+    try:
+        future = outbox.submit("send_message", "a", "1", prioridad=PRIORIDAD_NOTIFICACION)
+        _esperar(lambda: not client.errores and outbox.metrics()["en_cola"]["123"] == 1)
+        assert not future.done()
+        assert outbox._numeros["123"].bucket.espera() > 0
+
+        clock.now += 5
+        with outbox._cond:
+            outbox._cond.notify_all()
+        assert future.result(2) == {"messages": [{"id": "wamid.1"}]}
+        assert outbox.metrics()["por_prioridad"][str(PRIORIDAD_NOTIFICACION)]["fallidos"] == 0
+    finally:
+        outbox.close()
+
+    assert client.enviados == [("a", "1")]
+
+
+def test_send_fails_after_too_many_429():
+    clock = FakeClock()
+    client = FakeWhatsAppClient(errores=[WhatsAppApiError("limite", status_code=429)] * 2)
+    outbox = WhatsAppOutbox(
+        {"123": client}, senders=1, max_reintentos_429=1, clock=clock
+    )
+    try:
+        future = outbox.submit("send_message", "a", "1")
+        _esperar(lambda: len(client.errores) == 1)
+        clock.now += 5
+        with outbox._cond:
+            outbox._cond.notify_all()
+        with pytest.raises(WhatsAppApiError):
+            future.result(2)
+        assert outbox.metrics()["por_prioridad"]["0"]["fallidos"] == 1
+    finally:
+        clock.now += 60
+        outbox.close()
+
+
+def test_scheduled_client_timeout_is_an_api_error():
+    client = FakeWhatsAppClient()
+    client.bloqueo.clear()
+    outbox = WhatsAppOutbox({"123": client}, senders=1)
+    try:
+        outbox.submit("send_message", "a", "ocupa el hilo")
+        assert client.ocupado.wait(2)
+        with pytest.raises(WhatsAppApiError):
+            ScheduledWhatsAppClient(outbox, timeout=0.05).send_message("a", "tarde")
+        client.bloqueo.set()
+    finally:
+        outbox.close()
+
+    # El envio que vencio en la cola se cancela y no sale despues.
+    assert client.enviados == [("a", "ocupa el hilo")]
+
+
+def test_scheduled_client_waits_for_replies_but_not_for_notifications():
+    client = FakeWhatsAppClient()
+    outbox = WhatsAppOutbox({"123": client}, senders=1)
+    try:
+        respuesta = ScheduledWhatsAppClient(outbox).send_message("a", "hola")
+        assert respuesta == {"messages": [{"id": "wamid.1"}]}
+
+        client.bloqueo.clear()
+        notificaciones = ScheduledWhatsAppClient(
+            outbox, prioridad=PRIORIDAD_NOTIFICACION, esperar=False
+        )
+        assert notificaciones.send_message("a", "resumen") == {"status": "queued"}
+        client.bloqueo.set()
+    finally:
+        outbox.close()
+
+    assert client.enviados == [("a", "hola"), ("a", "resumen")]
+
+
+def test_closed_outbox_rejects_new_sends():
+    outbox = WhatsAppOutbox({"123": FakeWhatsAppClient()}, senders=1)
+    outbox.close()
+
+    with pytest.raises(RuntimeError):
+        outbox.submit("send_message", "a", "tarde")